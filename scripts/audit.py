@@ -1,42 +1,602 @@
 #!/usr/bin/env python3
 """
 ARCO Project Audit & Cleanup
-Systematic analysis and organization without overengineering
+One walk (or the git index) builds an in-memory snapshot and one content pass
+reads each source file once; the AUDIT_PHASES then run over that state. The
+cache, sharded, watch and history modes load their modules only when used
 """
 
 import os
+import sys
 import json
+import contextlib
+import functools
+import hashlib
+import io
 from pathlib import Path
-from collections import defaultdict
+from array import array
+from collections import Counter, defaultdict
+from collections.abc import Mapping
+from enum import IntEnum
+from typing import NamedTuple, Optional
+
+from audit_cache import MISS, open_cache
+from audit_metrics import PhaseRecorder, count_dir_visit, count_stat
+from audit_report import Reporter, make_reporter
+from cleanup_rules import CleanupRules
+from content_pipeline import ScanItem, scan_files
+from content_rules import DEFAULT_RULES_PATH, RuleHit, RuleSet
+from image_probe import (BYTES_PER_PIXEL_LIMIT, IMAGE_EXTENSIONS, MAX_DIMENSION, MODERN_EXTENSIONS,
+                         MODERN_VARIANT_MIN_BYTES, ImageInfo, ProbeResult, extract_asset_refs,
+                         probe_images)
+from import_graph import ImportRef, ModuleGraph, ModuleResolver, extract_imports
+from near_duplicates import cluster_similar, minhash_signature
+from repo_walker import IgnoreMatcher, iter_dir, scan, walk
+from tailwind_index import ClassBundle, ClassIndex, extract_class_bundles, extract_palettes
+
+
+class FSEntry(NamedTuple):
+    """One file or directory captured by an FSSnapshot"""
+    path: str
+    name: str
+    is_dir: bool
+    size: int
+    mtime_ns: int
+
+
+class DuplicateGroup(NamedTuple):
+    """Byte-identical files sharing one content digest"""
+    digest: str
+    size: int
+    paths: list
+
+    @property
+    def wasted_bytes(self):
+        return self.size * (len(self.paths) - 1)
+
+
+PARTIAL_HASH_BYTES = 4096
+HASH_CHUNK_BYTES = 1 << 16
+IMPORTS_CACHE_KIND = "imports:v7"
+RULES_CACHE_KIND = "rules:v1"
+IMAGE_CACHE_KIND = "image:v1"
+
+
+def partial_digest(path, limit=PARTIAL_HASH_BYTES):
+    """Cheap pre-filter: hash of the first few KB only"""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(limit), digest_size=16).hexdigest()
+
+
+def git_blob_sha(data):
+    """git blob SHA-1 of an in-memory (or mmap'ed) buffer"""
+    h = hashlib.sha1(b"blob %d\0" % len(data))
+    h.update(data)
+    return h.hexdigest()
+
+
+SOURCE_EXTENSIONS = ('.tsx', '.ts', '.js', '.jsx')
+SHARD_MODES = ('root', 'top-level')
+
+
+class SourceRecord(NamedTuple):
+    """What the content pass keeps per source file"""
+    imports: list
+    rule_hits: list
+    assets: list
+    classes: list
+    minhash: Optional[list]  # .tsx only; None when too small to compare
+
+
+def scan_source(item, buffer, rules):
+    """Worker-side scan: (SourceRecord, git blob digest) from a single decode
+
+    Decodes straight from a memoryview, so an mmap'ed file is not first
+    copied into a bytes object.
+    """
+    with memoryview(buffer) as view:
+        source = str(view, 'utf-8', 'replace')
+    minhash = minhash_signature(source) if item.path.endswith('.tsx') else None
+    record = SourceRecord(extract_imports(source), rules.scan(source), extract_asset_refs(source),
+                          extract_class_bundles(source), minhash)
+    return record, git_blob_sha(buffer)
+
+
+class RouteWeight(NamedTuple):
+    """Transitive local import weight of one src/app entry file"""
+    path: str
+    route: str
+    kind: str
+    modules: int
+    bytes: int
+    with_layouts: int
+    largest: list
+
+
+ROUTE_ENTRY_NAMES = ('page', 'layout')
+ROUTE_WEIGHT_BUDGET = 256 * 1024
+ROUTE_TOP_CONTRIBUTORS = 5
+
+
+class TailwindReport(NamedTuple):
+    """Class index summary for the files under src/"""
+    unique_classes: int
+    files: int
+    clusters: list
+    unused_shades: dict
+
+
+TOKENS_DIR = os.path.join('src', 'design-system', 'tokens')
+CLASS_HEAVY_FILES = 5
+
+
+class ImageAsset(NamedTuple):
+    """Header facts and issues for one image file"""
+    path: str
+    url: str
+    format: str
+    width: int
+    height: int
+    size: int
+    references: list
+    issues: list
+
+
+def blob_digest(path, size):
+    """Streaming git blob SHA-1, so digests line up with `git hash-object`"""
+    h = hashlib.sha1(b"blob %d\0" % size)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def group_identical(candidates, cache=None, known_digests=None):
+    """Staged duplicate detection over (path, size, mtime_ns) triples
+
+    size buckets -> partial hash of the first PARTIAL_HASH_BYTES -> full
+    streaming hash, each stage only for files that still collide. Files whose
+    size is unique are never opened, and digests already held by the audit
+    cache for an unchanged file, or passed in known_digests (clean git index
+    entries), are reused without reading it.
+    """
+    known_digests = known_digests or {}
+    by_size = defaultdict(list)
+    for path, size, mtime_ns in candidates:
+        if size > 0:
+            by_size[size].append((path, mtime_ns))
+
+    def full_digest(path, size, mtime_ns):
+        digest = known_digests.get(path)
+        if digest is None and cache:
+            digest = cache.digest(path, size, mtime_ns)
+        if digest is None:
+            digest = blob_digest(path, size)
+            if cache:
+                cache.store_digest(path, size, mtime_ns, digest)
+        return digest
+
+    groups = []
+    for size, files in by_size.items():
+        if len(files) < 2:
+            continue
+        by_full = defaultdict(list)
+        known = [(p, m) for p, m in files
+                 if p in known_digests or (cache and cache.digest(p, size, m))]
+        if known:
+            # Something in the bucket is already hashed; the prefix stage
+            # cannot rule out a match against it, so go straight to digests
+            pending = [files]
+        else:
+            by_partial = defaultdict(list)
+            for path, mtime_ns in files:
+                try:
+                    by_partial[partial_digest(path)].append((path, mtime_ns))
+                except OSError:
+                    continue
+            pending = [same for same in by_partial.values() if len(same) > 1]
+        for same_prefix in pending:
+            for path, mtime_ns in same_prefix:
+                try:
+                    by_full[full_digest(path, size, mtime_ns)].append(path)
+                except OSError:
+                    continue
+        for digest, same in by_full.items():
+            if len(same) > 1:
+                groups.append(DuplicateGroup(digest, size, sorted(same)))
+
+    groups.sort(key=lambda g: (-g.wasted_bytes, g.paths[0]))
+    return groups
+
+
+class FolderPurpose(IntEnum):
+    """identify_folder_purpose results, stored as one byte per directory"""
+    UNKNOWN = 0
+    COMPONENTS = 1
+    DESIGN_SYSTEM = 2
+    PAGES = 3
+    SCRIPTS = 4
+    DOCUMENTATION = 5
+    REACT_COMPONENTS = 6
+    TYPESCRIPT = 7
+    MARKDOWN = 8
+
+
+class DirectoryTable(Mapping):
+    """Compact directory structure: parallel arrays keyed by integer id
+
+    Each directory stores an interned name, its parent id (-1 for top-level
+    folders), dir/file counts and a FolderPurpose byte, instead of a dict with
+    full path strings and copied name lists. It still reads like the old
+    {rel_path: {'dirs', 'files', 'file_count', 'purpose'}} mapping, but paths
+    and listings are rebuilt lazily on access.
+    """
+
+    def __init__(self, root, lister):
+        self.root = str(root)
+        self._lister = lister
+        self.names = []
+        self.parents = array('i')
+        self.dir_counts = array('I')
+        self.file_counts = array('I')
+        self.purposes = bytearray()
+        self._ids = {}
+
+    def add(self, rel_path, dir_count, file_count, purpose):
+        parent_path, name = os.path.split(rel_path)
+        parent = self.find(parent_path) if parent_path else -1
+        if parent is None:
+            parent = -1
+        node = len(self.names)
+        self.names.append(sys.intern(name))
+        self.parents.append(parent)
+        self.dir_counts.append(dir_count)
+        self.file_counts.append(file_count)
+        self.purposes.append(int(purpose))
+        self._ids[(parent, self.names[node])] = node
+        return node
+
+    def find(self, rel_path):
+        """Directory id for a root-relative path, or None"""
+        node = -1
+        for part in rel_path.replace(os.sep, '/').split('/'):
+            node = self._ids.get((node, part))
+            if node is None:
+                return None
+        return node
+
+    def path(self, node):
+        parts = []
+        while node != -1:
+            parts.append(self.names[node])
+            node = self.parents[node]
+        return os.path.join(*reversed(parts))
+
+    def purpose(self, node):
+        return FolderPurpose(self.purposes[node]).name
+
+    def purpose_counts(self):
+        counts = Counter(self.purposes)
+        return {FolderPurpose(code).name: n for code, n in counts.items()}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return (self.path(node) for node in range(len(self.names)))
+
+    def __getitem__(self, rel_path):
+        node = self.find(rel_path)
+        if node is None:
+            raise KeyError(rel_path)
+        dirs, files = self._lister(os.path.join(self.root, rel_path))
+        return {
+            'dirs': dirs,
+            'files': files,
+            'file_count': self.file_counts[node],
+            'purpose': self.purpose(node),
+        }
+
+
+class FSSnapshot:
+    """Single os.scandir traversal shared by every audit phase
+
+    Directories are recorded in the same top-down order os.walk would yield
+    them, so phases can swap os.walk for snapshot.walk without changing output.
+    Ignored trees (see repo_walker) are pruned and never stat'ed.
+    """
+
+    def __init__(self, root, matcher=None):
+        self.root = str(root)
+        self.matcher = matcher or IgnoreMatcher.from_repo(self.root)
+        self.entries = {}
+        self.listing = {}
+        # Known git blob SHAs by path (filled by GitIndexSnapshot)
+        self.digests = {}
+        # Directories that had ignored entries; never empty, even if nothing is listed
+        self.has_ignored = set()
+        self._order = None
+        self._build()
+
+    def _build(self):
+        self._add_tree(self.root)
+
+    def _add_tree(self, top):
+        for current, dir_entries, file_entries in scan(top, self.matcher, self.has_ignored):
+            dirs, files = [], []
+            for is_dir, group, names in ((True, dir_entries, dirs), (False, file_entries, files)):
+                for entry in group:
+                    count_stat()
+                    try:
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    self.entries[entry.path] = FSEntry(
+                        entry.path, entry.name, is_dir, st.st_size, st.st_mtime_ns
+                    )
+                    names.append(entry.name)
+            self.listing[current] = (dirs, files)
+        self._order = None
+
+    def _drop(self, path):
+        """Forget path and, for directories, everything recorded below it"""
+        self.entries.pop(path, None)
+        self.digests.pop(path, None)
+        self.has_ignored.discard(path)
+        listed = self.listing.pop(path, None)
+        if listed:
+            for name in listed[0] + listed[1]:
+                self._drop(os.path.join(path, name))
+
+    def refresh(self, paths):
+        """Re-stat just the given paths (created, modified or deleted)
+
+        Parents outside the snapshot (ignored or not yet seen) are skipped;
+        new directories are scanned as a subtree. Returns the set of paths
+        whose entry changed.
+        """
+        changed = set()
+        for path in sorted(set(paths), key=len):
+            parent, name = os.path.split(path)
+            if parent not in self.listing or path == self.root:
+                continue
+            before = self.entries.get(path)
+            count_stat(2)
+            try:
+                st = os.lstat(path)
+                is_dir = os.path.isdir(path)
+            except OSError:
+                st, is_dir = None, False
+            if st is not None and before is not None and before.is_dir and is_dir:
+                # Directory metadata only; its children report their own changes
+                self.entries[path] = before._replace(mtime_ns=st.st_mtime_ns)
+                continue
+
+            self._drop(path)
+            dirs, files = self.listing[parent]
+            for names in (dirs, files):
+                if name in names:
+                    names.remove(name)
+            if st is not None:
+                rel = os.path.relpath(path, self.matcher.root).replace(os.sep, '/')
+                if not self.matcher.match(rel, is_dir):
+                    self.entries[path] = FSEntry(path, name, is_dir, st.st_size, st.st_mtime_ns)
+                    (dirs if is_dir else files).append(name)
+                    if is_dir and not os.path.islink(path):
+                        self._add_tree(path)
+                else:
+                    self.has_ignored.add(parent)
+            if self.entries.get(path) != before:
+                changed.add(path)
+        self._order = None
+        return changed
+
+    @property
+    def order(self):
+        """Directories in os.walk top-down order, recomputed after refresh()"""
+        if self._order is None:
+            order, stack = [], [self.root]
+            while stack:
+                current = stack.pop()
+                order.append(current)
+                dirs = self.listing[current][0]
+                for name in reversed(dirs):
+                    child = os.path.join(current, name)
+                    if child in self.listing:
+                        stack.append(child)
+            self._order = order
+        return self._order
+
+    def walk(self):
+        """os.walk-compatible (root, dirs, files) iteration over the snapshot"""
+        for path in self.order:
+            dirs, files = self.listing[path]
+            yield path, list(dirs), list(files)
+
+    def listdir(self, path):
+        dirs, files = self.listing.get(path, ([], []))
+        return dirs + files
+
+    def iter_entries(self):
+        return iter(self.entries.values())
+
+
+class GitIndexSnapshot(FSSnapshot):
+    """FSSnapshot built from .git/index instead of walking the disk
+
+    Tracked paths come from the index and directories are derived from them,
+    so nothing is listed. Each tracked file still gets one lstat (the same
+    check `git status` does); when size and mtime match the index and the
+    entry is not racy, its blob SHA is kept in `digests` and duplicate
+    detection never reads the file. Dirty entries keep the on-disk stat and
+    are hashed as usual. Untracked files and empty directories are not
+    visible to this backend; raises GitIndexError when there is no usable
+    index.
+    """
+
+    def _build(self):
+        from git_index import GitIndexError, find_git_dir, read_index
+
+        git_dir = find_git_dir(self.root)
+        if git_dir is None:
+            raise GitIndexError(f"{self.root} is not a git worktree root")
+        index = read_index(git_dir)
+        self.listing[self.root] = ([], [])
+        visible_dirs = {}
+        for item in index.entries:
+            if item.stage > 1 or item.mode & 0o170000 == 0o160000:
+                # Conflicted paths repeat once per stage; gitlinks are submodules
+                continue
+            parent_rel, name = item.path.rpartition('/')[::2]
+            if parent_rel and not self._add_dirs(parent_rel, visible_dirs):
+                continue
+            path = os.path.join(self.root, *item.path.split('/'))
+            if self.matcher.match(item.path, False):
+                self.has_ignored.add(os.path.dirname(path))
+                continue
+            count_stat()
+            try:
+                st = os.lstat(path)
+            except OSError:
+                continue
+            self.entries[path] = FSEntry(path, name, False, st.st_size, st.st_mtime_ns)
+            self.listing[os.path.dirname(path)][1].append(name)
+            clean = (item.is_regular and not item.stage and not item.intent_to_add
+                     and st.st_size & 0xFFFFFFFF == item.size
+                     and st.st_mtime_ns == item.mtime_ns
+                     and item.mtime_ns < index.mtime_ns)
+            if clean:
+                self.digests[path] = item.sha
+
+    def _add_dirs(self, rel_dir, visible_dirs):
+        """Register rel_dir and its ancestors; False when any is ignored"""
+        known = visible_dirs.get(rel_dir)
+        if known is not None:
+            return known
+        parent_rel, name = rel_dir.rpartition('/')[::2]
+        parent_visible = not parent_rel or self._add_dirs(parent_rel, visible_dirs)
+        visible = parent_visible and not self.matcher.match(rel_dir, True)
+        visible_dirs[rel_dir] = visible
+        path = os.path.join(self.root, *rel_dir.split('/'))
+        if parent_visible and not visible:
+            self.has_ignored.add(os.path.dirname(path))
+        if visible:
+            self.entries[path] = FSEntry(path, name, True, 0, 0)
+            self.listing[path] = ([], [])
+            self.listing[os.path.dirname(path)][0].append(name)
+        return visible
+
+
+AUDIT_PHASES = (
+    # 1. Structure analysis
+    'scan_directory_structure',
+    # 2. Find problems
+    'find_duplicate_files',
+    'find_near_duplicates',
+    'find_empty_folders',
+    'analyze_design_system',
+    'find_broken_imports',
+    'analyze_route_weight',
+    'find_rule_violations',
+    'audit_image_assets',
+    'analyze_tailwind_classes',
+    # 3. Generate action plan
+    'generate_cleanup_plan',
+    'generate_restructure_recommendation',
+)
+
 
 class ARCOAuditor:
-    def __init__(self):
-        self.root = Path.cwd()
+    def __init__(self, root=None, single_pass=True, cache=None, workers=None,
+                 rules=None, reporter=None, git_index=False, snapshot=None,
+                 cleanup_rules=None):
+        self.root = Path(root) if root else Path.cwd()
+        self.report = reporter or Reporter(self.root)
+        self.single_pass = single_pass
+        self.git_index = git_index
+        self.cache = cache
+        self.workers = workers
+        self.rules = rules if rules is not None else RuleSet.load(DEFAULT_RULES_PATH)
+        self.cleanup_rules = cleanup_rules or CleanupRules.load(DEFAULT_RULES_PATH)
+        self._sources = None
+        self._stale_sources = set()
+        self.matcher = snapshot.matcher if snapshot else IgnoreMatcher.from_repo(self.root)
+        self._snapshot = snapshot
         self.duplicates = defaultdict(list)
+        self.near_duplicates = []
         self.redundant_folders = []
         self.broken_files = []
         self.empty_folders = []
-        
+        self.read_errors = []
+        self.skipped_files = defaultdict(list)
+        self.module_graph = None
+        self.unresolved_imports = []
+        self.rule_violations = []
+        self.image_assets = []
+        self.route_weights = []
+        self.class_index = ClassIndex()
+        self._indexed = {}
+        self._palettes = {}
+        self.tailwind = None
+        # Image probes done ahead of time (sharded runs); consumed on use
+        self._probed = {}
+
+    @property
+    def snapshot(self):
+        """Lazily built FSSnapshot; only used in single-pass mode"""
+        if self._snapshot is None and self.git_index:
+            from git_index import GitIndexError
+            try:
+                self._snapshot = GitIndexSnapshot(self.root, self.matcher)
+            except GitIndexError as exc:
+                print(f"⚠️  git index unavailable ({exc}); walking the disk")
+        if self._snapshot is None:
+            self._snapshot = FSSnapshot(self.root, self.matcher)
+        return self._snapshot
+
+    def _walk(self, ignored=None):
+        """Top-down walk; ignored, when given, collects directories with ignored entries"""
+        if self.single_pass:
+            walker = self.snapshot.walk()
+            if ignored is not None:
+                ignored.update(self.snapshot.has_ignored)
+        else:
+            walker = walk(self.root, self.matcher, ignored)
+        for item in walker:
+            count_dir_visit()
+            yield item
+
+    def _listdir(self, path):
+        if self.single_pass:
+            return self.snapshot.listdir(path)
+        return [entry.name for entry in iter_dir(path, self.matcher)]
+
     def scan_directory_structure(self):
-        """Map complete project structure"""
+        """Map complete project structure into a compact DirectoryTable"""
         print("🔍 SCANNING PROJECT STRUCTURE")
         print("=" * 50)
         
-        structure = {}
-        for root, dirs, files in os.walk(self.root):
+        structure = DirectoryTable(self.root, self._split_listing)
+        for root, dirs, files in self._walk():
             rel_path = os.path.relpath(root, self.root)
             if rel_path.startswith('.'):
                 continue
                 
-            structure[rel_path] = {
-                'dirs': dirs,
-                'files': files,
-                'file_count': len(files),
-                'purpose': self.identify_folder_purpose(rel_path, files)
-            }
+            purpose = self.identify_folder_purpose(rel_path, files)
+            structure.add(rel_path, len(dirs), len(files), FolderPurpose[purpose])
             
         return structure
     
+    def _split_listing(self, path):
+        """(dirs, files) of a directory, from the snapshot when there is one"""
+        if self.single_pass:
+            dirs, files = self.snapshot.listing.get(path, ([], []))
+            return list(dirs), list(files)
+        dirs, files = [], []
+        for entry in iter_dir(path, self.matcher):
+            (dirs if entry.is_dir() else files).append(entry.name)
+        return dirs, files
+    
     def identify_folder_purpose(self, path, files):
         """Identify what each folder is supposed to do"""
         if 'components' in path.lower():
@@ -58,48 +618,154 @@ class ARCOAuditor:
         else:
             return 'UNKNOWN'
     
+    def _stat_files(self, extensions):
+        """(path, size, mtime_ns) for every file with one of the extensions"""
+        if self.single_pass:
+            for entry in self.snapshot.iter_entries():
+                if not entry.is_dir and entry.name.endswith(extensions):
+                    yield entry.path, entry.size, entry.mtime_ns
+            return
+        for root, dirs, files in self._walk():
+            for file in files:
+                if file.endswith(extensions):
+                    full_path = os.path.join(root, file)
+                    count_stat()
+                    try:
+                        st = os.stat(full_path)
+                    except OSError:
+                        continue
+                    yield full_path, st.st_size, st.st_mtime_ns
+
+    def apply_changes(self, paths):
+        """Fold changed paths into the in-memory state (single-pass mode)
+
+        Only the changed entries are re-stat'ed and only changed source files
+        are re-read on the next phase run; everything else stays in memory.
+        """
+        changed = self.snapshot.refresh(paths)
+        entries = self.snapshot.entries
+        stale = set()
+        for path in changed:
+            entry = entries.get(path)
+            if entry is not None and entry.is_dir:
+                prefix = path + os.sep
+                stale.update(p for p, e in entries.items() if p.startswith(prefix) and not e.is_dir)
+            elif entry is not None:
+                stale.add(path)
+            else:
+                stale.add(path)
+                if self._sources:
+                    prefix = path + os.sep
+                    stale.update(p for p in self._sources if p.startswith(prefix))
+        self.invalidate_sources(stale)
+        return changed
+
+    def close(self):
+        """Drop cache rows for deleted files and persist the cache"""
+        if self.cache is None:
+            return
+        if self._snapshot is not None:
+            self.cache.prune(self._snapshot.entries)
+        self.cache.close()
+        self.cache = None
+
     def find_duplicate_files(self):
-        """Find duplicate and similar files"""
+        """Find byte-identical files (grouped by content hash, not by name)"""
         print("\n🔍 FINDING DUPLICATES & REDUNDANCIES")
         print("=" * 50)
         
-        file_map = defaultdict(list)
+        known = self.snapshot.digests if self.single_pass else None
+        groups = group_identical(self._stat_files(SOURCE_EXTENSIONS), self.cache, known)
+        duplicates = {group.digest: group for group in groups}
         
-        for root, dirs, files in os.walk(self.root):
-            if any(skip in root for skip in ['.next', 'node_modules', '.git']):
-                continue
-                
-            for file in files:
-                if file.endswith(('.tsx', '.ts', '.js', '.jsx')):
-                    full_path = os.path.join(root, file)
-                    file_map[file].append(full_path)
-        
-        # Find actual duplicates
-        duplicates = {name: paths for name, paths in file_map.items() if len(paths) > 1}
-        
-        for name, paths in duplicates.items():
-            print(f"🔄 DUPLICATE: {name}")
-            for path in paths:
+        for group in groups:
+            print(f"🔄 DUPLICATE: {len(group.paths)} copies x {group.size} bytes "
+                  f"({group.wasted_bytes} wasted) [{group.digest[:12]}]")
+            for path in group.paths:
                 print(f"   └─ {path}")
+            self.report.finding(
+                'duplicate-file', group.paths[0],
+                f"{len(group.paths)} byte-identical copies ({group.wasted_bytes} bytes wasted)",
+                related=group.paths[1:],
+                data={'digest': group.digest, 'size': group.size,
+                      'copies': len(group.paths), 'wasted_bytes': group.wasted_bytes},
+            )
         
+        self.duplicates = duplicates
         return duplicates
-    
+
+    def find_near_duplicates(self):
+        """Cluster .tsx files whose structure is near-identical
+
+        Each file's token stream (identifiers, literals and whitespace
+        stripped) is summarized as a MinHash signature in the content pass,
+        so it is cached with the file's other extracts. That work holds the
+        GIL on the reader threads, so a signature costs one hash call per
+        shingle (see minhash_signature); LSH banding then compares only
+        files that collide in some band. Byte-identical copies found by
+        find_duplicate_files take part through their first path only.
+        """
+        print("\n🧬 FINDING NEAR-DUPLICATE COMPONENTS")
+        print("=" * 50)
+
+        copies = {path for group in self.duplicates.values() for path in group.paths[1:]}
+        signatures = {path: record.minhash for path, record in self._scan_sources().items()
+                      if record.minhash and path not in copies}
+        clusters = cluster_similar(signatures)
+
+        for cluster in clusters:
+            print(f"🧬 SIMILAR: {os.path.relpath(cluster.center, self.root)}")
+            for path, score in cluster.members:
+                print(f"   └─ {score:.0%} {os.path.relpath(path, self.root)}")
+            self.report.finding(
+                'near-duplicate', cluster.center,
+                f"{len(cluster.members)} structurally near-identical file(s); "
+                f"consider consolidating into one component",
+                related=[path for path, _ in cluster.members],
+                data={'similarity': {os.path.relpath(path, self.root): round(score, 2)
+                                     for path, score in cluster.members}},
+            )
+        print(f"🧬 {len(clusters)} clusters over {len(signatures)} compared .tsx files")
+
+        self.near_duplicates = clusters
+        return clusters
+
     def find_empty_folders(self):
-        """Find empty or useless folders"""
+        """Find empty folders and folders holding only empty subtrees
+
+        The walk is replayed in reverse (children before parents), so a folder
+        is hollow when it has no files and every child is hollow; no extra
+        listing is needed. A folder that had ignored entries (node_modules,
+        build output...) is never hollow, since removing it would delete
+        them. Only the topmost hollow folder of a subtree is reported, since
+        removing it removes everything below.
+        """
         print("\n🗂️ FINDING EMPTY/USELESS FOLDERS")
         print("=" * 50)
         
+        has_ignored = set()
+        visited = list(self._walk(has_ignored))
+        hollow = {}
+        nested = {}
+        for root, dirs, files in reversed(visited):
+            children = [os.path.join(root, d) for d in dirs]
+            hollow[root] = (not files and root not in has_ignored
+                            and all(hollow.get(c, False) for c in children))
+            if hollow[root]:
+                nested[root] = sum(1 + nested[c] for c in children)
+        
         empty = []
-        for root, dirs, files in os.walk(self.root):
-            if any(skip in root for skip in ['.next', 'node_modules', '.git']):
+        for root, dirs, files in visited:
+            if not hollow[root] or hollow.get(os.path.dirname(root), False):
                 continue
-                
-            if not dirs and not files:
-                empty.append(root)
+            empty.append(root)
+            if not dirs:
                 print(f"📁 EMPTY: {root}")
-            elif not files and all(not os.listdir(os.path.join(root, d)) for d in dirs):
-                empty.append(root)
-                print(f"📁 USELESS: {root}")
+                self.report.finding('empty-folder', root, "Empty folder", data={'state': 'empty'})
+            else:
+                print(f"📁 USELESS: {root} ({nested[root]} empty folders inside)")
+                self.report.finding('empty-folder', root, "Folder holds only empty folders",
+                                    data={'state': 'useless', 'nested': nested[root]})
         
         return empty
     
@@ -109,13 +775,19 @@ class ARCOAuditor:
         print("=" * 50)
         
         design_paths = []
-        for root, dirs, files in os.walk(self.root):
+        for root, dirs, files in self._walk():
             if 'design-system' in root.lower() or 'components' in root.lower():
-                design_paths.append({
+                item = {
                     'path': root,
                     'files': [f for f in files if f.endswith(('.tsx', '.ts'))],
                     'type': self.classify_component_folder(root, files)
-                })
+                }
+                design_paths.append(item)
+                self.report.finding(
+                    'design-system-folder', root,
+                    f"{item['type']} folder ({len(item['files'])} files)",
+                    data={'type': item['type'], 'files': len(item['files'])},
+                )
         
         # Group by type
         by_type = defaultdict(list)
@@ -148,38 +820,381 @@ class ARCOAuditor:
         else:
             return 'uncategorized'
     
+    def _all_files(self):
+        """Set of every non-ignored file path, for stat-free import resolution"""
+        if self.single_pass:
+            return {e.path for e in self.snapshot.iter_entries() if not e.is_dir}
+        return {os.path.join(root, f) for root, dirs, files in self._walk() for f in files}
+
+    def _scan_sources(self):
+        """Read every source file at most once and cache what later phases need
+
+        Returns {path: SourceRecord}. Import extraction and content-rule hits
+        are computed in the same worker pass and cached independently, so
+        editing the rule config only invalidates the rule hits. After
+        invalidate_sources() only the invalidated paths are read again.
+        """
+        if self._sources is None:
+            self._sources = {}
+            self.read_errors = []
+            self.skipped_files = defaultdict(list)
+            self._scan_items(self._stat_files(SOURCE_EXTENSIONS))
+        elif self._stale_sources:
+            stale = self._stale_sources
+            self._stale_sources = set()
+            for path in stale:
+                self._sources.pop(path, None)
+            self.read_errors = [e for e in self.read_errors if e['path'] not in stale]
+            for reason in list(self.skipped_files):
+                self.skipped_files[reason] = [p for p in self.skipped_files[reason] if p not in stale]
+            entries = self.snapshot.entries
+            self._scan_items(
+                (path, entries[path].size, entries[path].mtime_ns)
+                for path in sorted(stale)
+                if path in entries and path.endswith(SOURCE_EXTENSIONS)
+            )
+        return self._sources
+
+    def invalidate_sources(self, paths):
+        """Mark files whose content may have changed (watch mode)"""
+        self._stale_sources.update(paths)
+
+    def _scan_items(self, items):
+        sources = self._sources
+        rules_kind = f"{RULES_CACHE_KIND}:{self.rules.fingerprint}"
+
+        pending = []
+        for item in items:
+            cached_imports = cached_hits = MISS
+            if self.cache:
+                cached_imports = self.cache.lookup(*item, IMPORTS_CACHE_KIND)
+                if cached_imports is not MISS and 'skipped' in cached_imports:
+                    self.skipped_files[cached_imports['skipped']].append(item[0])
+                    continue
+                cached_hits = self.cache.lookup(*item, rules_kind)
+            if cached_imports is MISS or cached_hits is MISS:
+                pending.append(ScanItem(*item))
+                continue
+            sources[item[0]] = SourceRecord(
+                [ImportRef(*ref) for ref in cached_imports['imports']],
+                [RuleHit(*hit) for hit in cached_hits],
+                cached_imports['assets'],
+                [ClassBundle(*bundle) for bundle in cached_imports['classes']],
+                cached_imports['minhash'],
+            )
+
+        scan = functools.partial(scan_source, rules=self.rules)
+        for result in scan_files(pending, scan, self.workers):
+            if result.error:
+                self.read_errors.append({'path': result.path, 'error': result.error})
+                print(f"❌ READ ERROR: {result.path} ({result.error})")
+                self.report.finding('read-error', result.path, result.error)
+                continue
+            if result.skipped:
+                self.skipped_files[result.skipped].append(result.path)
+                if self.cache:
+                    self.cache.store(result.path, result.size, result.mtime_ns,
+                                     IMPORTS_CACHE_KIND, {'skipped': result.skipped})
+                continue
+            record, digest = result.value
+            sources[result.path] = record
+            if self.single_pass:
+                self.snapshot.digests[result.path] = digest
+            if self.cache:
+                signature = (result.path, result.size, result.mtime_ns)
+                self.cache.store(*signature, IMPORTS_CACHE_KIND,
+                                 {'imports': record.imports, 'assets': record.assets,
+                                  'classes': record.classes, 'minhash': record.minhash})
+                self.cache.store(*signature, rules_kind, record.rule_hits)
+                self.cache.store_digest(*signature, digest)
+
     def find_broken_imports(self):
-        """Find files with likely broken imports"""
+        """Find import specifiers that do not resolve to a file or declared package"""
         print("\n🔗 ANALYZING IMPORT ISSUES")
         print("=" * 50)
         
-        broken = []
-        for root, dirs, files in os.walk(self.root):
-            if any(skip in root for skip in ['.next', 'node_modules', '.git']):
+        sources = self._scan_sources()
+        imports = {path: record.imports for path, record in sources.items()}
+
+        # Resolution depends on which other files exist, so it is redone every
+        # run; only extraction is cached
+        resolver = ModuleResolver(self.root, self._all_files())
+        self.module_graph = ModuleGraph.build(imports, resolver)
+        self.unresolved_imports = self.module_graph.unresolved
+
+        for ref in self.unresolved_imports:
+            print(f"⚠️  UNRESOLVED IMPORT: {ref.path}:{ref.line} '{ref.specifier}' ({ref.reason})")
+            self.report.finding(
+                'unresolved-import', ref.path, f"Cannot resolve '{ref.specifier}' ({ref.reason})",
+                line=ref.line, data={'specifier': ref.specifier, 'reason': ref.reason},
+            )
+        for reason, paths in self.skipped_files.items():
+            print(f"⏭️  SKIPPED {len(paths)} {reason} file(s)")
+        
+        return sorted({ref.path for ref in self.unresolved_imports})
+
+    def analyze_route_weight(self):
+        """Transitive local import weight of every src/app page and layout
+
+        Closures come from the module graph (memoized per strongly connected
+        component, so shared subtrees are walked once); each module counts
+        once per route. with_layouts adds the enclosing layouts a page
+        renders inside.
+        """
+        print("\n⚖️ ROUTE IMPORT WEIGHT")
+        print("=" * 50)
+        
+        if self.module_graph is None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.find_broken_imports()
+        graph = self.module_graph
+        app = os.path.join(self.root, 'src', 'app')
+        entries = sorted(
+            path for path in graph.edges
+            if path.startswith(app + os.sep)
+            and os.path.splitext(os.path.basename(path))[0] in ROUTE_ENTRY_NAMES
+        )
+        layouts = {os.path.dirname(p): p for p in entries
+                   if os.path.splitext(os.path.basename(p))[0] == 'layout'}
+        known = self.snapshot.entries if self.single_pass else {}
+        sizes = {}
+        
+        def size_of(p):
+            if p in known:
+                return known[p].size
+            if p not in sizes:
+                count_stat()
+                try:
+                    sizes[p] = os.stat(p).st_size
+                except OSError:
+                    sizes[p] = 0
+            return sizes[p]
+        
+        weights = []
+        for path in entries:
+            closure = graph.closure(path)
+            directory = os.path.dirname(path)
+            kind = os.path.splitext(os.path.basename(path))[0]
+            wrapped = set(closure)
+            parent = directory if kind == 'page' else os.path.dirname(directory)
+            while parent.startswith(app):
+                if parent in layouts:
+                    wrapped |= graph.closure(layouts[parent])
+                if parent == app:
+                    break
+                parent = os.path.dirname(parent)
+            largest = sorted(((size_of(p), p) for p in closure),
+                             reverse=True)[:ROUTE_TOP_CONTRIBUTORS]
+            # Route groups like (marketing) don't appear in the URL
+            segments = [seg for seg in os.path.relpath(directory, app).split(os.sep)
+                        if seg != '.' and not (seg.startswith('(') and seg.endswith(')'))]
+            weights.append(RouteWeight(
+                path, '/' + '/'.join(segments), kind, len(closure),
+                sum(size_of(p) for p in closure), sum(size_of(p) for p in wrapped),
+                [(p, size) for size, p in largest],
+            ))
+        
+        weights.sort(key=lambda w: (-w.with_layouts, w.path))
+        for w in weights:
+            print(f"⚖️  {w.route} ({w.kind}): {w.bytes // 1024} KB in {w.modules} modules "
+                  f"({w.with_layouts // 1024} KB with layouts)")
+            for p, size in w.largest:
+                print(f"   └─ {size // 1024:>4} KB {os.path.relpath(p, self.root)}")
+            self.report.finding(
+                'route-weight', w.path,
+                f"{w.route} {w.kind} reaches {w.modules} local modules, {w.bytes} bytes "
+                f"({w.with_layouts} with layouts)",
+                level='warning' if w.with_layouts > ROUTE_WEIGHT_BUDGET else 'note',
+                related=[p for p, _ in w.largest],
+                data={'route': w.route, 'kind': w.kind, 'modules': w.modules,
+                      'bytes': w.bytes, 'with_layouts': w.with_layouts},
+            )
+        
+        self.route_weights = weights
+        return weights
+    
+    def find_rule_violations(self):
+        """Report every configured content-rule hit (see content-rules.json)"""
+        print("\n📏 CONTENT RULES")
+        print("=" * 50)
+
+        messages = {rule.id: rule.message for rule in self.rules.rules}
+        violations = []
+        for path, record in sorted(self._scan_sources().items()):
+            for hit in record.rule_hits:
+                violations.append((path, hit))
+                print(f"📏 {hit.rule}: {path}:{hit.line}:{hit.column} {messages.get(hit.rule, '')}".rstrip())
+                self.report.finding(
+                    'content-rule', path, messages.get(hit.rule) or hit.text,
+                    line=hit.line, column=hit.column, rule=hit.rule, data={'match': hit.text},
+                )
+
+        self.rule_violations = violations
+        return violations
+    
+    def audit_image_assets(self):
+        """Image weight, dimensions, modern variants and references, from headers only
+
+        Dimensions come from the file header (no pixel decoding), probed in
+        parallel and cached per file. References are root-relative URLs such
+        as "/images/hero.jpg" found in source files by the content pass.
+        """
+        print("\n🖼️ IMAGE ASSETS")
+        print("=" * 50)
+        
+        public = os.path.join(self.root, 'public')
+        files = {path: (size, mtime_ns)
+                 for path, size, mtime_ns in self._stat_files(IMAGE_EXTENSIONS)}
+        references = defaultdict(list)
+        for path, record in sorted(self._scan_sources().items()):
+            for url in record.assets:
+                references[url].append(path)
+        
+        infos = {}
+        for path, result in sorted(self._probe_images(files).items()):
+            if result.error:
+                print(f"⚠️  UNREADABLE IMAGE: {path} ({result.error})")
+                self.report.finding('image-asset', path, result.error, rule='unreadable')
+            else:
+                infos[path] = result.info
+        
+        assets = []
+        for path in sorted(infos):
+            info, size = infos[path], files[path][0]
+            inside_public = path.startswith(public + os.sep)
+            url = '/' + os.path.relpath(path, public).replace(os.sep, '/') if inside_public else ''
+            issues = []
+            limit = BYTES_PER_PIXEL_LIMIT.get(info.format)
+            if limit and info.pixels and size / info.pixels > limit:
+                issues.append(('bytes-per-pixel', f"{size / info.pixels:.2f} bytes/pixel "
+                                                  f"(limit {limit} for {info.format})"))
+            if max(info.width or 0, info.height or 0) > MAX_DIMENSION:
+                issues.append(('oversized',
+                               f"{info.width}x{info.height} exceeds {MAX_DIMENSION}px"))
+            stem = os.path.splitext(path)[0]
+            if (info.format in ('png', 'jpeg', 'gif') and size >= MODERN_VARIANT_MIN_BYTES
+                    and not any(stem + ext in files for ext in MODERN_EXTENSIONS)):
+                issues.append(('no-modern-variant',
+                               f"{size // 1024} KB {info.format} without a .webp/.avif variant"))
+            if url and not references.get(url):
+                issues.append(('unreferenced', f"{url} is not referenced from any source file"))
+            asset = ImageAsset(path, url, info.format, info.width, info.height, size,
+                               references.get(url, []), issues)
+            assets.append(asset)
+            for rule, message in issues:
+                print(f"🖼️  {rule}: {path} ({info.width}x{info.height}, "
+                      f"{size // 1024} KB) {message}")
+                self.report.finding(
+                    'image-asset', path, message, rule=rule,
+                    level='note' if rule == 'unreferenced' else None,
+                    data={'format': info.format, 'width': info.width, 'height': info.height,
+                          'bytes': size, 'references': len(asset.references)},
+                )
+        
+        self.image_assets = assets
+        return assets
+    
+    def _probe_images(self, files):
+        """{path: ProbeResult} for {path: (size, mtime_ns)}
+
+        Results probed ahead of time (sharded runs) and cached ones are
+        reused; the rest are probed from their headers in parallel.
+        """
+        probed, pending = {}, []
+        for path, (size, mtime_ns) in files.items():
+            result = self._probed.pop(path, None)
+            if result is None and self.cache:
+                cached = self.cache.lookup(path, size, mtime_ns, IMAGE_CACHE_KIND)
+                if cached is not MISS:
+                    result = ProbeResult(path, info=ImageInfo(*cached))
+            if result is None:
+                pending.append(path)
+            else:
+                probed[path] = result
+        for result in probe_images(pending, self.workers):
+            probed[result.path] = result
+            if result.info and self.cache:
+                self.cache.store(result.path, *files[result.path], IMAGE_CACHE_KIND,
+                                 list(result.info))
+        return probed
+    
+    def analyze_tailwind_classes(self):
+        """Inverted class index over src/, repeated class bundles and unused token shades
+
+        Class bundles are extracted by the content pass (and cached with the
+        imports), so the index only swaps in files whose record changed since
+        the last call. Palettes are color shade scales declared in
+        src/design-system/tokens; a shade counts as used when any class ends
+        in `-<palette>-<shade>`.
+        """
+        print("\n🎨 TAILWIND CLASSES")
+        print("=" * 50)
+        
+        sources = self._scan_sources()
+        src = os.path.join(self.root, 'src') + os.sep
+        tokens = os.path.join(self.root, TOKENS_DIR) + os.sep
+        index = self.class_index
+        for path in [p for p in self._indexed if p not in sources]:
+            index.remove(path)
+            del self._indexed[path]
+            self._palettes.pop(path, None)
+        for path, record in sources.items():
+            if not path.startswith(src) or self._indexed.get(path) is record:
                 continue
-                
-            for file in files:
-                if file.endswith(('.tsx', '.ts', '.js', '.jsx')):
-                    file_path = os.path.join(root, file)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                            
-                        # Look for common broken import patterns
-                        if any(pattern in content for pattern in [
-                            'from "@/design-system"',
-                            'from "../design-system"',
-                            'from "./components"'
-                        ]):
-                            broken.append(file_path)
-                            print(f"⚠️  SUSPICIOUS IMPORTS: {file_path}")
-                    except:
-                        pass
-        
-        return broken
+            index.update(path, record.classes)
+            self._indexed[path] = record
+            if path.startswith(tokens):
+                try:
+                    with open(path, encoding='utf-8', errors='replace') as f:
+                        self._palettes[path] = extract_palettes(f.read())
+                except OSError:
+                    self._palettes.pop(path, None)
+        
+        heavy = sorted(index.files.items(), key=lambda item: (-len(item[1]), item[0]))
+        for path, counts in heavy[:CLASS_HEAVY_FILES]:
+            print(f"🎨 {len(counts):>4} classes ({sum(counts.values())} uses) "
+                  f"{os.path.relpath(path, self.root)}")
+        
+        clusters = index.near_duplicates()
+        for cluster in clusters:
+            path, line = cluster.occurrences[0]
+            shared = ' '.join(cluster.shared)
+            print(f"🧩 {len(cluster.occurrences)} bundles in {cluster.files} files "
+                  f"share '{shared}'")
+            self.report.finding(
+                'class-bundle', path,
+                f"{len(cluster.occurrences)} near-identical class bundles in {cluster.files} "
+                f"files share '{shared}'; consider a component or variant",
+                line=line, related=sorted({p for p, _ in cluster.occurrences[1:]} - {path}),
+                data={'shared': cluster.shared, 'variants': cluster.variants,
+                      'occurrences': [f"{os.path.relpath(p, self.root)}:{n}"
+                                      for p, n in cluster.occurrences]},
+            )
+        
+        unused = {}
+        for path in sorted(self._palettes):
+            for name, shades in index.unused_shades(self._palettes[path]).items():
+                unused[name] = shades
+                total = len(self._palettes[path][name])
+                print(f"🎨 UNUSED TOKEN: {name} ({len(shades)}/{total} shades) "
+                      f"in {os.path.relpath(path, self.root)}")
+                self.report.finding(
+                    'design-token', path,
+                    f"{len(shades)} of {total} '{name}' shades are not used by any class",
+                    rule=name, data={'palette': name, 'unused': shades},
+                )
+        
+        print(f"🎨 {len(index)} unique classes in {len(index.files)} files")
+        self.tailwind = TailwindReport(len(index), len(index.files), clusters, unused)
+        return self.tailwind
     
     def generate_cleanup_plan(self):
-        """Generate systematic cleanup plan"""
+        """Generate systematic cleanup plan
+
+        Every entry is classified once against the compiled cleanup rules
+        (see cleanup_rules.py); a candidate directory stands for its whole
+        subtree, so nothing is listed twice.
+        """
         print("\n📋 CLEANUP PLAN")
         print("=" * 50)
         
@@ -191,22 +1206,24 @@ class ARCOAuditor:
         }
         
         # Immediate removal candidates
-        removal_patterns = [
-            "*.bak",
-            "*backup*",
-            "*old*",
-            "*temp*",
-            "*test*" 
-        ]
-        
-        for pattern in removal_patterns:
-            for path in self.root.rglob(pattern):
-                if path.is_file() or path.is_dir():
-                    plan["immediate_removal"].append(str(path))
+        if self.single_pass:
+            entries = ((e.path, e.is_dir) for e in self.snapshot.iter_entries())
+        else:
+            entries = ((os.path.join(root, name), is_dir)
+                       for root, dirs, files in self._walk()
+                       for names, is_dir in ((dirs, True), (files, False))
+                       for name in names)
+        rules = {rule.id: rule for rule in self.cleanup_rules.rules}
+        for candidate in self.cleanup_rules.classify(self.root, entries):
+            plan["immediate_removal"].append(candidate)
+            message = rules[candidate.rule].message or "Matches a cleanup removal rule"
+            self.report.finding('removal-candidate', candidate.path,
+                                f"{message} ({candidate.pattern})", rule=candidate.rule,
+                                data={'pattern': candidate.pattern, 'is_dir': candidate.is_dir})
         
         print("🗑️  IMMEDIATE REMOVAL:")
         for item in plan["immediate_removal"]:
-            print(f"   └─ {item}")
+            print(f"   └─ {item.path} [{item.rule}: {item.pattern}]")
         
         return plan
     
@@ -250,41 +1267,332 @@ class ARCOAuditor:
         return recommended
 
 def main():
-    auditor = ARCOAuditor()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ARCO project audit")
+    parser.add_argument(
+        "roots", nargs="*", type=Path,
+        help="repo roots to audit (default: current directory; several imply --shard root)"
+    )
+    parser.add_argument(
+        "--multi-pass", action="store_true",
+        help="walk the tree separately in every phase (legacy behaviour)"
+    )
+    parser.add_argument(
+        "--git-index", action="store_true",
+        help="list tracked files from .git/index instead of walking the disk "
+             "(untracked files and empty folders are not seen)"
+    )
+    parser.add_argument(
+        "--shard", choices=SHARD_MODES, default=None,
+        help="walk and scan each root, or each top-level directory, in a worker process"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=None,
+        help="with --shard, worker processes (default: one per core)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="ignore and do not update the incremental cache"
+    )
+    parser.add_argument(
+        "--cache-dir", type=Path, default=None,
+        help="cache location (default: .cache/arco-audit)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="reader threads for content scans (default: 4 x cores, max 32)"
+    )
+    parser.add_argument(
+        "--rules", type=Path, default=DEFAULT_RULES_PATH,
+        help="content rule config (JSON, 'audit' section)"
+    )
+    parser.add_argument(
+        "--format", choices=("text", "jsonl", "sarif"), default="text",
+        help="stream findings as JSON Lines or SARIF (human output moves to stderr)"
+    )
+    parser.add_argument(
+        "--output", type=Path, default=None,
+        help="write --format output, or the --history report, here instead of stdout"
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="report time, I/O counters and peak memory per phase"
+    )
+    parser.add_argument(
+        "--profile-dir", type=Path, default=None,
+        help="with --profile, also write one cProfile dump per phase here"
+    )
+    parser.add_argument(
+        "--watch", action="store_true",
+        help="after the audit, keep running and report finding changes on every save"
+    )
+    parser.add_argument(
+        "--poll", type=float, default=None, metavar="SECONDS",
+        help="with --watch, poll at this interval instead of using inotify"
+    )
+    parser.add_argument(
+        "--history", metavar="REV_RANGE", default=None,
+        help="instead of auditing the worktree, report structure, duplicate and import "
+             "metrics for every commit in a git range (e.g. main~200..main), "
+             "read from git objects; --format jsonl streams one object per commit"
+    )
+    args = parser.parse_args()
+    roots = [root.resolve() for root in args.roots] or [Path.cwd()]
+    if len(set(roots)) != len(roots):
+        parser.error("each root may only be given once")
+    if len(roots) > 1 and args.shard is None:
+        args.shard = "root"
+    if args.git_index and args.multi_pass:
+        parser.error("--git-index feeds the shared snapshot; drop --multi-pass")
+    if args.shard and (args.multi_pass or args.git_index or args.watch):
+        parser.error("--shard and several roots need the walked snapshot; "
+                     "drop --multi-pass, --git-index and --watch")
+    if args.jobs is not None and not args.shard:
+        parser.error("--jobs only applies with --shard")
+    if args.watch and args.multi_pass:
+        parser.error("--watch needs the shared snapshot; drop --multi-pass")
+    if args.watch and args.format != "text":
+        parser.error("--watch only supports --format text")
+    if args.history and (len(roots) > 1 or args.shard or args.multi_pass or args.git_index
+                         or args.watch or args.profile):
+        parser.error("--history audits one repo from git objects; drop --shard, "
+                     "--multi-pass, --git-index, --watch and --profile")
+    if args.history and args.format == "sarif":
+        parser.error("--history supports --format text or jsonl")
+    if args.history:
+        return run_history_cli(args, roots[0])
+
+    # Report paths relative to the common parent when auditing several roots
+    root = Path(os.path.commonpath(roots)) if len(roots) > 1 else roots[0]
+    if args.format == "text":
+        return run_audit(args, roots, Reporter(root))
+
+    stream = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    reporter = make_reporter(args.format, stream, root)
+    try:
+        if args.output:
+            return run_audit(args, roots, reporter)
+        # stdout carries the machine-readable stream; keep it clean
+        with contextlib.redirect_stdout(sys.stderr):
+            return run_audit(args, roots, reporter)
+    finally:
+        reporter.close()
+        if args.output:
+            stream.close()
+
+
+def run_history_cli(args, root):
+    from audit_history import run_history
+    from git_objects import GitObjectError
+
+    output = open(args.output, 'w', encoding='utf-8') if args.output else None
+    if args.format == "jsonl":
+        stream = output or sys.stdout
+        # Like --format for findings, stdout carries only the JSON stream
+        console = sys.stdout if output else sys.stderr
+    else:
+        stream = None
+        console = output or sys.stdout
+    try:
+        with contextlib.redirect_stdout(console):
+            return run_history(root, args.history, stream)
+    except GitObjectError as exc:
+        print(f"❌ HISTORY: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        if output is not None:
+            output.close()
+
+
+def run_phases(auditor, phase):
+    """Run every audit phase in order; returns {phase name: result}
+
+    The shared content pass (reads, digests, import / rule / class / MinHash
+    extraction) runs up front as its own phase, so profiles charge it there
+    instead of to whichever phase first needs the sources.
+    """
+    if auditor.single_pass:
+        with phase("snapshot"):
+            auditor.snapshot
+    with phase("content"):
+        auditor._scan_sources()
+    results = {}
+    for name in AUDIT_PHASES:
+        with phase(name):
+            results[name] = getattr(auditor, name)()
+    return results
+
+
+def print_summary(auditor, results):
+    structure = results["scan_directory_structure"]
+    duplicates = results["find_duplicate_files"]
+    routes = results["analyze_route_weight"]
+    images = results["audit_image_assets"]
+    tailwind = results["analyze_tailwind_classes"]
+    print("\n📊 AUDIT SUMMARY")
+    print("=" * 50)
+    print(f"📁 Total folders scanned: {len(structure)}")
+    print(f"🔄 Duplicate groups found: {len(duplicates)} "
+          f"({sum(g.wasted_bytes for g in duplicates.values())} bytes wasted)")
+    near = results["find_near_duplicates"]
+    print(f"🧬 Near-duplicate clusters: {len(near)} "
+          f"({sum(len(c.paths) for c in near)} files)")
+    print(f"📂 Empty folders: {len(results['find_empty_folders'])}")
+    print(f"⚠️  Unresolved imports: {len(auditor.unresolved_imports)} in "
+          f"{len(results['find_broken_imports'])} files")
+    if routes:
+        print(f"⚖️  Heaviest route: {routes[0].route} ({routes[0].kind}, "
+              f"{routes[0].with_layouts // 1024} KB with layouts)")
+    print(f"📏 Content rule hits: {len(results['find_rule_violations'])}")
+    print(f"🖼️  Images: {len(images)} ({sum(a.size for a in images) // 1024} KB), "
+          f"{sum(1 for a in images if a.issues)} with issues")
+    print(f"🎨 Tailwind classes: {tailwind.unique_classes} unique, "
+          f"{len(tailwind.clusters)} repeated bundles, "
+          f"{sum(map(len, tailwind.unused_shades.values()))} unused token shades")
+    if auditor.read_errors:
+        print(f"❌ Unreadable files: {len(auditor.read_errors)}")
+    print(f"🗑️  Items for immediate removal: "
+          f"{len(results['generate_cleanup_plan']['immediate_removal'])}")
+    if auditor.cache:
+        cache = auditor.cache
+        print(f"💾 Cache: {cache.hits} hits, {cache.misses} misses ({cache.path})")
+
+
+def print_cross_root_duplicates(auditors, groups, reporter):
+    """Print and report the combined duplicate groups whose copies span roots"""
+    roots = sorted(((str(a.root) + os.sep, Path(os.path.relpath(a.root, reporter.root)).as_posix())
+                    for a in auditors), key=lambda item: -len(item[0]))
+
+    def locate(path):
+        for prefix, label in roots:
+            if path.startswith(prefix):
+                return label, Path(path[len(prefix):]).as_posix()
+        return "", path
+
+    print("\n🔄 DUPLICATES ACROSS ROOTS")
+    print("=" * 50)
+    spanning = 0
+    for group in groups:
+        located = [locate(path) for path in group.paths]
+        labels = {label for label, _ in located}
+        if len(labels) < 2:
+            continue
+        spanning += 1
+        print(f"🔄 DUPLICATE: {len(group.paths)} copies in {len(labels)} roots x "
+              f"{group.size} bytes ({group.wasted_bytes} wasted) [{group.digest[:12]}]")
+        for label, rel in located:
+            print(f"   └─ {label}: {rel}")
+        reporter.finding(
+            'duplicate-file', group.paths[0],
+            f"{len(group.paths)} byte-identical copies in {len(labels)} roots "
+            f"({group.wasted_bytes} bytes wasted)",
+            related=group.paths[1:],
+            data={'digest': group.digest, 'size': group.size, 'copies': len(group.paths),
+                  'roots': len(labels), 'wasted_bytes': group.wasted_bytes},
+        )
+    if not spanning:
+        print("✅ No file is duplicated across roots")
+    return spanning
+
+
+def print_combined_summary(auditors, all_results, duplicates, spanning):
+    """Totals over several roots; duplicates come from the combined groups"""
+    def total(name, size=len):
+        return sum(size(results[name]) for results in all_results)
     
+    classes = set()
+    for auditor in auditors:
+        classes.update(auditor.class_index.index)
+    print(f"\n📊 COMBINED SUMMARY ({len(auditors)} roots)")
+    print("=" * 50)
+    print(f"📁 Total folders scanned: {total('scan_directory_structure')}")
+    print(f"🔄 Duplicate groups found: {len(duplicates)}, {spanning} across roots "
+          f"({sum(g.wasted_bytes for g in duplicates)} bytes wasted)")
+    print(f"🧬 Near-duplicate clusters: {total('find_near_duplicates')}")
+    print(f"📂 Empty folders: {total('find_empty_folders')}")
+    print(f"⚠️  Unresolved imports: {sum(len(a.unresolved_imports) for a in auditors)} in "
+          f"{total('find_broken_imports')} files")
+    print(f"📏 Content rule hits: {total('find_rule_violations')}")
+    print(f"🖼️  Images: {total('audit_image_assets')}, "
+          f"{total('audit_image_assets', lambda a: sum(1 for i in a if i.issues))} with issues")
+    print(f"🎨 Tailwind classes: {len(classes)} unique across roots")
+    print(f"🗑️  Items for immediate removal: "
+          f"{total('generate_cleanup_plan', lambda p: len(p['immediate_removal']))}")
+
+
+def run_audit(args, roots, reporter):
     print("🎯 ARCO PROJECT AUDIT")
     print("=" * 50)
     print("Purpose: Clean up messy structure, remove redundancies")
     print()
     
-    # 1. Structure analysis
-    structure = auditor.scan_directory_structure()
-    
-    # 2. Find problems
-    duplicates = auditor.find_duplicate_files()
-    empty_folders = auditor.find_empty_folders()
-    design_analysis = auditor.analyze_design_system()
-    broken_imports = auditor.find_broken_imports()
+    recorder = None
+    if args.profile:
+        recorder = PhaseRecorder(trace_memory=True, profile_dir=args.profile_dir)
+        phase = recorder.phase
+    else:
+        phase = lambda name: contextlib.nullcontext()
     
-    # 3. Generate action plan
-    cleanup_plan = auditor.generate_cleanup_plan()
-    recommendations = auditor.generate_restructure_recommendation()
+    rules = RuleSet.load(args.rules)
+    cleanup_rules = CleanupRules.load(args.rules)
+    if args.shard:
+        from audit_shards import sharded_auditors
+        with phase("shards"):
+            auditors = sharded_auditors(
+                roots, args.shard, rules, jobs=args.jobs, use_cache=not args.no_cache,
+                cache_dir=args.cache_dir, workers=args.workers, reporter=reporter,
+                cleanup_rules=cleanup_rules,
+            )
+    else:
+        cache = None if args.no_cache else open_cache(roots[0], args.cache_dir)
+        auditors = [ARCOAuditor(roots[0], single_pass=not args.multi_pass, cache=cache,
+                                workers=args.workers, rules=rules,
+                                reporter=reporter, git_index=args.git_index,
+                                cleanup_rules=cleanup_rules)]
     
-    # 4. Summary
-    print("\n📊 AUDIT SUMMARY")
-    print("=" * 50)
-    print(f"📁 Total folders scanned: {len(structure)}")
-    print(f"🔄 Duplicate files found: {len(duplicates)}")
-    print(f"📂 Empty folders: {len(empty_folders)}")
-    print(f"⚠️  Files with suspicious imports: {len(broken_imports)}")
-    print(f"🗑️  Items for immediate removal: {len(cleanup_plan['immediate_removal'])}")
+    # Closing flushes new cache rows; keep them even when a phase fails
+    try:
+        all_results = []
+        for auditor in auditors:
+            root_phase = phase
+            if len(auditors) > 1:
+                print(f"\n📦 ROOT {auditor.root}")
+                print("=" * 50)
+                label = auditor.root.name
+                root_phase = lambda name, label=label: phase(f"{label}:{name}")
+            results = run_phases(auditor, root_phase)
+            print_summary(auditor, results)
+            all_results.append(results)
+        if len(auditors) > 1:
+            from audit_shards import merge_duplicates
+            with phase("duplicates across roots"):
+                duplicates = merge_duplicates(auditors)
+                spanning = print_cross_root_duplicates(auditors, duplicates, reporter)
+            print_combined_summary(auditors, all_results, duplicates, spanning)
+        if recorder:
+            print("\n⏱️  PHASE PROFILE")
+            print("=" * 50)
+            recorder.print_table()
+            if args.profile_dir:
+                print(f"cProfile dumps: {args.profile_dir}")
     
-    print("\n🎯 NEXT STEPS:")
-    print("1. Run cleanup commands for immediate removal")
-    print("2. Consolidate duplicate components")
-    print("3. Restructure design system")
-    print("4. Fix broken imports")
-    print("5. Implement recommended structure")
+        print("\n🎯 NEXT STEPS:")
+        print("1. Run cleanup commands for immediate removal")
+        print("2. Consolidate duplicate components")
+        print("3. Restructure design system")
+        print("4. Fix broken imports")
+        print("5. Implement recommended structure")
+
+        if args.watch:
+            from audit_watch import run_watch
+            try:
+                run_watch(auditors[0], poll_interval=args.poll)
+            except KeyboardInterrupt:
+                print("\n👋 Watch stopped")
+    finally:
+        for auditor in auditors:
+            auditor.close()
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
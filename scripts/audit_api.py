@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+ARCO Audit API
+Quiet, lazy, typed access to the auditor for long-lived callers, plus a JSON
+Lines server so non-Python tooling can keep one warm worker instead of
+re-running the CLI per query
+"""
+
+import contextlib
+import io
+import json
+import sys
+from pathlib import Path
+from typing import (IO, TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, NamedTuple,
+                    Optional, Sequence, Set, Tuple)
+
+if TYPE_CHECKING:
+    from audit import ARCOAuditor, DuplicateGroup, ImageAsset, RouteWeight, TailwindReport
+    from audit_report import Finding
+    from content_rules import RuleHit
+    from import_graph import ImportRef
+    from near_duplicates import SimilarityCluster
+
+# Phases whose results another phase reads; they run (as their own phase)
+# first so each finding is reported by exactly one phase
+PHASE_DEPENDENCIES = {
+    "find_near_duplicates": ("find_duplicate_files",),
+    "analyze_route_weight": ("find_broken_imports",),
+}
+
+
+class AuditSummary(NamedTuple):
+    """Headline counts, the same numbers the CLI summary prints"""
+    folders: int
+    duplicate_groups: int
+    wasted_bytes: int
+    near_duplicate_clusters: int
+    empty_folders: int
+    unresolved_imports: int
+    rule_hits: int
+    images: int
+    images_with_issues: int
+    unique_classes: int
+    removal_candidates: int
+    read_errors: int
+
+
+def _quiet():
+    # Every auditor phase narrates to stdout; library callers get return values
+    return contextlib.redirect_stdout(io.StringIO())
+
+
+class AuditSession:
+    """An ARCOAuditor kept warm between queries
+
+    Nothing is imported, walked or read until the first query. Each phase
+    runs at most once and its result and findings are memoized until
+    refresh() folds in changed paths, after which only changed files are
+    re-read. Phases never print.
+
+    Read-only mode (the default) guarantees nothing under the root is created
+    or modified: an existing audit cache is used for lookups but never
+    written, and the auditor itself only reads. Pass read_only=False to let
+    the session update the cache on close(), like the CLI does.
+
+    Not thread-safe; use one session per worker thread.
+    """
+
+    def __init__(self, root=None, *, read_only: bool = True, use_cache: bool = True,
+                 cache_dir: Optional[Path] = None, rules_path: Optional[Path] = None,
+                 workers: Optional[int] = None, git_index: bool = False):
+        self.root = Path(root).resolve() if root else Path.cwd()
+        self.read_only = read_only
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+        self.rules_path = rules_path
+        self.workers = workers
+        self.git_index = git_index
+        self._auditor = None
+        self._results: Dict[str, Any] = {}
+        self._findings: Dict[str, List["Finding"]] = {}
+
+    def __enter__(self) -> "AuditSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def auditor(self) -> "ARCOAuditor":
+        """The underlying auditor, created (and the audit modules imported) on first use"""
+        if self._auditor is None:
+            from audit import ARCOAuditor
+            from audit_cache import open_cache
+            from audit_report import CollectingReporter
+            from cleanup_rules import CleanupRules
+            from content_rules import DEFAULT_RULES_PATH, RuleSet
+            with _quiet():
+                cache = None
+                if self.use_cache:
+                    cache = open_cache(self.root, self.cache_dir, read_only=self.read_only)
+                self._auditor = ARCOAuditor(
+                    self.root, cache=cache, workers=self.workers,
+                    rules=RuleSet.load(self.rules_path or DEFAULT_RULES_PATH),
+                    cleanup_rules=CleanupRules.load(self.rules_path or DEFAULT_RULES_PATH),
+                    reporter=CollectingReporter(self.root), git_index=self.git_index,
+                )
+        return self._auditor
+
+    @property
+    def phases(self) -> Tuple[str, ...]:
+        from audit import AUDIT_PHASES
+        return AUDIT_PHASES
+
+    def run(self, phase: str) -> Any:
+        """Result of one audit phase (see `phases`), computed once"""
+        if phase not in self._results:
+            if phase not in self.phases:
+                raise ValueError(f"unknown audit phase {phase!r}")
+            for dependency in PHASE_DEPENDENCIES.get(phase, ()):
+                self.run(dependency)
+            auditor = self.auditor
+            try:
+                with _quiet():
+                    result = getattr(auditor, phase)()
+            finally:
+                findings = auditor.report.drain()
+            self._results[phase] = result
+            self._findings[phase] = findings
+        return self._results[phase]
+
+    def findings(self, phases: Optional[Sequence[str]] = None,
+                 kinds: Optional[Iterable[str]] = None) -> Iterator["Finding"]:
+        """Findings of the given phases (default: all), in phase order
+
+        A generator: each phase runs only when iteration reaches it, so a
+        caller that stops early never pays for the remaining phases.
+        """
+        kinds = set(kinds) if kinds is not None else None
+        for phase in phases or self.phases:
+            self.run(phase)
+            for finding in self._findings[phase]:
+                if kinds is None or finding.kind in kinds:
+                    yield finding
+
+    def refresh(self, paths: Iterable[str]) -> Set[str]:
+        """Fold created / modified / deleted paths in; returns the entries that changed
+
+        Memoized results are dropped only when something changed.
+        """
+        if self._auditor is None:
+            return set()
+        with _quiet():
+            changed = self._auditor.apply_changes(paths)
+        if changed:
+            self._results.clear()
+            self._findings.clear()
+        return changed
+
+    def close(self) -> None:
+        """Release the cache (written back unless read-only)"""
+        if self._auditor is not None:
+            with _quiet():
+                self._auditor.close()
+            self._auditor = None
+            self._results.clear()
+            self._findings.clear()
+
+    # Typed views over the phase results
+
+    def duplicates(self) -> List["DuplicateGroup"]:
+        return list(self.run("find_duplicate_files").values())
+
+    def near_duplicates(self) -> List["SimilarityCluster"]:
+        return list(self.run("find_near_duplicates"))
+
+    def empty_folders(self) -> List[str]:
+        return list(self.run("find_empty_folders"))
+
+    def unresolved_imports(self) -> List["ImportRef"]:
+        self.run("find_broken_imports")
+        return list(self.auditor.unresolved_imports)
+
+    def route_weights(self) -> List["RouteWeight"]:
+        return list(self.run("analyze_route_weight"))
+
+    def rule_violations(self) -> List[Tuple[str, "RuleHit"]]:
+        return list(self.run("find_rule_violations"))
+
+    def image_assets(self) -> List["ImageAsset"]:
+        return list(self.run("audit_image_assets"))
+
+    def tailwind(self) -> "TailwindReport":
+        return self.run("analyze_tailwind_classes")
+
+    def summary(self) -> AuditSummary:
+        duplicates = self.duplicates()
+        images = self.image_assets()
+        return AuditSummary(
+            folders=len(self.run("scan_directory_structure")),
+            duplicate_groups=len(duplicates),
+            wasted_bytes=sum(g.wasted_bytes for g in duplicates),
+            near_duplicate_clusters=len(self.near_duplicates()),
+            empty_folders=len(self.empty_folders()),
+            unresolved_imports=len(self.unresolved_imports()),
+            rule_hits=len(self.rule_violations()),
+            images=len(images),
+            images_with_issues=sum(1 for a in images if a.issues),
+            unique_classes=self.tailwind().unique_classes,
+            removal_candidates=len(self.run("generate_cleanup_plan")["immediate_removal"]),
+            read_errors=len(self.auditor.read_errors),
+        )
+
+
+def serve(session: AuditSession, requests: IO[str], responses: IO[str]) -> None:
+    """Answer JSON Lines requests until EOF
+
+    Each request is {"id": ..., "method": ..., "params": {...}}:
+      findings {phases?, kinds?}  one {"id", "finding"} line per finding, then
+                                  {"id", "result": {"count": n}}
+      summary                     {"id", "result": {...AuditSummary}}
+      refresh {paths}             {"id", "result": {"changed": [...]}}
+      phases                      {"id", "result": [...]}
+    Failures answer {"id", "error": message} and the server keeps going.
+    """
+    def send(message):
+        responses.write(json.dumps(message, ensure_ascii=False) + "\n")
+        responses.flush()
+
+    for line in requests:
+        if not line.strip():
+            continue
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            method = request.get("method")
+            params = request.get("params") or {}
+            if method == "findings":
+                count = 0
+                for finding in session.findings(params.get("phases"), params.get("kinds")):
+                    send({"id": request_id, "finding": finding._asdict()})
+                    count += 1
+                send({"id": request_id, "result": {"count": count}})
+            elif method == "summary":
+                send({"id": request_id, "result": session.summary()._asdict()})
+            elif method == "refresh":
+                changed = session.refresh(params.get("paths") or [])
+                send({"id": request_id, "result": {"changed": sorted(changed)}})
+            elif method == "phases":
+                send({"id": request_id, "result": list(session.phases)})
+            else:
+                send({"id": request_id, "error": f"unknown method {method!r}"})
+        except Exception as exc:
+            send({"id": request_id, "error": f"{type(exc).__name__}: {exc}"})
+
+
+def main(argv=None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="ARCO audit as a library / JSON Lines worker")
+    parser.add_argument("root", nargs="?", type=Path, default=None,
+                        help="repo root (default: current directory)")
+    parser.add_argument("--serve", action="store_true",
+                        help="answer JSON Lines requests on stdin until EOF")
+    parser.add_argument("--write-cache", action="store_true",
+                        help="update the audit cache (default: read-only, nothing is written)")
+    parser.add_argument("--no-cache", action="store_true", help="ignore the audit cache")
+    parser.add_argument("--cache-dir", type=Path, default=None,
+                        help="cache location (default: .cache/arco-audit)")
+    args = parser.parse_args(argv)
+
+    with AuditSession(args.root, read_only=not args.write_cache, use_cache=not args.no_cache,
+                      cache_dir=args.cache_dir) as session:
+        if args.serve:
+            serve(session, sys.stdin, sys.stdout)
+        else:
+            print(json.dumps(session.summary()._asdict(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+ARCO Audit Cache
+Persistent per-file results keyed on (path, size, mtime_ns)
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+DEFAULT_CACHE_DIR = Path(".cache") / "arco-audit"
+SCHEMA_VERSION = 1
+
+MISS = object()
+
+
+class AuditCache:
+    """SQLite-backed cache of file signatures, content digests and findings
+
+    Every row is loaded into memory when the cache is opened and dirty rows are
+    written back in one transaction on flush(), so a warm run costs one SELECT
+    plus the stat calls the snapshot already makes. Results are stored per
+    `kind` (e.g. "imports:v1"); bump the suffix whenever an analyzer's output
+    format changes so stale payloads are ignored.
+
+    read_only opens an existing cache file without ever writing to it:
+    lookups work as usual, stores only live in memory and flush() is a no-op.
+    """
+
+    def __init__(self, root, cache_dir: Optional[Path] = None, read_only: bool = False):
+        cache_dir = Path(cache_dir) if cache_dir else Path(root) / DEFAULT_CACHE_DIR
+        self.path = cache_dir / "audit.sqlite"
+        self.read_only = read_only
+        self.hits = 0
+        self.misses = 0
+        if read_only:
+            self._conn = sqlite3.connect(f"{self.path.resolve().as_uri()}?mode=ro", uri=True)
+        else:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            self._init_schema()
+        self._files: Dict[str, Tuple[int, int, Optional[str]]] = {}
+        self._results: Dict[str, Dict[str, str]] = {}
+        self._dirty: set = set()
+        self._load()
+
+    def _init_schema(self) -> None:
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            self._conn.executescript("""
+                DROP TABLE IF EXISTS files;
+                DROP TABLE IF EXISTS results;
+            """)
+        self._conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                digest TEXT
+            );
+            CREATE TABLE IF NOT EXISTS results (
+                path TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (path, kind)
+            );
+            PRAGMA user_version = {SCHEMA_VERSION};
+        """)
+
+    def _load(self) -> None:
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+            return
+        for path, size, mtime_ns, digest in self._conn.execute(
+                "SELECT path, size, mtime_ns, digest FROM files"):
+            self._files[path] = (size, mtime_ns, digest)
+        for path, kind, payload in self._conn.execute(
+                "SELECT path, kind, payload FROM results"):
+            self._results.setdefault(path, {})[kind] = payload
+
+    def _fresh(self, path: str, size: int, mtime_ns: int) -> bool:
+        row = self._files.get(path)
+        return row is not None and row[0] == size and row[1] == mtime_ns
+
+    def _touch(self, path: str, size: int, mtime_ns: int) -> None:
+        """Record a new signature, dropping everything cached for the old one"""
+        if self._fresh(path, size, mtime_ns):
+            return
+        self._files[path] = (size, mtime_ns, None)
+        self._results.pop(path, None)
+        self._dirty.add(path)
+
+    def digest(self, path: str, size: int, mtime_ns: int) -> Optional[str]:
+        if not self._fresh(path, size, mtime_ns):
+            return None
+        return self._files[path][2]
+
+    def store_digest(self, path: str, size: int, mtime_ns: int, digest: str) -> None:
+        self._touch(path, size, mtime_ns)
+        self._files[path] = (size, mtime_ns, digest)
+        self._dirty.add(path)
+
+    def lookup(self, path: str, size: int, mtime_ns: int, kind: str) -> Any:
+        """Cached payload for this exact file signature, or MISS"""
+        if self._fresh(path, size, mtime_ns):
+            payload = self._results.get(path, {}).get(kind)
+            if payload is not None:
+                self.hits += 1
+                return json.loads(payload)
+        self.misses += 1
+        return MISS
+
+    def store(self, path: str, size: int, mtime_ns: int, kind: str, value: Any) -> None:
+        self._touch(path, size, mtime_ns)
+        self._results.setdefault(path, {})[kind] = json.dumps(value, separators=(",", ":"))
+        self._dirty.add(path)
+
+    def prune(self, live_paths: Iterable[str]) -> int:
+        """Forget files that no longer exist; returns how many were dropped"""
+        live = live_paths if isinstance(live_paths, (set, frozenset, dict)) else set(live_paths)
+        gone = [path for path in self._files if path not in live]
+        for path in gone:
+            del self._files[path]
+            self._results.pop(path, None)
+            self._dirty.add(path)
+        return len(gone)
+
+    def flush(self) -> None:
+        """Write every dirty path back in a single transaction"""
+        if not self._dirty or self.read_only:
+            return
+        dirty = [(path,) for path in self._dirty]
+        with self._conn:
+            self._conn.executemany("DELETE FROM results WHERE path = ?", dirty)
+            self._conn.executemany("DELETE FROM files WHERE path = ?", dirty)
+            self._conn.executemany(
+                "INSERT INTO files (path, size, mtime_ns, digest) VALUES (?, ?, ?, ?)",
+                [(path, *self._files[path]) for path in self._dirty if path in self._files])
+            self._conn.executemany(
+                "INSERT INTO results (path, kind, payload) VALUES (?, ?, ?)",
+                [(path, kind, payload)
+                 for path in self._dirty
+                 for kind, payload in self._results.get(path, {}).items()])
+        self._dirty.clear()
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+
+def open_cache(root, cache_dir: Optional[Path] = None,
+               read_only: bool = False) -> Optional[AuditCache]:
+    """AuditCache, or None when the cache location is not writable
+
+    With read_only, also None when there is no cache file yet.
+    """
+    try:
+        return AuditCache(root, cache_dir, read_only)
+    except (OSError, sqlite3.Error) as exc:
+        print(f"⚠️  Audit cache disabled: {exc}")
+        return None
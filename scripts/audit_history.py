@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Historical ARCO audit
+Structure, duplicate and import metrics for every commit of a range, read
+straight from git objects; subtrees are summarized once per tree SHA
+"""
+
+import json
+import os
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import IO, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from audit import SOURCE_EXTENSIONS, ARCOAuditor
+from content_pipeline import skip_reason
+from git_objects import GITLINK_MODE, CatFile, Commit, rev_list
+from import_graph import (ImportRef, ModuleGraph, ModuleResolver, PathAliases, extract_imports,
+                          manifest_packages, parse_jsonc)
+
+# git's ids for the empty blob (SHA-1, SHA-256); the live audit never groups
+# empty files
+EMPTY_BLOBS = frozenset((
+    "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391",
+    "473a0f4c3be8a93681a267e3b1e9a7dcda1185436fe141f7749120a303721813",
+))
+TOP_PURPOSES = 3
+
+
+class TreeSummary(NamedTuple):
+    """Everything the history metrics need from one subtree, at one path
+
+    Counts cover the whole subtree; file lists only this directory's own
+    entries, the rest is reached through children (see HistoryAuditor.flatten).
+    """
+    folders: int
+    files: int
+    purposes: Counter  # FolderPurpose name -> folders
+    design: Counter  # component folder type -> folders
+    paths: Tuple[str, ...]  # root-relative posix paths of the directory's files
+    sources: Tuple[Tuple[str, str], ...]  # (path, blob sha) of its source files
+    children: Tuple[Tuple[str, str], ...]  # (path, tree sha) of its visible subtrees
+
+
+class HistoryPoint(NamedTuple):
+    """Audit metrics of one commit"""
+    commit: str
+    timestamp: int
+    subject: str
+    files: int
+    folders: int
+    purposes: Dict[str, int]
+    design_folders: Dict[str, int]
+    duplicate_groups: int
+    unresolved_imports: int
+
+
+class HistoryAuditor:
+    """Audits commits of the repo at root without touching the worktree
+
+    Summaries are memoized by (path, tree SHA): between two commits only the
+    directories on the path to a change get a new tree SHA, so every other
+    subtree is reused without reading it. Summaries hold subtree counts and
+    child references, never copies of descendants' file lists; those are
+    flattened once per audited commit. Import extraction is memoized by
+    blob SHA and whole commits by root tree SHA. Folder classification and
+    ignore rules are the live auditor's, taken from the current worktree.
+    """
+
+    def __init__(self, root, auditor: Optional[ARCOAuditor] = None):
+        self.root = os.path.abspath(root)
+        self.auditor = auditor or ARCOAuditor(root, single_pass=False)
+        self.objects = CatFile(root)
+        self._trees: Dict[Tuple[str, str], TreeSummary] = {}
+        self._imports: Dict[str, Optional[List[ImportRef]]] = {}
+        self._configs: Dict[Tuple[str, Optional[str]], object] = {}
+        self._points: Dict[str, HistoryPoint] = {}
+        self.stats: Counter = Counter()
+
+    def __enter__(self) -> "HistoryAuditor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.objects.close()
+
+    def summarize(self, rel: str, sha: str) -> TreeSummary:
+        """Summary of tree sha checked out at rel ("" for the root)"""
+        key = (rel, sha)
+        summary = self._trees.get(key)
+        if summary is not None:
+            self.stats["trees reused"] += 1
+            return summary
+        self.stats["trees analyzed"] += 1
+        matcher = self.auditor.matcher
+        names, paths, sources, children = [], [], [], []
+        folders, files, purposes, design = 0, 0, Counter(), Counter()
+        for entry in self.objects.tree(sha):
+            path = f"{rel}/{entry.name}" if rel else entry.name
+            if entry.mode == GITLINK_MODE or matcher.match(path, entry.is_tree):
+                continue
+            if entry.is_tree:
+                child = self.summarize(path, entry.sha)
+                folders += child.folders
+                files += child.files
+                purposes.update(child.purposes)
+                design.update(child.design)
+                children.append((path, entry.sha))
+                continue
+            names.append(entry.name)
+            paths.append(path)
+            if entry.name.endswith(SOURCE_EXTENSIONS):
+                sources.append((path, entry.sha))
+        # Same rules as scan_directory_structure / analyze_design_system
+        rel_os = rel.replace("/", os.sep)
+        if rel and not rel.startswith("."):
+            folders += 1
+            purposes[self.auditor.identify_folder_purpose(rel_os, names)] += 1
+        directory = os.path.join(self.root, rel_os) if rel else self.root
+        if 'design-system' in directory.lower() or 'components' in directory.lower():
+            design[self.auditor.classify_component_folder(directory, names)] += 1
+        summary = TreeSummary(folders, files + len(paths), purposes, design, tuple(paths),
+                              tuple(sources), tuple(children))
+        self._trees[key] = summary
+        return summary
+
+    def flatten(self, sha: str) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """(file paths, (path, blob sha) of sources) of an already summarized root tree"""
+        paths, sources = [], []
+        pending = [("", sha)]
+        while pending:
+            summary = self._trees[pending.pop()]
+            paths.extend(summary.paths)
+            sources.extend(summary.sources)
+            pending.extend(summary.children)
+        return paths, sources
+
+    def _imports_of(self, path: str, sha: str) -> Optional[List[ImportRef]]:
+        """Imports of one source blob, None when the live audit would skip it"""
+        if sha not in self._imports:
+            self.stats["blobs read"] += 1
+            data = self.objects.blob(sha)
+            if skip_reason(path.rpartition("/")[2], data):
+                self._imports[sha] = None
+            else:
+                self._imports[sha] = extract_imports(data.decode("utf-8", errors="replace"))
+        return self._imports[sha]
+
+    def _config(self, name: str, sha: Optional[str]):
+        """Resolver config from a root tsconfig.json / package.json blob"""
+        key = (name, sha)
+        if key not in self._configs:
+            config = {}
+            if sha is not None:
+                try:
+                    text = self.objects.blob(sha).decode("utf-8", errors="replace")
+                    config = parse_jsonc(text) if name == "tsconfig.json" else json.loads(text)
+                except ValueError:
+                    config = {}
+            if name == "tsconfig.json":
+                value = PathAliases.from_config(self.root, config)
+            else:
+                value = manifest_packages(config)
+            self._configs[key] = value
+        return self._configs[key]
+
+    def audit_commit(self, commit: Commit) -> HistoryPoint:
+        point = self._points.get(commit.tree)
+        if point is not None:
+            self.stats["commits reused"] += 1
+            return point._replace(commit=commit.sha, timestamp=commit.timestamp,
+                                  subject=commit.subject)
+        summary = self.summarize("", commit.tree)
+        paths, sources = self.flatten(commit.tree)
+
+        by_blob = Counter(sha for _, sha in sources if sha not in EMPTY_BLOBS)
+        duplicate_groups = sum(1 for copies in by_blob.values() if copies > 1)
+
+        # Resolution depends on which files exist at this commit, so it is
+        # redone per commit (on in-memory paths) while extraction is reused
+        def absolute(rel):
+            return os.path.join(self.root, *rel.split("/"))
+
+        imports = {}
+        for rel, sha in sources:
+            refs = self._imports_of(rel, sha)
+            if refs is not None:
+                imports[absolute(rel)] = refs
+        top = {entry.name: entry.sha for entry in self.objects.tree(commit.tree)}
+        resolver = ModuleResolver(self.root, {absolute(rel) for rel in paths},
+                                  aliases=self._config("tsconfig.json", top.get("tsconfig.json")),
+                                  packages=self._config("package.json", top.get("package.json")))
+        unresolved = len(ModuleGraph.build(imports, resolver).unresolved)
+
+        point = HistoryPoint(commit.sha, commit.timestamp, commit.subject, summary.files,
+                             summary.folders, dict(summary.purposes), dict(summary.design),
+                             duplicate_groups, unresolved)
+        self._points[commit.tree] = point
+        return point
+
+    def run(self, rev_range: str) -> Iterator[HistoryPoint]:
+        """HistoryPoint of every commit in rev_range, oldest first"""
+        for sha in rev_list(self.root, rev_range):
+            yield self.audit_commit(self.objects.commit(sha))
+
+
+def _row(point: HistoryPoint) -> str:
+    date = datetime.fromtimestamp(point.timestamp, timezone.utc).strftime("%Y-%m-%d")
+    top = sorted(point.purposes.items(), key=lambda item: (-item[1], item[0]))[:TOP_PURPOSES]
+    purposes = " ".join(f"{name.lower()}={count}" for name, count in top)
+    return (f"{point.commit[:10]} {date} {point.files:>6} {point.folders:>6} "
+            f"{point.duplicate_groups:>5} {point.unresolved_imports:>6}  {purposes}")
+
+
+def run_history(root, rev_range: str, stream: Optional[IO[str]] = None) -> int:
+    """Print one row per commit; with stream, also write each point as a JSON line"""
+    print("🕰️ ARCO AUDIT HISTORY")
+    print("=" * 50)
+    start = time.perf_counter()
+    count = 0
+    with HistoryAuditor(root) as history:
+        print(f"{'commit':<10} {'date':<10} {'files':>6} {'dirs':>6} {'dups':>5} "
+              f"{'unres':>6}  top folder purposes")
+        for point in history.run(rev_range):
+            print(_row(point))
+            if stream is not None:
+                stream.write(json.dumps(point._asdict(), ensure_ascii=False) + "\n")
+            count += 1
+        stats = history.stats
+        reads = history.objects.reads
+    elapsed = time.perf_counter() - start
+    print(f"\n🕰️ {count} commits in {elapsed:.2f}s: {stats['trees analyzed']} trees analyzed, "
+          f"{stats['trees reused']} reused, {stats['blobs read']} source blobs read, "
+          f"{reads} objects streamed")
+    return 0
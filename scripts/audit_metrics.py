@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+ARCO Audit Metrics
+Per-phase wall/CPU time, I/O counters and memory for the maintenance scripts
+"""
+
+import os
+import resource
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional
+
+
+class PhaseMetrics(NamedTuple):
+    name: str
+    wall_s: float
+    cpu_s: float
+    dirs_visited: int
+    dirs_listed: int
+    stat_calls: int
+    files_opened: int
+    bytes_read: int
+    peak_rss_kb: int
+    py_peak_kb: Optional[int] = None
+
+
+class IOCounters:
+    """Process-wide I/O counters
+
+    File opens and directory listings are counted through a CPython audit hook
+    (installed once, since hooks cannot be removed; it also sees worker
+    threads). CPython raises no audit event for stat, so the walker and the
+    snapshot bump stat_calls and dirs_visited themselves via count_stat() /
+    count_dir_visit(); both are plain integer increments when nobody measures.
+    """
+
+    def __init__(self):
+        self.files_opened = 0
+        self.dirs_listed = 0
+        self.stat_calls = 0
+        self.dirs_visited = 0
+        self._hooked = False
+
+    def install(self) -> "IOCounters":
+        if not self._hooked:
+            sys.addaudithook(self._hook)
+            self._hooked = True
+        return self
+
+    def _hook(self, event: str, args) -> None:
+        if event == "open":
+            _, mode, flags = args
+            if isinstance(mode, str):
+                reading = "r" in mode or "+" in mode
+            else:
+                reading = flags is not None and (flags & os.O_ACCMODE) != os.O_WRONLY
+            if reading:
+                self.files_opened += 1
+        elif event in ("os.scandir", "os.listdir"):
+            self.dirs_listed += 1
+
+
+COUNTERS = IOCounters()
+
+
+def count_stat(n: int = 1) -> None:
+    COUNTERS.stat_calls += n
+
+
+def count_dir_visit() -> None:
+    COUNTERS.dirs_visited += 1
+
+
+def bytes_read() -> int:
+    """Bytes this process has read via read syscalls (Linux /proc; 0 elsewhere)"""
+    try:
+        with open("/proc/self/io", "rb") as f:
+            for line in f:
+                if line.startswith(b"rchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def peak_rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS, kilobytes on Linux
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class PhaseRecorder:
+    """Collects a PhaseMetrics row per measured block
+
+    trace_memory adds the tracemalloc peak of Python allocations per phase
+    (RSS peak is process-lifetime and can only grow). profile_dir writes one
+    cProfile dump per phase, named <index>-<phase>.prof.
+    """
+
+    def __init__(self, trace_memory: bool = False, profile_dir: Optional[Path] = None):
+        # Profiling modules load on first use; the counters stay cheap to import
+        import tracemalloc
+        self.counters = COUNTERS.install()
+        self.trace_memory = trace_memory
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self.phases: List[PhaseMetrics] = []
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if self.profile_dir:
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        import cProfile
+        import tracemalloc
+        c = self.counters
+        # Reading /proc/self/io is itself an open; don't count it
+        read_before = bytes_read()
+        c.files_opened -= 1
+        before = (c.dirs_visited, c.dirs_listed, c.stat_calls, c.files_opened)
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+        profiler = cProfile.Profile() if self.profile_dir else None
+        wall, cpu = time.perf_counter(), time.process_time()
+        if profiler:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler:
+                profiler.disable()
+            wall = time.perf_counter() - wall
+            cpu = time.process_time() - cpu
+            after = (c.dirs_visited, c.dirs_listed, c.stat_calls, c.files_opened)
+            py_peak = tracemalloc.get_traced_memory()[1] // 1024 if self.trace_memory else None
+            read_after = bytes_read()
+            c.files_opened -= 1
+            self.phases.append(PhaseMetrics(
+                name, wall, cpu,
+                *(a - b for a, b in zip(after, before)),
+                read_after - read_before,
+                peak_rss_kb(),
+                py_peak,
+            ))
+            if profiler:
+                profiler.dump_stats(str(self.profile_dir / f"{len(self.phases):02d}-{name}.prof"))
+
+    def as_dicts(self) -> List[Dict]:
+        return [m._asdict() for m in self.phases]
+
+    def print_table(self) -> None:
+        print(f"{'phase':<40}{'wall ms':>9}{'cpu ms':>9}{'visited':>9}{'listdir':>9}"
+              f"{'stat':>8}{'opened':>8}{'read KB':>9}{'rss MB':>8}{'py MB':>7}")
+        for m in self.phases:
+            py = f"{m.py_peak_kb / 1024:>7.1f}" if m.py_peak_kb is not None else f"{'-':>7}"
+            print(f"{m.name:<40}{m.wall_s * 1000:>9.1f}{m.cpu_s * 1000:>9.1f}{m.dirs_visited:>9}"
+                  f"{m.dirs_listed:>9}{m.stat_calls:>8}{m.files_opened:>8}"
+                  f"{m.bytes_read // 1024:>9}{m.peak_rss_kb / 1024:>8.1f}{py}")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+ARCO Audit Reporters
+Stream findings as JSON Lines or SARIF while the audit is still running
+"""
+
+import json
+import os
+from collections import Counter
+from pathlib import Path
+from typing import IO, Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+SARIF_SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+
+# Finding kinds the auditor emits: (default level, short description)
+FINDING_KINDS: Dict[str, tuple] = {
+    "duplicate-file": ("warning", "Byte-identical files"),
+    "near-duplicate": ("note", "Structurally near-identical .tsx files (MinHash similarity)"),
+    "empty-folder": ("note", "Empty folder or folder holding only empty folders"),
+    "design-system-folder": ("note", "Design-system / components folder classification"),
+    "unresolved-import": ("error", "Import specifier that resolves to no file or declared package"),
+    "content-rule": ("warning", "Configured content rule hit"),
+    "read-error": ("error", "Source file could not be read"),
+    "route-weight": ("note", "Transitive local import weight of a src/app page or layout"),
+    "image-asset": ("warning", "Heavy, oversized, unreferenced or legacy-format-only image"),
+    "class-bundle": ("note", "Near-identical Tailwind class bundle repeated across files"),
+    "design-token": ("note", "Design-token color shades no className uses"),
+    "removal-candidate": ("note", "Entry matching a cleanup removal rule"),
+}
+
+
+class Reporter:
+    """Finding sink; the base class only counts (console output stays in the phases)"""
+
+    def __init__(self, root=None):
+        self.root = str(root) if root else os.getcwd()
+        self.counts: Counter = Counter()
+
+    def relpath(self, path: str) -> str:
+        return Path(os.path.relpath(path, self.root)).as_posix()
+
+    def finding(self, kind: str, path: str, message: str, *, line: Optional[int] = None,
+                column: Optional[int] = None, rule: Optional[str] = None,
+                related: Sequence[str] = (), level: Optional[str] = None,
+                data: Optional[Dict[str, Any]] = None) -> None:
+        self.counts[kind] += 1
+        self._write(kind, path, message, line, column, rule, related,
+                    level or FINDING_KINDS.get(kind, ("warning",))[0], data)
+
+    def _write(self, kind, path, message, line, column, rule, related, level, data) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class Finding(NamedTuple):
+    """One finding as handed out by the library API, paths relative to the root"""
+    kind: str
+    level: str
+    path: str
+    message: str
+    line: Optional[int] = None
+    column: Optional[int] = None
+    rule: Optional[str] = None
+    related: Tuple[str, ...] = ()
+    data: Optional[Dict[str, Any]] = None
+
+
+class CollectingReporter(Reporter):
+    """Buffers Finding tuples until drain() hands them over"""
+
+    def __init__(self, root=None):
+        super().__init__(root)
+        self.pending: List[Finding] = []
+
+    def _write(self, kind, path, message, line, column, rule, related, level, data) -> None:
+        self.pending.append(Finding(
+            kind, level, self.relpath(path), message, line, column, rule,
+            tuple(self.relpath(p) for p in related), data,
+        ))
+
+    def drain(self) -> List[Finding]:
+        pending, self.pending = self.pending, []
+        return pending
+
+
+class JsonLinesReporter(Reporter):
+    """One JSON object per finding, flushed immediately"""
+
+    def __init__(self, stream: IO[str], root=None):
+        super().__init__(root)
+        self.stream = stream
+
+    def _write(self, kind, path, message, line, column, rule, related, level, data) -> None:
+        record = {
+            "kind": kind,
+            "level": level,
+            "path": self.relpath(path),
+            "line": line,
+            "column": column,
+            "rule": rule,
+            "message": message,
+        }
+        if related:
+            record["related"] = [self.relpath(p) for p in related]
+        if data:
+            record["data"] = data
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+
+class SarifReporter(Reporter):
+    """SARIF 2.1.0 written incrementally: results first, tool metadata on close
+
+    JSON object keys are unordered, so the run can end with "tool" once every
+    result has been streamed; nothing but per-kind counters is held in memory.
+    """
+
+    def __init__(self, stream: IO[str], root=None):
+        super().__init__(root)
+        self.stream = stream
+        self._first = True
+        base = Path(self.root).resolve().as_uri() + "/"
+        self.stream.write(
+            '{"version":"2.1.0","$schema":%s,"runs":[{"originalUriBaseIds":{"SRCROOT":{"uri":%s}},'
+            '"results":[' % (json.dumps(SARIF_SCHEMA), json.dumps(base))
+        )
+        self.stream.flush()
+
+    def _location(self, path: str, line: Optional[int] = None,
+                  column: Optional[int] = None) -> Dict[str, Any]:
+        physical: Dict[str, Any] = {
+            "artifactLocation": {"uri": self.relpath(path), "uriBaseId": "SRCROOT"}
+        }
+        if line:
+            region = {"startLine": line}
+            if column:
+                region["startColumn"] = column
+            physical["region"] = region
+        return {"physicalLocation": physical}
+
+    def _write(self, kind, path, message, line, column, rule, related, level, data) -> None:
+        result: Dict[str, Any] = {
+            "ruleId": kind,
+            "level": level,
+            "message": {"text": message},
+            "locations": [self._location(path, line, column)],
+        }
+        if related:
+            result["relatedLocations"] = [
+                dict(self._location(p), id=i + 1) for i, p in enumerate(related)
+            ]
+        properties = dict(data or {})
+        if rule:
+            properties["rule"] = rule
+        if properties:
+            result["properties"] = properties
+        self.stream.write(("" if self._first else ",") + json.dumps(result, ensure_ascii=False))
+        self._first = False
+        self.stream.flush()
+
+    def close(self) -> None:
+        rules: List[Dict[str, Any]] = [
+            {"id": kind, "shortDescription": {"text": text},
+             "defaultConfiguration": {"level": level}}
+            for kind, (level, text) in FINDING_KINDS.items()
+        ]
+        tool = {"driver": {"name": "arco-audit", "rules": rules}}
+        self.stream.write('],"tool":%s}]}\n' % json.dumps(tool))
+        self.stream.flush()
+
+
+def make_reporter(fmt: str, stream: IO[str], root=None) -> Reporter:
+    if fmt == "jsonl":
+        return JsonLinesReporter(stream, root)
+    if fmt == "sarif":
+        return SarifReporter(stream, root)
+    return Reporter(root)
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Sharded ARCO audit
+Walks and content-scans shards of one or more repo roots in worker processes,
+then merges the partial results into one in-memory auditor per root, and the
+roots' file digests into duplicate groups that span roots
+"""
+
+import contextlib
+import hashlib
+import io
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from audit import (SHARD_MODES, SOURCE_EXTENSIONS, ARCOAuditor, DuplicateGroup, FSEntry,
+                   FSSnapshot, group_identical)
+from audit_cache import open_cache
+from content_pipeline import default_workers
+from content_rules import RuleSet
+from image_probe import IMAGE_EXTENSIONS
+from repo_walker import IgnoreMatcher, scan
+
+
+class Shard(NamedTuple):
+    """The part of a repo root one worker process walks and scans"""
+    root: str
+    tops: Optional[Tuple[str, ...]]  # top-level directory names; None = the whole root
+
+
+class ShardResult(NamedTuple):
+    """Everything a worker learned about its shard, in walk order"""
+    shard: Shard
+    entries: List[FSEntry]
+    listing: Dict[str, Tuple[list, list]]
+    digests: Dict[str, str]
+    has_ignored: Set[str]
+    sources: Dict[str, tuple]  # path -> SourceRecord
+    read_errors: List[dict]
+    skipped_files: Dict[str, List[str]]
+    images: Dict[str, tuple]  # path -> ProbeResult
+    cache_counts: Tuple[int, int]  # (hits, misses) while scanning this shard
+
+
+class ShardOptions(NamedTuple):
+    rules: RuleSet
+    use_cache: bool
+    cache_dir: Optional[Path]
+    workers: Optional[int]
+
+
+class ShardSnapshot(FSSnapshot):
+    """FSSnapshot of only some top-level directories of the root"""
+
+    def __init__(self, root, matcher=None, tops=None):
+        self.tops = tops
+        super().__init__(root, matcher)
+
+    def _build(self):
+        if self.tops is None:
+            return super()._build()
+        for name in self.tops:
+            self._add_tree(os.path.join(self.root, name))
+
+
+class MergedSnapshot(FSSnapshot):
+    """The root's own listing plus every shard's subtree, without walking
+
+    Shard results arrive in root listing order, so entries and listings end
+    up in the order a single walk would have recorded them.
+    """
+
+    def __init__(self, root, matcher, top_entries, results, top_ignored=False):
+        self._parts = (top_entries, results, top_ignored)
+        super().__init__(root, matcher)
+
+    def _build(self):
+        top_entries, results, top_ignored = self._parts
+        del self._parts
+        if top_ignored:
+            self.has_ignored.add(self.root)
+        if top_entries is not None:
+            dirs, files = [], []
+            for entry in top_entries:
+                self.entries[entry.path] = entry
+                (dirs if entry.is_dir else files).append(entry.name)
+            self.listing[self.root] = (dirs, files)
+        for result in results:
+            self.entries.update((entry.path, entry) for entry in result.entries)
+            self.listing.update(result.listing)
+            self.digests.update(result.digests)
+            self.has_ignored.update(result.has_ignored)
+
+
+def plan_shards(root: str, matcher: IgnoreMatcher, mode: str):
+    """(root-level FSEntries or None, shards, root had ignored entries) for one repo root
+
+    "top-level" lists the root once here and gives every real top-level
+    directory its own shard; root-level files stay with the parent.
+    """
+    if mode not in SHARD_MODES:
+        raise ValueError(f"unknown shard mode {mode!r}")
+    if mode == "root":
+        return None, [Shard(root, None)], False
+    ignored = set()
+    _, dir_entries, file_entries = next(scan(root, matcher, ignored))
+    top_entries, shards = [], []
+    for is_dir, group in ((True, dir_entries), (False, file_entries)):
+        for entry in group:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            top_entries.append(FSEntry(entry.path, entry.name, is_dir, st.st_size,
+                                       st.st_mtime_ns))
+            # Like the walker, symlinked directories are listed but not entered
+            if is_dir and not entry.is_symlink():
+                shards.append(Shard(root, (entry.name,)))
+    return top_entries, shards, bool(ignored)
+
+
+# Worker-process state: one cache per (root, cache dir), opened on first use
+# and flushed after every shard, so a process loads it once
+_CACHES: Dict[tuple, object] = {}
+
+
+def _shard_cache(root: str, options: ShardOptions):
+    if not options.use_cache:
+        return None
+    key = (root, options.cache_dir)
+    if key not in _CACHES:
+        _CACHES[key] = open_cache(root, options.cache_dir)
+    return _CACHES[key]
+
+
+def audit_shard(shard: Shard, options: ShardOptions) -> ShardResult:
+    """Worker-side: walk one shard, scan its sources and probe its images
+
+    Output is discarded; read errors travel back in the result and are
+    reported by the parent. The cache is flushed but never pruned here,
+    since this process only sees part of the tree.
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        cache = _shard_cache(shard.root, options)
+        before = (cache.hits, cache.misses) if cache else (0, 0)
+        matcher = IgnoreMatcher.from_repo(shard.root)
+        snapshot = ShardSnapshot(shard.root, matcher, shard.tops)
+        auditor = ARCOAuditor(shard.root, cache=cache, workers=options.workers,
+                              rules=options.rules, snapshot=snapshot)
+        sources = auditor._scan_sources()
+        images = auditor._probe_images(
+            {path: (size, mtime_ns)
+             for path, size, mtime_ns in auditor._stat_files(IMAGE_EXTENSIONS)})
+        counts = (0, 0)
+        if cache:
+            cache.flush()
+            counts = (cache.hits - before[0], cache.misses - before[1])
+    return ShardResult(
+        shard, list(snapshot.entries.values()), snapshot.listing, snapshot.digests,
+        snapshot.has_ignored, sources, auditor.read_errors, dict(auditor.skipped_files), images, counts,
+    )
+
+
+def _cache_dir_for(root: str, cache_dir: Optional[Path], shared: bool) -> Optional[Path]:
+    """Per-root cache dir when several roots share --cache-dir
+
+    Closing an auditor prunes every cached path outside its root, so roots
+    must not share one cache file.
+    """
+    if cache_dir is None or not shared:
+        return cache_dir
+    tag = hashlib.blake2b(root.encode(), digest_size=4).hexdigest()
+    return Path(cache_dir) / f"{os.path.basename(root)}-{tag}"
+
+
+def merge_shards(root: str, matcher: IgnoreMatcher, top_entries, results: List[ShardResult],
+                 rules: RuleSet, cache=None, workers=None, reporter=None,
+                 cleanup_rules=None, top_ignored=False) -> ARCOAuditor:
+    """An auditor for root whose snapshot and content pass come from the shards
+
+    Root-level source files (not in any shard) are left stale so the first
+    phase reads them in this process. Phases then run as usual on the merged
+    state, which is why duplicate groups span shards.
+    """
+    snapshot = MergedSnapshot(root, matcher, top_entries, results, top_ignored)
+    auditor = ARCOAuditor(root, cache=cache, workers=workers, rules=rules, reporter=reporter,
+                          snapshot=snapshot, cleanup_rules=cleanup_rules)
+    auditor._sources = {}
+    auditor.skipped_files = defaultdict(list)
+    for result in results:
+        auditor._sources.update(result.sources)
+        auditor._probed.update(result.images)
+        if cache:
+            cache.hits += result.cache_counts[0]
+            cache.misses += result.cache_counts[1]
+        for reason, paths in result.skipped_files.items():
+            auditor.skipped_files[reason].extend(paths)
+        for error in result.read_errors:
+            auditor.read_errors.append(error)
+            print(f"❌ READ ERROR: {error['path']} ({error['error']})")
+            auditor.report.finding('read-error', error['path'], error['error'])
+    for entry in top_entries or ():
+        if not entry.is_dir and entry.name.endswith(SOURCE_EXTENSIONS):
+            auditor.invalidate_sources([entry.path])
+    return auditor
+
+
+class RootCaches:
+    """Each root's audit cache behind the digest interface group_identical uses"""
+
+    def __init__(self, auditors: List[ARCOAuditor]):
+        # Longest root first, so a root nested in another claims its own files
+        self._caches = sorted(((str(a.root) + os.sep, a.cache) for a in auditors if a.cache),
+                              key=lambda item: -len(item[0]))
+
+    def __bool__(self) -> bool:
+        return bool(self._caches)
+
+    def _cache(self, path: str):
+        for prefix, cache in self._caches:
+            if path.startswith(prefix):
+                return cache
+        return None
+
+    def digest(self, path: str, size: int, mtime_ns: int) -> Optional[str]:
+        cache = self._cache(path)
+        return cache.digest(path, size, mtime_ns) if cache else None
+
+    def store_digest(self, path: str, size: int, mtime_ns: int, digest: str) -> None:
+        cache = self._cache(path)
+        if cache:
+            cache.store_digest(path, size, mtime_ns, digest)
+
+
+def merge_duplicates(auditors: List[ARCOAuditor]) -> List[DuplicateGroup]:
+    """Duplicate groups over the source files of every root at once
+
+    The (path, size, mtime_ns) candidates and known digests of all roots go
+    into one group_identical call, so a file copied into two checkouts forms
+    one group. Digests from the content pass, the roots' own duplicate phase
+    and their caches are reused; only files whose size collides across roots
+    and were never hashed are read.
+    """
+    candidates, known = {}, {}
+    for auditor in auditors:
+        for path, size, mtime_ns in auditor._stat_files(SOURCE_EXTENSIONS):
+            candidates[path] = (path, size, mtime_ns)
+        known.update(auditor.snapshot.digests)
+        for group in auditor.duplicates.values():
+            known.update((path, group.digest) for path in group.paths)
+    return group_identical(candidates.values(), RootCaches(auditors), known)
+
+
+def sharded_auditors(roots, mode: str, rules: RuleSet, jobs: Optional[int] = None,
+                     use_cache: bool = True, cache_dir: Optional[Path] = None,
+                     workers: Optional[int] = None, reporter=None,
+                     cleanup_rules=None) -> List[ARCOAuditor]:
+    """One merged auditor per root, with the walking and reading done in processes
+
+    Shards of every root share one process pool; results are collected in
+    submission order, so the merge is deterministic whatever order workers
+    finish in. Each worker gets a share of the reader threads.
+    """
+    roots = [str(root) for root in roots]
+    jobs = jobs or os.cpu_count() or 1
+    plans, tasks = [], []
+    for root in roots:
+        matcher = IgnoreMatcher.from_repo(root)
+        top_entries, shards, top_ignored = plan_shards(root, matcher, mode)
+        plans.append((root, matcher, top_entries, top_ignored, len(shards)))
+        tasks.extend(shards)
+    shared_cache = len(roots) > 1
+    processes = min(jobs, max(len(tasks), 1))
+    threads = workers or max(4, default_workers() // processes)
+    per_root = {root: ShardOptions(rules, use_cache,
+                                   _cache_dir_for(root, cache_dir, shared_cache), threads)
+                for root in roots}
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        results = list(pool.map(audit_shard, tasks, [per_root[t.root] for t in tasks]))
+    print(f"🧩 {len(tasks)} shard(s) over {len(roots)} root(s) in {processes} process(es)")
+
+    auditors, start = [], 0
+    for root, matcher, top_entries, top_ignored, count in plans:
+        options = per_root[root]
+        cache = open_cache(root, options.cache_dir) if use_cache else None
+        auditors.append(merge_shards(root, matcher, top_entries, results[start:start + count],
+                                     rules, cache=cache, workers=workers, reporter=reporter,
+                                     cleanup_rules=cleanup_rules, top_ignored=top_ignored))
+        start += count
+    return auditors
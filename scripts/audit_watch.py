@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+ARCO Audit Watch Mode
+Keeps an ARCOAuditor in memory and reports finding changes on every save
+"""
+
+import contextlib
+import ctypes
+import ctypes.util
+import io
+import os
+import select
+import struct
+import time
+from typing import Dict, Iterator, Optional, Set
+
+from audit_report import Reporter
+
+DEBOUNCE_SECONDS = 0.02
+
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0x80000)
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+              | IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Recursive inotify watch over the snapshot's directories (Linux only)"""
+
+    def __init__(self, snapshot):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self.snapshot = snapshot
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, str] = {}
+        for path in snapshot.listing:
+            self._add(path)
+
+    def _add(self, path: str) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), WATCH_MASK)
+        if wd >= 0:
+            self._dirs[wd] = path
+
+    def _read(self) -> Set[str]:
+        changed: Set[str] = set()
+        try:
+            data = os.read(self.fd, 1 << 16)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                # Lost events: treat every top-level entry as changed
+                changed.update(os.path.join(self.snapshot.root, n)
+                               for n in self.snapshot.listdir(self.snapshot.root))
+                continue
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None:
+                continue
+            path = os.path.join(directory, os.fsdecode(name)) if name else directory
+            changed.add(path)
+        return changed
+
+    def batches(self) -> Iterator[Set[str]]:
+        while True:
+            select.select([self.fd], [], [])
+            changed = self._read()
+            # Editors save in several syscalls; coalesce a short burst
+            while select.select([self.fd], [], [], DEBOUNCE_SECONDS)[0]:
+                changed |= self._read()
+            if changed:
+                yield changed
+
+    def watch_new(self, paths) -> None:
+        """Start watching directories that appeared since the last batch"""
+        watched = set(self._dirs.values())
+        for path in paths:
+            if path in self.snapshot.listing:
+                prefix = path + os.sep
+                for directory in self.snapshot.listing:
+                    if (directory == path or directory.startswith(prefix)) and directory not in watched:
+                        self._add(directory)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Fallback: rescan on an interval and diff (size, mtime_ns, type) per entry"""
+
+    def __init__(self, snapshot, interval: float = 0.5):
+        self.snapshot = snapshot
+        self.interval = interval
+
+    def batches(self) -> Iterator[Set[str]]:
+        previous = dict(self.snapshot.entries)
+        while True:
+            time.sleep(self.interval)
+            current = type(self.snapshot)(self.snapshot.root, self.snapshot.matcher).entries
+            changed = {p for p, e in current.items() if previous.get(p) != e}
+            changed.update(p for p in previous if p not in current)
+            previous = current
+            if changed:
+                yield changed
+
+    def watch_new(self, paths) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+def make_watcher(snapshot, poll_interval: Optional[float] = None):
+    if poll_interval is None:
+        try:
+            return InotifyWatcher(snapshot)
+        except (OSError, AttributeError) as exc:
+            print(f"⚠️  inotify unavailable ({exc}); polling instead")
+            poll_interval = 0.5
+    return PollingWatcher(snapshot, poll_interval)
+
+
+def evaluate(auditor) -> Dict[str, Set[str]]:
+    """Re-run the in-memory phases quietly and key every finding as a string"""
+    reporter = auditor.report
+    # Only diffs are printed in watch mode; don't re-stream every finding
+    auditor.report = Reporter(auditor.root)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            duplicates = auditor.find_duplicate_files()
+            near = auditor.find_near_duplicates()
+            empty = auditor.find_empty_folders()
+            design = auditor.analyze_design_system()
+            auditor.find_broken_imports()
+            auditor.find_rule_violations()
+            images = auditor.audit_image_assets()
+            tailwind = auditor.analyze_tailwind_classes()
+    finally:
+        auditor.report = reporter
+    return {
+        "duplicates": {" = ".join(g.paths) for g in duplicates.values()},
+        "near_duplicates": {" ~ ".join(c.paths) for c in near},
+        "empty": set(empty),
+        "design": {f"{kind}: {item['path']}" for kind, items in design.items() for item in items},
+        "imports": {f"{r.path}:{r.line} '{r.specifier}' ({r.reason})" for r in auditor.unresolved_imports},
+        "rules": {f"{hit.rule}: {path}:{hit.line}:{hit.column}" for path, hit in auditor.rule_violations},
+        "read_errors": {f"{e['path']} ({e['error']})" for e in auditor.read_errors},
+        "images": {f"{rule}: {asset.path}" for asset in images for rule, _ in asset.issues},
+        "classes": {f"{c.occurrences[0][0]}:{c.occurrences[0][1]} {' '.join(c.shared)}"
+                    for c in tailwind.clusters}
+                   | {f"unused: {name}-{shade}" for name, shades in tailwind.unused_shades.items()
+                      for shade in shades},
+    }
+
+
+def run_watch(auditor, poll_interval: Optional[float] = None) -> None:
+    """Block forever, printing findings that appear or disappear after each save"""
+    findings = evaluate(auditor)
+    watcher = make_watcher(auditor.snapshot, poll_interval)
+    kind = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+    print(f"\n👀 WATCHING {auditor.root} ({kind}, Ctrl+C to stop)")
+    try:
+        for batch in watcher.batches():
+            started = time.perf_counter()
+            changed = auditor.apply_changes(batch)
+            if not changed:
+                continue
+            watcher.watch_new(changed)
+            current = evaluate(auditor)
+            elapsed = (time.perf_counter() - started) * 1000
+            stamp = time.strftime("%H:%M:%S")
+            delta = False
+            for category in current:
+                for item in sorted(current[category] - findings.get(category, set())):
+                    print(f"[{stamp}] ➕ {category}: {item}")
+                    delta = True
+                for item in sorted(findings.get(category, set()) - current[category]):
+                    print(f"[{stamp}] ➖ {category}: {item}")
+                    delta = True
+            if not delta:
+                print(f"[{stamp}] ✅ no finding changes")
+            print(f"[{stamp}] ⏱️  {len(changed)} path(s) re-evaluated in {elapsed:.1f} ms")
+            findings = current
+            if auditor.cache:
+                auditor.cache.flush()
+    finally:
+        watcher.close()
@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+ARCO Maintenance Scripts Benchmark
+Generates synthetic Next.js-shaped trees and times every ARCOAuditor phase,
+DesignSystemAutomator step and create_unified_exports run
+
+Usage:
+    python scripts/benchmark_maintenance.py --files 1000 --files 50000
+    python scripts/benchmark_maintenance.py --files 200000 --out bench.json
+    python scripts/benchmark_maintenance.py --files 1000 --compare bench.json
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+RESULT_VERSION = 1
+
+AUTOMATOR_STEPS = [
+    "reorganize_components",
+    "fix_imports",
+    "generate_index_files",
+    "validate_structure",
+    "generate_component_documentation",
+]
+
+DESIGN_SYSTEM_FILES = [
+    "Button.tsx", "Badge.tsx", "Avatar.tsx", "Typography.tsx", "Card.tsx",
+    "Container.tsx", "Grid.tsx", "BentoGrid.tsx", "Hero.tsx", "CTA.tsx",
+    "Testimonial.tsx", "Section.tsx", "Layout.tsx",
+]
+COMPONENT_GROUPS = ["ui", "layout", "sections", "navigation", "forms", "marketing", "admin", "ecommerce"]
+TAILWIND = ["flex", "items-center", "gap-2", "px-4", "py-2", "rounded-md", "text-sm",
+            "font-medium", "bg-primary", "text-white", "shadow", "hover:bg-primary/90"]
+
+
+# ---------------------------------------------------------------------------
+# Synthetic tree
+# ---------------------------------------------------------------------------
+
+def _component_source(rng: random.Random, name: str, imports: List[str]) -> str:
+    lines = ['import * as React from "react";', 'import { cn } from "@/lib/utils";']
+    lines += [f'import {{ {spec.rsplit("/", 1)[-1]} }} from "{spec}";' for spec in imports]
+    classes = " ".join(rng.sample(TAILWIND, 5))
+    lines += [
+        "",
+        f"export function {name}({{ className, ...props }}: React.HTMLAttributes<HTMLDivElement>) {{",
+        f'  return <div className={{cn("{classes}", className)}} {{...props}} />;',
+        "}",
+        "",
+    ]
+    return "\n".join(lines)
+
+
+def generate_tree(root: Path, files: int, node_modules_depth: int = 4,
+                  node_modules_share: float = 0.4, seed: int = 1) -> Dict[str, int]:
+    """Write a deterministic Next.js-like tree with roughly `files` files"""
+    rng = random.Random(seed)
+    counts = {"node_modules": 0, "components": 0, "barrels": 0, "app": 0, "design_system": 0,
+              "duplicates": 0, "empty_dirs": 0, "broken_imports": 0}
+
+    def write(path: Path, text: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+
+    write(root / ".gitignore", "node_modules/\n.next/\n*.log\n")
+    write(root / "package.json", json.dumps({
+        "name": "synthetic", "private": True,
+        "dependencies": {"react": "18", "next": "14", "clsx": "2"},
+    }))
+    write(root / "tsconfig.json", json.dumps({"compilerOptions": {"paths": {"@/*": ["./src/*"]}}}))
+    write(root / "src/lib/utils.ts",
+          'import { clsx } from "clsx";\nexport function cn(...a: any[]) { return clsx(a); }\n')
+
+    budget_nm = int(files * node_modules_share)
+    budget_src = max(files - budget_nm, len(DESIGN_SYSTEM_FILES) + 10)
+
+    # node_modules: deep package trees the auditor must never enter
+    written = 0
+    pkg = 0
+    while written < budget_nm:
+        base = root / "node_modules" / f"pkg-{pkg}"
+        for depth in range(node_modules_depth):
+            base = base / ("node_modules" if depth % 2 else "lib") / f"dep-{depth}"
+            for i in range(5):
+                if written >= budget_nm:
+                    break
+                write(base / f"index-{i}.js", f"module.exports = {i};\n")
+                written += 1
+        pkg += 1
+    counts["node_modules"] = written
+
+    # Design-system root files for DesignSystemAutomator to reorganize
+    ds = root / "src/design-system"
+    for name in DESIGN_SYSTEM_FILES:
+        write(ds / name, _component_source(rng, name[:-4], []).replace(
+            '"@/lib/utils"', '"./utils"'))
+        counts["design_system"] += 1
+    write(ds / "tokens/index.ts", "export const colors = { primary: '#000' };\n")
+    for folder in ("primitives", "glass-components", "navigation", "visual", "utils"):
+        write(ds / folder / "index.ts", "export {};\n")
+    (ds / "legacy" / "empty").mkdir(parents=True, exist_ok=True)
+    counts["empty_dirs"] += 1
+    # Folders whose only content is ignored are not empty and must not be
+    # reported for removal
+    write(root / "src/vendor/node_modules/shim/index.js", "module.exports = {};\n")
+    write(root / "logs/debug.log", "started\n")
+
+    # Components, with index.ts barrels and some byte-identical copies
+    made: List[str] = []
+    remaining = budget_src - counts["design_system"]
+    app_share = max(1, remaining // 10)
+    component_budget = remaining - app_share
+    per_folder = 20
+    folder_index = 0
+    while component_budget > 0:
+        group = COMPONENT_GROUPS[folder_index % len(COMPONENT_GROUPS)]
+        folder = root / "src/components" / group / f"set-{folder_index}"
+        names = []
+        for i in range(min(per_folder, component_budget - 1) or 1):
+            name = f"C{folder_index}x{i}"
+            imports = [f"@/components/{p}" for p in rng.sample(made, min(2, len(made)))]
+            if rng.random() < 0.01:
+                imports.append("./DoesNotExist")
+                counts["broken_imports"] += 1
+            if made and rng.random() < 0.02:
+                source = (root / "src/components" / (made[-1] + ".tsx")).read_text(encoding="utf-8")
+                counts["duplicates"] += 1
+            else:
+                source = _component_source(rng, name, imports)
+            write(folder / f"{name}.tsx", source)
+            names.append(name)
+            made.append(f"{group}/set-{folder_index}/{name}")
+            component_budget -= 1
+        write(folder / "index.ts", "".join(f'export * from "./{n}";\n' for n in names))
+        counts["barrels"] += 1
+        component_budget -= 1
+        folder_index += 1
+    counts["components"] = len(made)
+
+    # App routes importing through barrels
+    for i in range(app_share):
+        route = root / "src/app" / f"route-{i // 2}"
+        kind = "page" if i % 2 == 0 else "layout"
+        target = rng.choice(made).rsplit("/", 1)[0] if made else "ui"
+        write(route / f"{kind}.tsx",
+              f'import * as C from "@/components/{target}";\n'
+              f"export default function Page() {{ return null; }}\n")
+        counts["app"] += 1
+    return counts
+
+
+# ---------------------------------------------------------------------------
+# Runs (each in a fresh child process so peak RSS is per run)
+# ---------------------------------------------------------------------------
+
+def _load_unified_exports():
+    spec = importlib.util.spec_from_file_location(
+        "create_unified_exports", SCRIPTS_DIR / "create-unified-exports.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def child_run(tree: Path, cache_dir: Optional[Path]) -> Dict:
+    """Measure every step against `tree`; runs inside the child process"""
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    from audit_metrics import PhaseRecorder
+    recorder = PhaseRecorder()
+    os.chdir(tree)
+    sink = io.StringIO()
+    with contextlib.redirect_stdout(sink):
+        with recorder.phase("import"):
+            from audit import AUDIT_PHASES, ARCOAuditor
+            from audit_cache import open_cache
+            from design_system_automation import DesignSystemAutomator
+
+        cache = open_cache(tree, cache_dir) if cache_dir else None
+        auditor = ARCOAuditor(tree, cache=cache)
+        with recorder.phase("audit.snapshot"):
+            auditor.snapshot
+        with recorder.phase("audit.content"):
+            auditor._scan_sources()
+        results = {}
+        for name in AUDIT_PHASES:
+            with recorder.phase(f"audit.{name}"):
+                results[name] = getattr(auditor, name)()
+                sink.seek(0)
+                sink.truncate()
+        with recorder.phase("audit.close"):
+            auditor.close()
+
+        automator = DesignSystemAutomator()
+        for name in AUTOMATOR_STEPS:
+            with recorder.phase(f"design_system.{name}"):
+                getattr(automator, name)()
+
+        unified = _load_unified_exports()
+        with recorder.phase("create_unified_exports"):
+            unified.create_unified_exports()
+    checks = {"empty_dirs": len(results["find_empty_folders"])}
+    return {"phases": recorder.as_dicts(), "checks": checks}
+
+
+def run_in_child(tree: Path, cache_dir: Optional[Path]) -> Dict:
+    cmd = [sys.executable, str(Path(__file__).resolve()), "--child", str(tree)]
+    if cache_dir:
+        cmd += ["--cache-dir", str(cache_dir)]
+    out = subprocess.run(cmd, check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=SCRIPTS_DIR, check=True,
+                              capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def benchmark(scales: List[int], workdir: Optional[Path], node_modules_depth: int,
+              seed: int, keep: bool) -> Dict:
+    results = {
+        "version": RESULT_VERSION,
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "seed": seed,
+        "runs": [],
+        # Audit results that disagree with what the synthetic tree contains
+        "failures": [],
+    }
+    base = Path(tempfile.mkdtemp(prefix="arco-bench-", dir=workdir))
+    try:
+        for files in scales:
+            scenario = f"files={files}"
+            pristine = base / f"tree-{files}"
+            started = time.perf_counter()
+            counts = generate_tree(pristine, files, node_modules_depth, seed=seed)
+            generated = time.perf_counter() - started
+            print(f"🏗️  {scenario}: generated in {generated:.1f}s {counts}", file=sys.stderr)
+
+            cache_dir = base / f"cache-{files}"
+            for label in ("cold", "warm"):
+                # The automator rewrites the tree, so every run gets a fresh copy
+                # at the same path (the cache is keyed on absolute paths)
+                tree = base / f"run-{files}"
+                shutil.copytree(pristine, tree, symlinks=True)
+                run = run_in_child(tree, cache_dir)
+                run.update({"scenario": scenario, "files": files, "cache": label, "tree": counts})
+                for name, found in run["checks"].items():
+                    if found != counts[name]:
+                        results["failures"].append(
+                            f"{scenario} [{label}]: audit found {found} {name}, "
+                            f"tree has {counts[name]}")
+                results["runs"].append(run)
+                total = sum(p["wall_s"] for p in run["phases"])
+                print(f"⏱️  {scenario} [{label}]: {total:.2f}s", file=sys.stderr)
+                shutil.rmtree(tree, ignore_errors=True)
+            if not keep:
+                shutil.rmtree(pristine, ignore_errors=True)
+    finally:
+        if not keep:
+            shutil.rmtree(base, ignore_errors=True)
+        else:
+            print(f"📁 Trees kept in {base}", file=sys.stderr)
+    return results
+
+
+def print_table(results: Dict, baseline: Optional[Dict] = None) -> None:
+    index = {}
+    if baseline:
+        for run in baseline.get("runs", []):
+            for phase in run["phases"]:
+                index[(run["scenario"], run["cache"], phase["name"])] = phase
+    for run in results["runs"]:
+        print(f"\n📊 {run['scenario']} [{run['cache']} cache]")
+        print(f"{'phase':<48}{'wall ms':>10}{'cpu ms':>10}{'opened':>9}{'dirs':>8}{'read KB':>10}{'rss MB':>9}"
+              + (f"{'Δ wall':>9}" if baseline else ""))
+        for phase in run["phases"]:
+            row = (f"{phase['name']:<48}{phase['wall_s'] * 1000:>10.1f}{phase['cpu_s'] * 1000:>10.1f}"
+                   f"{phase['files_opened']:>9}{phase['dirs_listed']:>8}"
+                   f"{phase['bytes_read'] // 1024:>10}{phase['peak_rss_kb'] / 1024:>9.1f}")
+            old = index.get((run["scenario"], run["cache"], phase["name"]))
+            if old and old["wall_s"] > 0:
+                row += f"{(phase['wall_s'] / old['wall_s'] - 1) * 100:>+8.0f}%"
+            elif baseline:
+                row += f"{'new':>9}"
+            print(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the ARCO maintenance scripts")
+    parser.add_argument("--files", type=int, action="append",
+                        help="synthetic tree size; repeat for several scales (default: 1000)")
+    parser.add_argument("--node-modules-depth", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--workdir", type=Path, default=None, help="where trees are generated")
+    parser.add_argument("--keep", action="store_true", help="keep generated trees")
+    parser.add_argument("--out", type=Path, default=None, help="write results JSON here")
+    parser.add_argument("--compare", type=Path, default=None, help="baseline results JSON")
+    parser.add_argument("--child", type=Path, default=None, help=argparse.SUPPRESS)
+    parser.add_argument("--cache-dir", type=Path, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(child_run(args.child, args.cache_dir)))
+        return
+
+    results = benchmark(args.files or [1000], args.workdir, args.node_modules_depth,
+                        args.seed, args.keep)
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+    print_table(results, baseline)
+    if args.out:
+        args.out.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\n💾 Results written to {args.out}")
+    for failure in results["failures"]:
+        print(f"❌ CHECK: {failure}", file=sys.stderr)
+    if results["failures"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Cleanup removal rules
+Compiles every removal and allow-list glob into one regex, so each entry of
+the tree is classified with a single match during one traversal
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from content_rules import DEFAULT_RULES_PATH
+from repo_walker import glob_regex
+
+
+class CleanupRule(NamedTuple):
+    id: str
+    # gitignore-style globs: '/' anchors at the root, a trailing '/' matches
+    # directories only, '*' never crosses a path segment
+    patterns: Sequence[str]
+    message: str = ""
+    # Allow rules keep matching entries out of the plan whatever else matches
+    allow: bool = False
+
+
+class RemovalCandidate(NamedTuple):
+    path: str
+    rule: str
+    pattern: str
+    is_dir: bool
+
+
+# Used when content-rules.json does not define a "cleanup" section. Words
+# like "old", "backup" or "copy" only count as a whole part of a name
+# delimited by a space, dot, dash or underscore, so "bold.tsx",
+# "HoldOld.ts" or "CloudBackup.tsx" never match.
+DEFAULT_CLEANUP_RULES = [
+    CleanupRule("test-suites", ["tests/", "__tests__/", "__mocks__/", "**/tests/**",
+                                "**/__tests__/**", "**/__mocks__/**", "*.test.*", "*.spec.*"],
+                allow=True),
+    CleanupRule("backup-file", ["*.bak", "*.orig", "*.swp", "*~", "*.backup"],
+                "Editor or merge backup file"),
+    CleanupRule("backup-copy", ["backup/", "backups/", "*[ ._-]backup.*", "*[ ._-]backup",
+                                "backup[._-]*", "*[ ._-]old.*", "*[ ._-]old", "old[._-]*",
+                                "old/", "* copy.*", "* copy [0-9]*.*"],
+                "Backup or superseded copy of another file"),
+    CleanupRule("temp-file", ["*.tmp", "*.temp", "tmp/", "temp/", "*[._-]tmp.*",
+                              "*[._-]temp.*", "tmp[._-]*"],
+                "Temporary file"),
+    CleanupRule("stray-test", ["test[._-]*", "*[._-]test.*", "*[._-]test"],
+                "Ad-hoc test script outside a test suite"),
+]
+
+
+class CleanupRules:
+    """Compiled removal / allow rules
+
+    Every glob becomes a group of one alternation with allow-list globs
+    first, so the first alternative that matches decides: an allow glob
+    keeps the entry, otherwise the earliest listed removal rule names it.
+    Directory-only globs live in a second regex consulted for directories.
+    """
+
+    def __init__(self, rules: Sequence[CleanupRule]):
+        self.rules = list(rules)
+        ordered = [r for r in self.rules if r.allow] + [r for r in self.rules if not r.allow]
+        file_parts: List[Tuple[str, CleanupRule, str]] = []
+        dir_parts: List[Tuple[str, CleanupRule, str]] = []
+        for rule in ordered:
+            for pattern in rule.patterns:
+                regex, dir_only = glob_regex(pattern)
+                dir_parts.append((regex, rule, pattern))
+                if not dir_only:
+                    file_parts.append((regex, rule, pattern))
+        self._file_re, self._file_rules = self._build(file_parts)
+        self._dir_re, self._dir_rules = self._build(dir_parts)
+
+    @staticmethod
+    def _build(parts):
+        if not parts:
+            return None, []
+        # Character classes never add groups, so group k is parts[k - 1]
+        regex = re.compile("|".join(f"({regex})" for regex, _, _ in parts))
+        return regex, [(rule, pattern) for _, rule, pattern in parts]
+
+    @classmethod
+    def load(cls, path=DEFAULT_RULES_PATH, section: str = "cleanup") -> "CleanupRules":
+        """Rules from one section of a JSON config file, else DEFAULT_CLEANUP_RULES"""
+        path = Path(path)
+        entries = None
+        if path.is_file():
+            entries = json.loads(path.read_text(encoding="utf-8")).get(section)
+        if entries is None:
+            return cls(DEFAULT_CLEANUP_RULES)
+        return cls([CleanupRule(**entry) for entry in entries])
+
+    def match(self, rel_path: str, is_dir: bool = False) -> Optional[Tuple[CleanupRule, str]]:
+        """(removal rule, glob) for a root-relative posix path, None if kept"""
+        if is_dir:
+            regex, rules = self._dir_re, self._dir_rules
+        else:
+            regex, rules = self._file_re, self._file_rules
+        if regex is None:
+            return None
+        m = regex.match(rel_path)
+        if m is None:
+            return None
+        rule, pattern = rules[m.lastindex - 1]
+        return None if rule.allow else (rule, pattern)
+
+    def classify(self, root, entries: Iterable[Tuple[str, bool]]) -> List[RemovalCandidate]:
+        """Removal candidates among (path, is_dir) entries in top-down order
+
+        Entries below a candidate directory are not listed again, since
+        removing the directory removes them too.
+        """
+        root = str(root)
+        covered = set()
+        candidates = []
+        for path, is_dir in entries:
+            if os.path.dirname(path) in covered:
+                if is_dir:
+                    covered.add(path)
+                continue
+            rel = os.path.relpath(path, root).replace(os.sep, "/")
+            found = self.match(rel, is_dir)
+            if found is None:
+                continue
+            rule, pattern = found
+            candidates.append(RemovalCandidate(path, rule.id, pattern, is_dir))
+            if is_dir:
+                covered.add(path)
+        return candidates
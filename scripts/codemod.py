@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Batched codemod engine
+Applies a RuleSet to every source file under a root in one combined regex pass
+per file, on the shared reader pool, with dry-run diffs and atomic writes
+"""
+
+import argparse
+import contextlib
+import difflib
+import functools
+import os
+import stat
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from content_pipeline import ScanItem, scan_files
+from content_rules import DEFAULT_RULES_PATH, RuleSet
+from repo_walker import IgnoreMatcher, find_repo_root, scan
+
+CODEMOD_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+
+
+class Rewrite(NamedTuple):
+    """Worker output for a file the rules changed"""
+    data: bytes
+    counts: Counter
+    diff: Optional[str]
+
+
+class CodemodReport(NamedTuple):
+    scanned: int
+    changed: List[str]
+    diffs: List[str]
+    counts: Counter
+    errors: List[Tuple[str, str]]
+    skipped: Dict[str, List[str]]
+
+
+def rewrite_source(item: ScanItem, buffer, rules: Dict[str, RuleSet], rel_paths: Dict[str, str],
+                   diff: bool) -> Optional[Rewrite]:
+    """Worker-side: rewritten bytes (and diff) for one file, None when unchanged
+
+    Decoding is strict and bytes are used as-is, so CRLF files keep their line
+    endings and undecodable files are reported instead of mangled.
+    """
+    original = bytes(buffer).decode("utf-8")
+    counts: Counter = Counter()
+    updated = rules[item.path].apply(original, counts)
+    if updated == original:
+        return None
+    patch = None
+    if diff:
+        rel = rel_paths[item.path]
+        patch = "".join(difflib.unified_diff(
+            original.splitlines(keepends=True), updated.splitlines(keepends=True),
+            fromfile=f"a/{rel}", tofile=f"b/{rel}",
+        ))
+    return Rewrite(updated.encode("utf-8"), counts, patch)
+
+
+def atomic_write(path: str, data: bytes, expected: Optional[Tuple[int, int]] = None) -> None:
+    """Replace path with data via a temp file + rename
+
+    Readers (dev servers, editors) see either the old or the new file, never
+    a partial one. With expected=(size, mtime_ns), refuses when the file
+    changed since it was read.
+    """
+    st = os.stat(path)
+    if expected is not None and (st.st_size, st.st_mtime_ns) != tuple(expected):
+        raise OSError(f"{path} changed while the codemod ran")
+    directory, name = os.path.split(path)
+    fd, tmp = tempfile.mkstemp(prefix=f".{name}.", suffix=".codemod", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp, stat.S_IMODE(st.st_mode))
+        os.replace(tmp, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp)
+        raise
+
+
+def run_codemod(root, rules: RuleSet, dry_run: bool = False, diff: Optional[bool] = None,
+                extensions=CODEMOD_EXTENSIONS, matcher: Optional[IgnoreMatcher] = None,
+                workers: Optional[int] = None) -> CodemodReport:
+    """Apply rules to every non-ignored source file under root
+
+    Rule `paths` globs are matched against paths relative to the repo root
+    (the matcher's root), so one rule file can scope rules to folders. Files
+    are read and rewritten on the content_pipeline pool; changed files are
+    written atomically unless dry_run. diff defaults to dry_run.
+    """
+    matcher = matcher or IgnoreMatcher.from_repo(find_repo_root(Path(root)))
+    diff = dry_run if diff is None else diff
+    items: List[ScanItem] = []
+    file_rules: Dict[str, RuleSet] = {}
+    rel_paths: Dict[str, str] = {}
+    errors: List[Tuple[str, str]] = []
+    for _, _, files in scan(Path(root).resolve(), matcher):
+        for entry in files:
+            if not entry.name.endswith(extensions):
+                continue
+            rel = os.path.relpath(entry.path, matcher.root).replace(os.sep, "/")
+            subset = rules.for_path(rel)
+            if not subset:
+                continue
+            try:
+                st = entry.stat()
+            except OSError as exc:
+                errors.append((entry.path, f"{type(exc).__name__}: {exc}"))
+                continue
+            items.append(ScanItem(entry.path, st.st_size, st.st_mtime_ns))
+            file_rules[entry.path] = subset
+            rel_paths[entry.path] = rel
+
+    worker = functools.partial(rewrite_source, rules=file_rules, rel_paths=rel_paths, diff=diff)
+    changed: List[str] = []
+    diffs: List[str] = []
+    counts: Counter = Counter()
+    skipped: Dict[str, List[str]] = {}
+    for result in scan_files(items, worker, workers=workers):
+        if result.error:
+            errors.append((result.path, result.error))
+            continue
+        if result.skipped:
+            skipped.setdefault(result.skipped, []).append(result.path)
+            continue
+        rewrite = result.value
+        if rewrite is None:
+            continue
+        if not dry_run:
+            try:
+                atomic_write(result.path, rewrite.data, (result.size, result.mtime_ns))
+            except OSError as exc:
+                errors.append((result.path, f"{type(exc).__name__}: {exc}"))
+                continue
+        changed.append(result.path)
+        counts.update(rewrite.counts)
+        if rewrite.diff:
+            diffs.append(rewrite.diff)
+    return CodemodReport(len(items), changed, diffs, counts, errors, skipped)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Apply content-rule replacements across a tree")
+    parser.add_argument("root", nargs="?", default="src",
+                        help="directory to rewrite (default: src)")
+    parser.add_argument("--rules", type=Path, default=DEFAULT_RULES_PATH,
+                        help="rule config (JSON)")
+    parser.add_argument("--section", default="fix_imports",
+                        help="rule section to apply (default: fix_imports)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="print a unified diff instead of writing files")
+    parser.add_argument("--workers", type=int, default=None, help="reader threads")
+    args = parser.parse_args(argv)
+
+    rules = RuleSet.load(args.rules, section=args.section)
+    if not rules:
+        print(f"no rules in section {args.section!r} of {args.rules}", file=sys.stderr)
+        return 1
+    report = run_codemod(args.root, rules, dry_run=args.dry_run, workers=args.workers)
+    for patch in report.diffs:
+        sys.stdout.write(patch)
+    out = sys.stderr if args.dry_run else sys.stdout
+    verb = "would change" if args.dry_run else "changed"
+    print(f"{report.scanned} files scanned, {len(report.changed)} {verb}", file=out)
+    for rule_id, count in sorted(report.counts.items()):
+        print(f"  {rule_id}: {count} replacement(s)", file=out)
+    for path, error in report.errors:
+        print(f"⚠️  {path}: {error}", file=sys.stderr)
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Multi-pattern content rules
+Every configured pattern is compiled into one alternation regex, so a file is
+scanned once no matter how many rules are loaded
+"""
+
+import hashlib
+import json
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from repo_walker import glob_regex
+
+DEFAULT_RULES_PATH = Path(__file__).with_name("content-rules.json")
+# Group references of an re.sub template; three octal digits are an escape
+_TEMPLATE_REF = re.compile(r"\\(?:g<(\d+)>|[0-7]{3}|([1-9]\d?)|.)", re.S)
+
+
+class Rule(NamedTuple):
+    id: str
+    pattern: str
+    regex: bool = False
+    message: str = ""
+    replacement: Optional[str] = None
+    # Root-relative '/'-separated globs the rule is limited to (see for_path);
+    # gitignore-style, so '*' stays within one path segment
+    paths: Optional[Sequence[str]] = None
+
+    def source(self) -> str:
+        return self.pattern if self.regex else re.escape(self.pattern)
+
+
+class RuleHit(NamedTuple):
+    rule: str
+    line: int
+    column: int
+    text: str
+
+
+class RuleSet:
+    """Compiled rule collection
+
+    Rules become named groups of a single regex (first listed rule wins when
+    two match at the same offset). Patterns may use numbered groups and
+    backreferences in their replacement; named groups are reserved.
+    Replacements are expanded from the combined match itself, with group
+    references shifted to the rule's place in the alternation.
+    scan() and apply() run every rule; for_path() narrows the set to the
+    rules whose `paths` globs match a file.
+    """
+
+    def __init__(self, rules: Sequence[Rule]):
+        self.rules = list(rules)
+        self._by_group: Dict[str, Rule] = {}
+        own_groups: Dict[str, int] = {}
+        parts = []
+        for index, rule in enumerate(self.rules):
+            own = re.compile(rule.source(), re.M)
+            if own.groupindex:
+                raise ValueError(f"rule {rule.id!r}: named groups are not supported")
+            group = f"r{index}"
+            self._by_group[group] = rule
+            own_groups[group] = own.groups
+            # Numbered groups are renumbered inside the alternation, so
+            # backreferences in the pattern itself would break
+            parts.append(f"(?P<{group}>{rule.source()})")
+        self._regex = re.compile("|".join(parts), re.M) if parts else None
+        self._templates: Dict[str, str] = {
+            group: self._shift_template(rule, self._regex.groupindex[group], own_groups[group])
+            for group, rule in self._by_group.items() if rule.replacement is not None
+        }
+        self.fingerprint = hashlib.blake2b(
+            json.dumps([list(r) for r in self.rules]).encode("utf-8"), digest_size=8
+        ).hexdigest()
+        self._scopes = [
+            re.compile("|".join(glob_regex(p)[0] for p in rule.paths)) if rule.paths else None
+            for rule in self.rules
+        ]
+        self._subsets: Dict[Tuple[int, ...], "RuleSet"] = {}
+
+    @staticmethod
+    def _shift_template(rule: Rule, offset: int, groups: int) -> str:
+        """rule.replacement with group n renumbered to offset + n (0 = the whole match)"""
+        def shift(m: "re.Match") -> str:
+            ref = m.group(1) or m.group(2)
+            if ref is None:
+                return m.group()
+            if int(ref) > groups:
+                raise ValueError(f"rule {rule.id!r}: invalid group reference {ref}")
+            return f"\\g<{offset + int(ref)}>"
+
+        return _TEMPLATE_REF.sub(shift, rule.replacement)
+
+    @classmethod
+    def load(cls, path=DEFAULT_RULES_PATH, section: str = "audit") -> "RuleSet":
+        """Rules from one section of a JSON config file; empty if the file is missing"""
+        path = Path(path)
+        if not path.is_file():
+            return cls([])
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls([Rule(**entry) for entry in data.get(section, [])])
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def for_path(self, rel_path: str) -> "RuleSet":
+        """Rules applying to one root-relative path, compiled once per distinct subset"""
+        if not any(self._scopes):
+            return self
+        key = tuple(i for i, scope in enumerate(self._scopes)
+                    if scope is None or scope.match(rel_path))
+        subset = self._subsets.get(key)
+        if subset is None:
+            subset = self._subsets[key] = RuleSet([self.rules[i] for i in key])
+        return subset
+
+    def scan(self, text: str) -> List[RuleHit]:
+        """Every rule hit in one pass, with 1-based line and column"""
+        if self._regex is None:
+            return []
+        hits = []
+        line, line_start, pos = 1, 0, 0
+        for m in self._regex.finditer(text):
+            start = m.start()
+            newlines = text.count("\n", pos, start)
+            if newlines:
+                line += newlines
+                line_start = text.rfind("\n", 0, start) + 1
+            pos = start
+            rule = self._by_group[m.lastgroup]
+            hits.append(RuleHit(rule.id, line, start - line_start + 1, m.group()))
+        return hits
+
+    def apply(self, text: str, counts: Optional[Counter] = None) -> str:
+        """One substitution pass applying every rule that has a replacement
+
+        counts, when given, is incremented per rule id for every replacement.
+        """
+        if self._regex is None:
+            return text
+
+        def replace(m: "re.Match") -> str:
+            rule = self._by_group[m.lastgroup]
+            if rule.replacement is None:
+                return m.group()
+            if counts is not None:
+                counts[rule.id] += 1
+            return m.expand(self._templates[m.lastgroup])
+
+        return self._regex.sub(replace, text)
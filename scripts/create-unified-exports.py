@@ -7,46 +7,20 @@ Creates unified exports and clean architecture
 import os
 from pathlib import Path
 
-def create_unified_exports():
-    print("🎯 CREATING UNIFIED DESIGN SYSTEM EXPORTS")
-    print("=" * 50)
-    
-    base = Path(".")
-    src = base / "src"
-    ds_path = src / "design-system"
-    
-    # Create unified design-system index.ts
-    unified_index = """/**
+from import_graph import RESOLVE_EXTENSIONS, ExportIndex, ModuleResolver
+from repo_walker import IgnoreMatcher, iter_dir, iter_files
+
+UNIFIED_HEADER = """/**
  * 🎯 ARCO Design System - Unified Exports
  * Single source of truth for all design components
+ *
+ * Generated by scripts/create-unified-exports.py: every name is re-exported
+ * straight from the module that declares it, so importing one component does
+ * not pull whole export * chains into the bundle.
  */
+"""
 
-// Core Primitives (from primitives/)
-export * from './primitives';
-
-// Complex UI Components (from ../components/ui/)
-export * from '../components/ui';
-
-// Layout System (from ../components/layout/)
-export * from '../components/layout';
-
-// Design Tokens & Foundations
-export * from './foundations';
-export * from './core';
-
-// Glass Components (ARCO signature style)
-export * from './glass-components';
-export * from './glass-foundation';
-
-// Navigation Components
-export * from './navigation';
-
-// Visual Components
-export * from './visual';
-
-// Utilities
-export * from './utils';
-
+UNIFIED_FOOTER = """
 /**
  * 🏗️ ARCHITECTURE PRINCIPLES:
  * 
@@ -62,48 +36,159 @@ export * from './utils';
  * ```
  */
 """
+
+# (section comment, barrels whose exports the section re-exports)
+UNIFIED_SECTIONS = [
+    ("Core Primitives (from primitives/)", ["./primitives"]),
+    ("Complex UI Components (from ../components/ui/)", ["../components/ui"]),
+    ("Layout System (from ../components/layout/)", ["../components/layout"]),
+    ("Design Tokens & Foundations", ["./foundations", "./core"]),
+    ("Glass Components (ARCO signature style)", ["./glass-components", "./glass-foundation"]),
+    ("Navigation Components", ["./navigation"]),
+    ("Visual Components", ["./visual"]),
+    ("Utilities", ["./utils"]),
+]
+
+PRIMITIVES_HEADER = """/**
+ * 🎯 Design System Primitives
+ * Core building blocks
+ */
+"""
+
+PRIMITIVES_SECTIONS = [
+    ("Export all primitive components", ["./Button", "./Typography", "./Card", "./Input"]),
+]
+
+MAX_LINE = 100
+
+
+def write_if_changed(path, content):
+    """Write only when the content differs, so dev servers don't rebuild for nothing"""
+    path = Path(path)
+    try:
+        if path.read_text(encoding='utf-8') == content:
+            return False
+    except OSError:
+        pass
+    path.write_text(content, encoding='utf-8')
+    return True
+
+
+def module_specifier(from_dir, target):
+    """Relative import specifier for target, without extension or /index"""
+    rel = os.path.relpath(target, from_dir).replace(os.sep, '/')
+    for ext in sorted(RESOLVE_EXTENSIONS, key=len, reverse=True):
+        if rel.endswith(ext):
+            rel = rel[:-len(ext)]
+            break
+    if rel.endswith('/index'):
+        rel = rel[:-len('/index')]
+    return rel if rel.startswith('.') else './' + rel
+
+
+def export_statement(keyword, items, specifier):
+    line = f"{keyword} {{ {', '.join(items)} }} from '{specifier}';"
+    if len(line) <= MAX_LINE:
+        return line
+    body = ''.join(f"  {item},\n" for item in items)
+    return f"{keyword} {{\n{body}}} from '{specifier}';"
+
+
+def render_barrel(index, barrel_path, sections):
+    """Explicit named re-exports for a barrel, plus its fan-out before/after
+
+    Each name listed by the section barrels is traced to its declaring module
+    (ExportIndex follows export * and named re-exports). Names already taken
+    by an earlier barrel are skipped, as export * would make them ambiguous.
+    """
+    barrel_path = str(barrel_path)
+    from_dir = os.path.dirname(barrel_path)
+    claimed = {}
+    chained, origins = set(), set()
+    blocks = []
+    for comment, specifiers in sections:
+        lines = []
+        for spec in specifiers:
+            target = index.resolver.resolve(barrel_path, spec)[0]
+            if target is None:
+                print(f"⚠️  {spec}: module not found, skipped")
+                continue
+            chained |= index.fan_out(target)
+            by_origin = {}
+            for name, origin in sorted(index.exports(target).items()):
+                if name == 'default' or origin.path == barrel_path:
+                    continue
+                if name in claimed:
+                    print(f"⚠️  {spec}: '{name}' already exported from "
+                          f"{claimed[name]}, skipped")
+                    continue
+                claimed[name] = spec
+                item = name if origin.name == name else f"{origin.name} as {name}"
+                values, types = by_origin.setdefault(origin.path, ([], []))
+                (types if origin.is_type else values).append(item)
+            print(f"   📦 {spec}: {sum(len(v) + len(t) for v, t in by_origin.values())} names, "
+                  f"fan-out {len(index.fan_out(target))} module(s)")
+            for origin_path in sorted(by_origin):
+                origins.add(origin_path)
+                values, types = by_origin[origin_path]
+                origin_spec = module_specifier(from_dir, origin_path)
+                if values:
+                    lines.append(export_statement("export", values, origin_spec))
+                if types:
+                    lines.append(export_statement("export type", types, origin_spec))
+        if lines:
+            blocks.append(f"// {comment}\n" + "\n".join(lines) + "\n")
+    return "\n".join(blocks), len(chained), len(origins)
+
+
+def create_unified_exports():
+    print("🎯 CREATING UNIFIED DESIGN SYSTEM EXPORTS")
+    print("=" * 50)
     
-    # Write unified index
-    index_path = ds_path / "index.ts"
-    with open(index_path, 'w', encoding='utf-8') as f:
-        f.write(unified_index)
-    
-    print(f"✅ Created unified index: {index_path}")
+    base = Path(".")
+    root = base.resolve()
+    src = root / "src"
+    ds_path = src / "design-system"
+    matcher = IgnoreMatcher.from_repo(root)
+    files = set()
+    if src.exists():
+        files = {str(path) for path in iter_files(src, RESOLVE_EXTENSIONS, matcher)}
+    index = ExportIndex(ModuleResolver(root, files))
     
-    # Create clean primitives index if not exists
+    # Create clean primitives index if not exists (first: the unified index reads it)
     primitives_path = ds_path / "primitives"
     if primitives_path.exists():
         prim_index = primitives_path / "index.ts"
         if not prim_index.exists():
-            primitives_exports = """/**
- * 🎯 Design System Primitives
- * Core building blocks
- */
-
-// Export all primitive components
-export * from './Button';
-export * from './Typography';
-export * from './Card';
-export * from './Input';
-
-// Add more primitives as they're created
-"""
-            with open(prim_index, 'w', encoding='utf-8') as f:
-                f.write(primitives_exports)
+            body, _, _ = render_barrel(index, prim_index, PRIMITIVES_SECTIONS)
+            write_if_changed(prim_index, PRIMITIVES_HEADER + "\n" + body)
+            files.add(str(prim_index))
             print(f"✅ Created primitives index: {prim_index}")
     
+    # Create unified design-system index.ts
+    index_path = ds_path / "index.ts"
+    body, chained, direct = render_barrel(index, index_path, UNIFIED_SECTIONS)
+    unified_index = UNIFIED_HEADER + "\n" + body + UNIFIED_FOOTER
+    print(f"📉 Barrel fan-out: {chained} modules through export * chains, "
+          f"{direct} with explicit re-exports")
+    
+    if write_if_changed(index_path, unified_index):
+        print(f"✅ Created unified index: {index_path}")
+    else:
+        print(f"✅ Unified index up to date: {index_path}")
+    
     # Verify structure
     print("\n📋 FINAL DESIGN SYSTEM STRUCTURE:")
     print("-" * 30)
     
     if ds_path.exists():
-        for item in sorted(ds_path.iterdir()):
+        for item in sorted(iter_dir(ds_path, matcher), key=lambda e: e.name):
             if item.is_dir():
                 print(f"📁 {item.name}/")
                 # Show contents of key folders
                 if item.name in ['primitives', 'components']:
-                    for subitem in sorted(item.iterdir()):
-                        if subitem.suffix in ['.tsx', '.ts']:
+                    for subitem in sorted(iter_dir(item.path, matcher), key=lambda e: e.name):
+                        if subitem.name.endswith(('.tsx', '.ts')):
                             print(f"   📄 {subitem.name}")
             else:
                 print(f"📄 {item.name}")
@@ -4,17 +4,26 @@ Design System Automation Script
 Automatiza operações repetitivas no sistema de design S-Tier
 """
 
+import argparse
 import os
-import re
-import shutil
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from codemod import CodemodReport, run_codemod
+from content_rules import DEFAULT_RULES_PATH, RuleSet
+from move_plan import ImportIndex, MovePlan, apply_plan
+from repo_walker import IgnoreMatcher, iter_files
+
+
 class DesignSystemAutomator:
     """Automatiza operações do sistema de design"""
     
-    def __init__(self, base_path: str = "src/design-system"):
+    def __init__(self, base_path: str = "src/design-system", rules_path: Path = DEFAULT_RULES_PATH):
         self.base_path = Path(base_path)
+        self.matcher = IgnoreMatcher.from_repo()
+        self.rules_path = Path(rules_path)
+        # Única fonte das regras de imports: a seção "fix_imports" do arquivo
+        self.import_rules = RuleSet.load(rules_path, section="fix_imports")
         self.atomic_structure = {
             "foundations": ["tokens.ts", "index.ts"],
             "atoms": ["Button.tsx", "Badge.tsx", "Avatar.tsx", "Typography.tsx"],
@@ -23,8 +32,14 @@ class DesignSystemAutomator:
             "templates": ["Layout.tsx"]
         }
     
-    def reorganize_components(self) -> None:
-        """Reorganiza componentes na estrutura atômica"""
+    def reorganize_components(self, dry_run: bool = False) -> Optional[MovePlan]:
+        """Reorganiza componentes na estrutura atômica
+
+        Todos os movimentos viram um único plano: o índice reverso de imports
+        é montado uma vez e cada arquivo que importa um componente movido é
+        reescrito na mesma transação (com rollback se algo falhar). Retorna o
+        plano (None quando não há nada a mover).
+        """
         print("🔄 Reorganizando componentes...")
         
         # Mapear componentes por tipo
@@ -50,47 +65,65 @@ class DesignSystemAutomator:
             ]
         }
         
+        moves = []
         for category, components in component_mapping.items():
             category_path = self.base_path / category
-            category_path.mkdir(exist_ok=True)
+            if not dry_run:
+                category_path.mkdir(exist_ok=True)
             
             for component in components:
                 source = self.base_path / component
                 destination = category_path / component
                 
                 if source.exists() and not destination.exists():
-                    shutil.move(str(source), str(destination))
-                    print(f"✅ Movido {component} para {category}/")
+                    moves.append((source, destination))
+        
+        if not moves:
+            return None
+        
+        index = ImportIndex.build(self.base_path.parent, self.matcher)
+        plan = index.plan(moves)
+        for path, mapping in plan.rewrites.items():
+            for old, new in mapping.items():
+                print(f"✏️  {os.path.relpath(path)}: '{old}' → '{new}'")
+        
+        if dry_run:
+            for move in plan.moves:
+                print(f"🔍 Moveria {os.path.relpath(move.source)} → "
+                      f"{os.path.relpath(move.destination)}")
+            return plan
+        
+        apply_plan(plan, index)
+        for move in plan.moves:
+            print(f"✅ Movido {os.path.basename(move.source)} para "
+                  f"{os.path.basename(os.path.dirname(move.destination))}/")
+        return plan
     
-    def fix_imports(self) -> None:
-        """Corrige imports automaticamente"""
+    def fix_imports(self, dry_run: bool = False) -> Optional[CodemodReport]:
+        """Corrige imports automaticamente; None quando não há regras"""
         print("🔧 Corrigindo imports...")
         
-        # Padrões de import para corrigir
-        import_patterns = [
-            (r"from ['\"]\.\/utils['\"]", "from '../foundations'"),
-            (r"from ['\"]\.\/\.\.\/utils['\"]", "from '../foundations'"),
-            (r"from ['\"]@\/lib\/utils['\"]", "from '../foundations'"),
-        ]
+        if not self.import_rules:
+            print(f"⚠️  {self.rules_path} não define a seção \"fix_imports\"; "
+                  f"nenhum import foi reescrito")
+            return None
         
-        for folder in ["atoms", "molecules", "organisms", "templates"]:
-            folder_path = self.base_path / folder
-            if not folder_path.exists():
-                continue
-                
-            for tsx_file in folder_path.glob("*.tsx"):
-                content = tsx_file.read_text(encoding='utf-8')
-                original_content = content
-                
-                for pattern, replacement in import_patterns:
-                    content = re.sub(pattern, replacement, content)
-                
-                if content != original_content:
-                    tsx_file.write_text(content, encoding='utf-8')
-                    print(f"✅ Imports corrigidos em {tsx_file.name}")
+        # Uma passada por arquivo em todo src/; cada regra vale só para os
+        # caminhos do seu campo "paths" (content-rules.json)
+        report = run_codemod(self.base_path.parent, self.import_rules, dry_run=dry_run,
+                             matcher=self.matcher)
+        
+        for patch in report.diffs:
+            print(patch, end="")
+        for path in report.changed:
+            prefix = "🔍 Imports a corrigir em" if dry_run else "✅ Imports corrigidos em"
+            print(f"{prefix} {os.path.relpath(path)}")
+        for path, error in report.errors:
+            print(f"⚠️  {os.path.relpath(path)}: {error}")
+        return report
     
-    def generate_index_files(self) -> None:
-        """Gera arquivos index.ts centralizados"""
+    def generate_index_files(self, dry_run: bool = False) -> List[Path]:
+        """Gera arquivos index.ts centralizados; retorna os caminhos (re)escritos"""
         print("📝 Gerando arquivos index...")
         
         # Index principal do design system
@@ -134,8 +167,12 @@ export * from './templates';
         
         # Gerar index principal
         main_index_path = self.base_path / "index.ts"
-        main_index_path.write_text(main_index_content)
-        print("✅ Index principal gerado")
+        written = [main_index_path]
+        if dry_run:
+            print(f"🔍 Geraria {main_index_path}")
+        else:
+            main_index_path.write_text(main_index_content)
+            print("✅ Index principal gerado")
         
         # Gerar índices por categoria
         for category, exports in category_exports.items():
@@ -145,8 +182,13 @@ export * from './templates';
                 index_content += "\n".join(exports) + "\n"
                 
                 index_path = category_path / "index.ts"
+                written.append(index_path)
+                if dry_run:
+                    print(f"🔍 Geraria {index_path}")
+                    continue
                 index_path.write_text(index_content)
                 print(f"✅ Index de {category} gerado")
+        return written
     
     def validate_structure(self) -> Dict[str, List[str]]:
         """Valida integridade da estrutura"""
@@ -172,14 +214,14 @@ export * from './templates';
             issues["misplaced_files"] = [f.name for f in root_tsx_files]
         
         # Verificar imports quebrados (busca por padrões problemáticos)
-        for tsx_file in self.base_path.rglob("*.tsx"):
+        for tsx_file in iter_files(self.base_path, (".tsx",), self.matcher):
             content = tsx_file.read_text(encoding='utf-8')
             if "./utils" in content or "../utils" in content:
                 issues["broken_imports"].append(str(tsx_file.relative_to(self.base_path)))
         
         return issues
     
-    def generate_component_documentation(self) -> None:
+    def generate_component_documentation(self, dry_run: bool = False) -> Path:
         """Gera documentação automática dos componentes"""
         print("📚 Gerando documentação...")
         
@@ -256,27 +298,35 @@ export * from './templates';
 """
         
         doc_path = self.base_path.parent / "COMPONENTS_DOCUMENTATION.md"
+        if dry_run:
+            print(f"🔍 Geraria {doc_path}")
+            return doc_path
         doc_path.write_text(doc_content)
         print("✅ Documentação gerada")
+        return doc_path
     
-    def run_full_automation(self) -> None:
-        """Executa automação completa"""
+    def run_full_automation(self, dry_run: bool = False) -> Dict[str, List[str]]:
+        """Executa automação completa
+
+        Com dry_run nada é escrito: movimentos, imports e arquivos gerados
+        são só listados. Retorna as issues de validate_structure.
+        """
         print("🚀 Iniciando automação completa do Design System S-Tier\n")
         
         # Executar todas as operações
-        self.reorganize_components()
+        self.reorganize_components(dry_run)
         print()
         
-        self.fix_imports()
+        self.fix_imports(dry_run)
         print()
         
-        self.generate_index_files()
+        self.generate_index_files(dry_run)
         print()
         
         issues = self.validate_structure()
         print()
         
-        self.generate_component_documentation()
+        self.generate_component_documentation(dry_run)
         print()
         
         # Relatório final
@@ -291,16 +341,25 @@ export * from './templates';
         else:
             print("✅ ESTRUTURA VÁLIDA - Nenhuma issue encontrada")
         
+        if dry_run:
+            print("\n🔍 SIMULAÇÃO - nenhum arquivo foi alterado")
+            return issues
+        
         print("\n🎯 DESIGN SYSTEM S-TIER AUTOMATIZADO COM SUCESSO!")
         print("📁 Estrutura atômica organizada")
         print("🔧 Imports corrigidos")
         print("📝 Exports centralizados")
         print("📚 Documentação atualizada")
+        return issues
 
 def main():
     """Função principal"""
+    parser = argparse.ArgumentParser(description="Automação do Design System S-Tier")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="só mostra o que mudaria, sem escrever nada")
+    args = parser.parse_args()
     automator = DesignSystemAutomator()
-    automator.run_full_automation()
+    automator.run_full_automation(dry_run=args.dry_run)
 
 if __name__ == "__main__":
     main()
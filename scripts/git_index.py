@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Git index reader
+Parses .git/index (versions 2-4) directly, so tracked paths, sizes, mtimes and
+blob SHAs come from one sequential read instead of a directory walk
+"""
+
+import hashlib
+import os
+import re
+import struct
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+# ctime s/ns, mtime s/ns, dev, ino, mode, uid, gid, size, sha1, flags
+ENTRY_HEADER = struct.Struct(">10I20sH")
+EXTENDED_FLAG = 0x4000
+INTENT_TO_ADD = 0x2000
+SKIP_WORKTREE = 0x4000
+NAME_MASK = 0x0FFF
+STAGE_SHIFT = 12
+
+S_IFMT = 0o170000
+S_IFREG = 0o100000
+S_IFDIR = 0o040000
+
+
+class GitIndexError(ValueError):
+    """Index missing, corrupt, or in a layout this reader does not handle"""
+
+
+class IndexEntry(NamedTuple):
+    path: str  # worktree-relative, '/'-separated
+    mode: int
+    size: int  # truncated to 32 bits by git
+    mtime_ns: int
+    sha: str
+    stage: int
+    intent_to_add: bool
+    skip_worktree: bool
+
+    @property
+    def is_regular(self) -> bool:
+        return self.mode & S_IFMT == S_IFREG
+
+
+class GitIndex(NamedTuple):
+    version: int
+    entries: List[IndexEntry]
+    mtime_ns: int  # of the index file itself, for the racy-git check
+
+
+def find_git_dir(worktree) -> Optional[Path]:
+    """The git directory of a worktree root (.git dir or `gitdir:` file)"""
+    dot_git = Path(worktree) / ".git"
+    if dot_git.is_dir():
+        return dot_git
+    if dot_git.is_file():
+        text = dot_git.read_text(encoding="utf-8", errors="replace").strip()
+        if text.startswith("gitdir:"):
+            target = Path(text[len("gitdir:"):].strip())
+            return target if target.is_absolute() else (dot_git.parent / target).resolve()
+    return None
+
+
+def _check_object_format(git_dir: Path) -> None:
+    config = git_dir / "config"
+    commondir = git_dir / "commondir"
+    if not config.is_file() and commondir.is_file():
+        config = (git_dir / commondir.read_text().strip()).resolve() / "config"
+    try:
+        text = config.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return
+    match = re.search(r"^\s*objectformat\s*=\s*(\S+)", text, re.M | re.I)
+    if match and match.group(1).lower() != "sha1":
+        raise GitIndexError(f"object format {match.group(1)} is not supported")
+
+
+def _varint(data: bytes, offset: int):
+    """git's offset varint (index v4 path prefix lengths)"""
+    c = data[offset]
+    offset += 1
+    value = c & 0x7F
+    while c & 0x80:
+        c = data[offset]
+        offset += 1
+        value = ((value + 1) << 7) | (c & 0x7F)
+    return value, offset
+
+
+def read_index(git_dir) -> GitIndex:
+    """Every entry of <git_dir>/index
+
+    Split and sparse indexes keep part of the entries elsewhere; they raise
+    GitIndexError so callers fall back to walking the disk.
+    """
+    git_dir = Path(git_dir)
+    _check_object_format(git_dir)
+    path = git_dir / "index"
+    try:
+        with open(path, "rb") as f:
+            mtime_ns = os.fstat(f.fileno()).st_mtime_ns
+            data = f.read()
+    except OSError as exc:
+        raise GitIndexError(f"cannot read {path}: {exc}") from exc
+    if len(data) < 32 or data[:4] != b"DIRC":
+        raise GitIndexError(f"{path} is not a git index")
+    if hashlib.sha1(data[:-20]).digest() != data[-20:]:
+        raise GitIndexError(f"{path} checksum mismatch")
+    version, count = struct.unpack_from(">II", data, 4)
+    if version not in (2, 3, 4):
+        raise GitIndexError(f"index version {version} is not supported")
+
+    entries = []
+    offset = 12
+    previous = b""
+    for _ in range(count):
+        start = offset
+        (_, _, mtime_s, mtime_ns_part, _, _, mode, _, _, size,
+         sha, flags) = ENTRY_HEADER.unpack_from(data, offset)
+        offset += ENTRY_HEADER.size
+        extended = 0
+        if flags & EXTENDED_FLAG:
+            if version < 3:
+                raise GitIndexError("extended entry flags in a version 2 index")
+            extended, = struct.unpack_from(">H", data, offset)
+            offset += 2
+        if version == 4:
+            strip, offset = _varint(data, offset)
+            end = data.index(b"\0", offset)
+            name = previous[:len(previous) - strip] + data[offset:end]
+            offset = end + 1
+        else:
+            length = flags & NAME_MASK
+            end = offset + length if length < NAME_MASK else data.index(b"\0", offset)
+            name = data[offset:end]
+            # 1-8 NULs pad each entry to a multiple of 8 bytes
+            offset = start + ((end - start + 8) & ~7)
+        previous = name
+        if mode & S_IFMT == S_IFDIR:
+            raise GitIndexError("sparse index directories are not supported")
+        entries.append(IndexEntry(
+            name.decode("utf-8", errors="surrogateescape"),
+            mode,
+            size,
+            mtime_s * 1_000_000_000 + mtime_ns_part,
+            sha.hex(),
+            (flags >> STAGE_SHIFT) & 3,
+            bool(extended & INTENT_TO_ADD),
+            bool(extended & SKIP_WORKTREE),
+        ))
+
+    end = len(data) - 20
+    while offset + 8 <= end:
+        signature = data[offset:offset + 4]
+        size, = struct.unpack_from(">I", data, offset + 4)
+        if signature in (b"link", b"sdir"):
+            raise GitIndexError(f"index extension {signature.decode()} is not supported")
+        offset += 8 + size
+    return GitIndex(version, entries, mtime_ns)
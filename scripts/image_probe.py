@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Header-only image probing
+Reads just enough of PNG / JPEG / GIF / WebP / AVIF / SVG files to get their
+dimensions, never decoding pixels, on a thread pool
+"""
+
+import os
+import re
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Iterator, NamedTuple, Optional, Tuple
+
+from content_pipeline import default_workers
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".svg")
+MODERN_EXTENSIONS = (".webp", ".avif")
+# Wider or taller than this is more than any layout needs, even at 2x
+MAX_DIMENSION = 2560
+# Compressed bytes per pixel above which an image is likely badly encoded
+BYTES_PER_PIXEL_LIMIT = {"jpeg": 0.5, "png": 1.0, "gif": 1.0, "webp": 0.35, "avif": 0.25}
+# Smaller rasters (icons, logos) are not worth a modern-format variant
+MODERN_VARIANT_MIN_BYTES = 32 * 1024
+SVG_HEAD_BYTES = 16 * 1024
+AVIF_HEAD_BYTES = 64 * 1024
+
+_SVG_TAG_RE = re.compile(rb"<svg\b[^>]*>", re.I | re.S)
+_SVG_ATTR_RE = re.compile(rb"""\b(viewBox|width|height)\s*=\s*(['"])(.*?)\2""", re.I | re.S)
+_NUMBER_RE = re.compile(rb"[-+]?(?:\d+\.?\d*|\.\d+)(?:e[-+]?\d+)?", re.I)
+# Public URLs of image files inside string literals / url(...)
+ASSET_REF_RE = re.compile(
+    r"""(?<=['"`(])\s*(/[^'"`()\s?#]+\.(?:png|jpe?g|gif|webp|avif|svg))(?=[?#'"`)\s])""",
+    re.I,
+)
+
+
+class ImageInfo(NamedTuple):
+    format: str
+    width: Optional[int]
+    height: Optional[int]
+
+    @property
+    def pixels(self) -> int:
+        return (self.width or 0) * (self.height or 0)
+
+
+class ProbeResult(NamedTuple):
+    path: str
+    info: Optional[ImageInfo] = None
+    error: Optional[str] = None
+
+
+def extract_asset_refs(source: str) -> list:
+    """Root-relative image URLs ("/images/hero.jpg") mentioned in a source file"""
+    return sorted(set(ASSET_REF_RE.findall(source)))
+
+
+def _probe_jpeg(f) -> Optional[Tuple[int, int]]:
+    """Walk marker segments (seeking over their payload) to the first SOFn"""
+    f.seek(2)
+    while True:
+        byte = f.read(1)
+        if byte != b"\xff":
+            return None
+        marker = f.read(1)
+        while marker == b"\xff":
+            marker = f.read(1)
+        if not marker:
+            return None
+        code = marker[0]
+        if code == 0x01 or 0xD0 <= code <= 0xD8:
+            continue
+        raw = f.read(2)
+        if len(raw) < 2:
+            return None
+        length, = struct.unpack(">H", raw)
+        if 0xC0 <= code <= 0xCF and code not in (0xC4, 0xC8, 0xCC):
+            data = f.read(5)
+            if len(data) < 5:
+                return None
+            _, height, width = struct.unpack(">BHH", data)
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _probe_webp(head: bytes) -> Tuple[Optional[int], Optional[int]]:
+    chunk = head[12:16]
+    if chunk == b"VP8 " and len(head) >= 30:
+        width, height = struct.unpack("<HH", head[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and len(head) >= 25:
+        bits, = struct.unpack("<I", head[21:25])
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X" and len(head) >= 30:
+        return (int.from_bytes(head[24:27], "little") + 1,
+                int.from_bytes(head[27:30], "little") + 1)
+    return None, None
+
+
+def _probe_avif(f) -> Tuple[Optional[int], Optional[int]]:
+    # The 'ispe' property box sits in the meta box near the start of the file
+    head = f.read(AVIF_HEAD_BYTES)
+    at = head.find(b"ispe")
+    if at < 4 or at + 16 > len(head):
+        return None, None
+    width, height = struct.unpack(">II", head[at + 8:at + 16])
+    return width, height
+
+
+def _probe_svg(head: bytes) -> Tuple[Optional[int], Optional[int]]:
+    tag = _SVG_TAG_RE.search(head)
+    if not tag:
+        return None, None
+    attrs = {name.lower(): value for name, _, value in _SVG_ATTR_RE.findall(tag.group())}
+    box = _NUMBER_RE.findall(attrs.get(b"viewbox", b""))
+    if len(box) == 4:
+        return round(float(box[2])), round(float(box[3]))
+    sizes = []
+    for name in (b"width", b"height"):
+        value = attrs.get(name, b"")
+        number = _NUMBER_RE.match(value.strip())
+        # Percentages and em sizes don't give an intrinsic size
+        sizes.append(round(float(number.group())) if number and value.strip().endswith(
+            (number.group(), b"px")) else None)
+    return sizes[0], sizes[1]
+
+
+def probe_image(path: str) -> ImageInfo:
+    """Format and pixel dimensions from the file header; ValueError if unknown"""
+    with open(path, "rb") as f:
+        head = f.read(32)
+        if head.startswith(b"\x89PNG\r\n\x1a\n") and head[12:16] == b"IHDR":
+            width, height = struct.unpack(">II", head[16:24])
+            return ImageInfo("png", width, height)
+        if head.startswith(b"\xff\xd8"):
+            size = _probe_jpeg(f)
+            return ImageInfo("jpeg", *(size or (None, None)))
+        if head[:6] in (b"GIF87a", b"GIF89a"):
+            return ImageInfo("gif", *struct.unpack("<HH", head[6:10]))
+        if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+            return ImageInfo("webp", *_probe_webp(head))
+        if head[4:8] == b"ftyp" and head[8:12] in (b"avif", b"avis"):
+            f.seek(0)
+            return ImageInfo("avif", *_probe_avif(f))
+        f.seek(0)
+        text = f.read(SVG_HEAD_BYTES)
+        if b"<svg" in text[:SVG_HEAD_BYTES].lower():
+            return ImageInfo("svg", *_probe_svg(text))
+    raise ValueError("unrecognised image header")
+
+
+def _probe(path: str) -> ProbeResult:
+    try:
+        return ProbeResult(path, info=probe_image(path))
+    except (OSError, ValueError, struct.error) as exc:
+        return ProbeResult(path, error=f"{type(exc).__name__}: {exc}")
+
+
+def probe_images(paths: Iterable[str], workers: Optional[int] = None) -> Iterator[ProbeResult]:
+    """probe_image for every path on a thread pool, results in input order"""
+    with ThreadPoolExecutor(max_workers=workers or default_workers(),
+                            thread_name_prefix="arco-image") as pool:
+        yield from pool.map(_probe, paths)
@@ -0,0 +1,490 @@
+#!/usr/bin/env python3
+"""
+TypeScript import extraction, resolution and module graph
+Resolves specifiers the way tsc/Next.js do, against a set of known files
+"""
+
+import json
+import os
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+RESOLVE_EXTENSIONS = (".ts", ".tsx", ".d.ts", ".js", ".jsx", ".mjs", ".cjs", ".json")
+# TS lets "./x.js" point at x.ts / x.tsx
+JS_TO_TS = {".js": (".ts", ".tsx"), ".jsx": (".tsx",), ".mjs": (".mts",), ".cjs": (".cts",)}
+
+NODE_BUILTINS = frozenset("""
+assert async_hooks buffer child_process cluster console constants crypto dgram
+diagnostics_channel dns domain events fs http http2 https inspector module net
+os path perf_hooks process punycode querystring readline repl stream
+string_decoder sys timers tls trace_events tty url util v8 vm wasi
+worker_threads zlib
+""".split())
+
+# Comments and string literals; strip_comments blanks the comments and keeps
+# the strings (so "//" inside a URL survives) with line numbers intact
+_TOKEN_RE = re.compile(
+    r"//[^\n]*|/\*.*?\*/|'(?:\\.|[^'\\\n])*'|\"(?:\\.|[^\"\\\n])*\"|`(?:\\.|[^`\\])*`",
+    re.S,
+)
+# One left-to-right tokenizer: comments, regex literals and string/template
+# literals are consumed whole, so import-looking text inside them never matches
+_IMPORT_RE = re.compile(
+    r"""(?<![\w$.])(?:import|export)\s+(?:type\s+)?(?:[\w$*{}\s,]+?\s+from\s*)?(['"])(?P<static>[^'"\n]+)\1"""
+    r"""|(?<![\w$.])import\s*\(\s*(['"])(?P<dynamic>[^'"\n]+)\3\s*\)"""
+    r"""|(?<![\w$.])require\s*\(\s*(['"])(?P<require>[^'"\n]+)\5\s*\)"""
+    r"""|//[^\n]*|/\*.*?\*/"""
+    # Regex literal, recognised only where an expression may start
+    r"""|(?<=[(,=:\[!&|?{};])[ \t]*/(?![*/])(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/[a-z]*"""
+    r"""|'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`""",
+    re.M | re.S,
+)
+
+
+# Same tokenizer idea for export statements; comment and literal
+# alternatives carry no named group, so only real exports are reported
+_EXPORT_RE = re.compile(
+    r"""(?<![\w$.])export\s+(?P<type_star>type\s+)?\*\s*(?:as\s+(?P<ns>[\w$]+)\s+)?from\s*(?P<q1>['"])(?P<star>[^'"\n]+)(?P=q1)"""
+    r"""|(?<![\w$.])export\s+(?P<type_list>type\s*)?\{(?P<names>[^}]*)\}(?:\s*from\s*(?P<q2>['"])(?P<source>[^'"\n]+)(?P=q2))?"""
+    r"""|(?<![\w$.])export\s+(?:declare\s+)?(?P<default>default\s+)?(?:(?:abstract|async)\s+|const\s+(?=enum\b))*"""
+    r"""(?P<kind>function\b\s*\*?|class\b|const\b|let\b|var\b|enum\b|interface\b|type\b|namespace\b)\s*(?P<name>[\w$]+)?"""
+    r"""|(?<![\w$.])export\s+default\b(?P<bare_default>)"""
+    r"""|//[^\n]*|/\*.*?\*/"""
+    r"""|(?<=[(,=:\[!&|?{};])[ \t]*/(?![*/])(?:\\.|\[(?:\\.|[^\]\\\n])*\]|[^/\\\n\[])+/[a-z]*"""
+    r"""|'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`""",
+    re.M | re.S,
+)
+_LOCAL_TYPE_RE = re.compile(r"(?<![\w$.])(?:interface|type)\s+([\w$]+)\s*(?:<[^>{=]*>)?\s*[={]")
+
+
+class ImportRef(NamedTuple):
+    line: int
+    specifier: str
+
+
+class UnresolvedImport(NamedTuple):
+    path: str
+    line: int
+    specifier: str
+    reason: str
+
+
+def _blank_comment(match: "re.Match") -> str:
+    text = match.group(0)
+    if text.startswith(("//", "/*")):
+        return "\n" * text.count("\n")
+    return text
+
+
+def strip_comments(source: str) -> str:
+    return _TOKEN_RE.sub(_blank_comment, source)
+
+
+def extract_imports(source: str) -> List[ImportRef]:
+    """Static and dynamic import/require/re-export specifiers with 1-based lines"""
+    refs = []
+    line, pos = 1, 0
+    for m in _IMPORT_RE.finditer(source):
+        group = m.lastgroup
+        if group is None:
+            continue
+        start = m.start(group)
+        line += source.count("\n", pos, start)
+        pos = start
+        refs.append(ImportRef(line, m.group(group)))
+    return refs
+
+
+class ExportRef(NamedTuple):
+    """One exported name: `local` in this module, or `imported` from `source`"""
+    name: str
+    local: Optional[str]
+    source: Optional[str]
+    imported: Optional[str]
+    is_type: bool
+
+
+class ModuleExports(NamedTuple):
+    names: List[ExportRef]
+    stars: List[str]  # `export * from` specifiers (default is not re-exported)
+    type_stars: List[str] = []  # `export type * from`
+
+
+def extract_exports(source: str) -> ModuleExports:
+    """Exported names and `export *` sources of one module"""
+    names: List[ExportRef] = []
+    stars: List[str] = []
+    type_stars: List[str] = []
+    local_types: Optional[Set[str]] = None
+    for m in _EXPORT_RE.finditer(source):
+        if m.group("star"):
+            is_type = bool(m.group("type_star"))
+            if m.group("ns"):
+                names.append(ExportRef(m.group("ns"), None, m.group("star"), "*", is_type))
+            else:
+                (type_stars if is_type else stars).append(m.group("star"))
+        elif m.group("names") is not None:
+            origin = m.group("source")
+            if local_types is None:
+                local_types = set(_LOCAL_TYPE_RE.findall(strip_comments(source)))
+            for item in m.group("names").split(","):
+                item = item.strip()
+                if not item:
+                    continue
+                inline_type = item.startswith("type ") and not item.startswith("type as ")
+                if inline_type:
+                    item = item[5:].strip()
+                original, _, alias = (part.strip() for part in item.partition(" as "))
+                alias = alias or original
+                is_type = bool(m.group("type_list")) or inline_type
+                if origin:
+                    names.append(ExportRef(alias, None, origin, original, is_type))
+                else:
+                    names.append(ExportRef(alias, original, None, None,
+                                           is_type or original in local_types))
+        elif m.group("default") is not None or m.group("bare_default") is not None:
+            names.append(ExportRef("default", "default", None, None, False))
+        elif m.group("kind") and m.group("name"):
+            kind = m.group("kind").split()[0].rstrip("*")
+            is_type = kind in ("interface", "type")
+            names.append(ExportRef(m.group("name"), m.group("name"), None, None, is_type))
+    return ModuleExports(names, stars, type_stars)
+
+
+def rewrite_imports(source: str, specifiers: Dict[str, str]) -> Tuple[str, int]:
+    """Replace import/re-export/require specifiers in place (old -> new)
+
+    Only the specifier inside real import statements is touched, never an
+    equal string elsewhere. Returns the new source and the replacement count.
+    """
+    parts = []
+    pos = count = 0
+    for m in _IMPORT_RE.finditer(source):
+        group = m.lastgroup
+        if group is None or m.group(group) not in specifiers:
+            continue
+        start, end = m.span(group)
+        parts.append(source[pos:start])
+        parts.append(specifiers[m.group(group)])
+        pos = end
+        count += 1
+    parts.append(source[pos:])
+    return "".join(parts), count
+
+
+def parse_jsonc(text: str) -> dict:
+    """tsconfig.json allows comments and trailing commas"""
+    text = re.sub(r",(\s*[}\]])", r"\1", strip_comments(text))
+    return json.loads(text)
+
+
+def _load_jsonc(path: Path) -> dict:
+    return parse_jsonc(path.read_text(encoding="utf-8"))
+
+
+class PathAliases:
+    """compilerOptions.paths from tsconfig.json (e.g. "@/*" -> "./src/*")"""
+
+    def __init__(self, base_dir: str, paths: Dict[str, List[str]]):
+        self.base_dir = base_dir
+        self.exact: Dict[str, List[str]] = {}
+        self.wildcard: List[Tuple[str, str, List[str]]] = []
+        for pattern, targets in paths.items():
+            targets = [os.path.normpath(os.path.join(base_dir, t)) for t in targets]
+            if "*" in pattern:
+                prefix, _, suffix = pattern.partition("*")
+                self.wildcard.append((prefix, suffix, targets))
+            else:
+                self.exact[pattern] = targets
+        # TS picks the longest matching prefix
+        self.wildcard.sort(key=lambda w: len(w[0]), reverse=True)
+
+    @classmethod
+    def from_tsconfig(cls, root) -> "PathAliases":
+        tsconfig = Path(root) / "tsconfig.json"
+        if not tsconfig.is_file():
+            return cls(str(root), {})
+        return cls.from_config(root, _load_jsonc(tsconfig))
+
+    @classmethod
+    def from_config(cls, root, config: dict) -> "PathAliases":
+        """Aliases of an already parsed tsconfig.json living in root"""
+        options = config.get("compilerOptions", {})
+        base_dir = os.path.normpath(os.path.join(str(root), options.get("baseUrl", ".")))
+        return cls(base_dir, options.get("paths", {}))
+
+    def specifier_for(self, path: str, prefer: str = "") -> Optional[str]:
+        """Aliased specifier reaching path (no extension), preferring the
+        alias prefer already uses; None when no wildcard alias covers it"""
+        found = []
+        for prefix, suffix, targets in self.wildcard:
+            for target in targets:
+                head, _, tail = target.partition("*")
+                if len(path) <= len(head) + len(tail):
+                    continue
+                if path.startswith(head) and path.endswith(tail):
+                    star = path[len(head):len(path) - len(tail)].replace(os.sep, "/")
+                    spec = prefix + star + suffix
+                    if prefer.startswith(prefix):
+                        return spec
+                    found.append(spec)
+        return found[0] if found else None
+
+    def candidates(self, specifier: str) -> Optional[List[str]]:
+        """Absolute target paths for an aliased specifier, None when no alias applies"""
+        if specifier in self.exact:
+            return self.exact[specifier]
+        for prefix, suffix, targets in self.wildcard:
+            if specifier.startswith(prefix) and specifier.endswith(suffix) \
+                    and len(specifier) >= len(prefix) + len(suffix):
+                star = specifier[len(prefix):len(specifier) - len(suffix)]
+                return [t.replace("*", star) for t in targets]
+        return None
+
+
+def package_name(specifier: str) -> str:
+    parts = specifier.split("/")
+    return "/".join(parts[:2]) if specifier.startswith("@") else parts[0]
+
+
+def declared_packages(root) -> Set[str]:
+    package_json = Path(root) / "package.json"
+    if not package_json.is_file():
+        return set()
+    return manifest_packages(json.loads(package_json.read_text(encoding="utf-8")))
+
+
+def manifest_packages(data: dict) -> Set[str]:
+    """Every dependency name declared in a parsed package.json"""
+    names: Set[str] = set()
+    for field in ("dependencies", "devDependencies", "peerDependencies", "optionalDependencies"):
+        names.update(data.get(field, {}))
+    return names
+
+
+class ModuleResolver:
+    """Resolve specifiers against a fixed set of existing files (no stat calls)
+
+    Results are memoized per (importing directory, specifier); alias and package
+    lookups do not depend on the directory and share one memo.
+    """
+
+    def __init__(self, root, files: Iterable[str], aliases: Optional[PathAliases] = None,
+                 packages: Optional[Set[str]] = None):
+        self.root = str(root)
+        self.files = files if isinstance(files, (set, frozenset, dict)) else set(files)
+        self.aliases = aliases if aliases is not None else PathAliases.from_tsconfig(root)
+        self.packages = packages if packages is not None else declared_packages(root)
+        self._memo: Dict[Tuple[str, str], Tuple[Optional[str], Optional[str]]] = {}
+
+    def _probe(self, base: str) -> Optional[str]:
+        if base in self.files:
+            return base
+        for ext in RESOLVE_EXTENSIONS:
+            if base + ext in self.files:
+                return base + ext
+        stem, ext = os.path.splitext(base)
+        for alt in JS_TO_TS.get(ext, ()):
+            if stem + alt in self.files:
+                return stem + alt
+        for ext in RESOLVE_EXTENSIONS:
+            index = os.path.join(base, "index" + ext)
+            if index in self.files:
+                return index
+        return None
+
+    def resolve(self, importer: str, specifier: str) -> Tuple[Optional[str], Optional[str]]:
+        """(resolved path, None) for local modules, (None, None) for packages,
+        (None, reason) when the specifier cannot be satisfied"""
+        relative = specifier.startswith((".", "/"))
+        key = (os.path.dirname(importer) if relative else "", specifier)
+        hit = self._memo.get(key)
+        if hit is None:
+            hit = self._memo[key] = self._resolve(key[0], specifier)
+        return hit
+
+    def _resolve(self, directory: str, specifier: str) -> Tuple[Optional[str], Optional[str]]:
+        spec = specifier.split("?", 1)[0]
+        if spec.startswith("/"):
+            found = self._probe(os.path.normpath(os.path.join(self.root, spec.lstrip("/"))))
+            return (found, None) if found else (None, "missing-module")
+        if spec.startswith("."):
+            found = self._probe(os.path.normpath(os.path.join(directory, spec)))
+            return (found, None) if found else (None, "missing-module")
+        targets = self.aliases.candidates(spec)
+        if targets is not None:
+            for target in targets:
+                found = self._probe(target)
+                if found:
+                    return found, None
+            return None, "missing-module"
+        name = package_name(spec)
+        if spec.startswith("node:") or name in NODE_BUILTINS or name in self.packages:
+            return None, None
+        return None, "unlisted-package"
+
+
+class ModuleGraph:
+    """Resolved local import edges plus every specifier that failed to resolve"""
+
+    def __init__(self):
+        self.edges: Dict[str, List[str]] = {}
+        self.unresolved: List[UnresolvedImport] = []
+        self._importers: Optional[Dict[str, List[str]]] = None
+        self._closures: Dict[str, FrozenSet[str]] = {}
+
+    @classmethod
+    def build(cls, imports: Dict[str, List[ImportRef]], resolver: ModuleResolver) -> "ModuleGraph":
+        graph = cls()
+        for path in sorted(imports):
+            targets = []
+            for line, spec in imports[path]:
+                resolved, reason = resolver.resolve(path, spec)
+                if resolved:
+                    targets.append(resolved)
+                elif reason:
+                    graph.unresolved.append(UnresolvedImport(path, line, spec, reason))
+            graph.edges[path] = list(dict.fromkeys(targets))
+        return graph
+
+    def closure(self, path: str) -> FrozenSet[str]:
+        """path plus every local module it reaches, transitively
+
+        Memoized per strongly connected component (iterative Tarjan), so a
+        subtree shared by many entry points is computed once; members of an
+        import cycle share one closure.
+        """
+        if path in self._closures:
+            return self._closures[path]
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        work = [(path, iter(self.edges.get(path, ())))]
+        index[path] = low[path] = 0
+        stack.append(path)
+        on_stack.add(path)
+        while work:
+            node, children = work[-1]
+            advanced = False
+            for child in children:
+                if child in self._closures:
+                    continue
+                if child not in index:
+                    index[child] = low[child] = len(index)
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(self.edges.get(child, ()))))
+                    advanced = True
+                    break
+                if child in on_stack:
+                    low[node] = min(low[node], index[child])
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == index[node]:
+                members = set()
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    members.add(member)
+                    if member == node:
+                        break
+                reached = set(members)
+                for member in members:
+                    for child in self.edges.get(member, ()):
+                        if child not in members:
+                            reached |= self._closures[child]
+                closure = frozenset(reached)
+                for member in members:
+                    self._closures[member] = closure
+        return self._closures[path]
+
+    def importers(self, path: str) -> List[str]:
+        """Files that import path directly (reverse edges, built on first use)"""
+        if self._importers is None:
+            reverse = defaultdict(list)
+            for src, targets in self.edges.items():
+                for target in targets:
+                    reverse[target].append(src)
+            self._importers = dict(reverse)
+        return self._importers.get(path, [])
+
+
+class ExportOrigin(NamedTuple):
+    """Where an exported name is actually declared"""
+    path: str
+    name: str
+    is_type: bool
+
+
+class ExportIndex:
+    """Follows re-exports to the declaring module, memoized per file
+
+    exports(path) maps every name a module exposes to its ExportOrigin;
+    fan_out(path) is the set of modules a bundler has to load to evaluate the
+    module's re-export chains (including path itself).
+    """
+
+    def __init__(self, resolver: ModuleResolver):
+        self.resolver = resolver
+        self._parsed: Dict[str, ModuleExports] = {}
+        self._exports: Dict[str, Dict[str, ExportOrigin]] = {}
+        self._fan_out: Dict[str, Set[str]] = {}
+
+    def parsed(self, path: str) -> ModuleExports:
+        if path not in self._parsed:
+            try:
+                with open(path, encoding="utf-8", errors="replace") as f:
+                    self._parsed[path] = extract_exports(f.read())
+            except OSError:
+                self._parsed[path] = ModuleExports([], [])
+        return self._parsed[path]
+
+    def _target(self, path: str, specifier: str) -> Optional[str]:
+        return self.resolver.resolve(path, specifier)[0]
+
+    def exports(self, path: str) -> Dict[str, ExportOrigin]:
+        if path in self._exports:
+            return self._exports[path]
+        # Provisional entry breaks export-* cycles
+        table: Dict[str, ExportOrigin] = {}
+        self._exports[path] = table
+        parsed = self.parsed(path)
+        stars = [(s, False) for s in parsed.stars] + [(s, True) for s in parsed.type_stars]
+        for star, type_only in stars:
+            target = self._target(path, star)
+            if target:
+                for name, origin in self.exports(target).items():
+                    if name != "default":
+                        table.setdefault(name, origin._replace(is_type=origin.is_type or type_only))
+        # Explicit exports shadow names coming through export *
+        for ref in parsed.names:
+            origin = ExportOrigin(path, ref.local or ref.name, ref.is_type)
+            if ref.source and ref.imported != "*":
+                target = self._target(path, ref.source)
+                found = self.exports(target).get(ref.imported) if target else None
+                if found:
+                    origin = found._replace(is_type=found.is_type or ref.is_type)
+            elif ref.source:
+                origin = ExportOrigin(path, ref.name, ref.is_type)
+            table[ref.name] = origin
+        return table
+
+    def fan_out(self, path: str) -> Set[str]:
+        if path in self._fan_out:
+            return self._fan_out[path]
+        reached = self._fan_out[path] = {path}
+        parsed = self.parsed(path)
+        sources = parsed.stars + parsed.type_stars
+        sources += [ref.source for ref in parsed.names if ref.source]
+        for specifier in sources:
+            target = self._target(path, specifier)
+            if target:
+                reached |= self.fan_out(target)
+        return reached
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Batched file moves with importer rewrites
+Builds forward/reverse import edges once, plans every specifier change for a
+whole batch of moves, and applies moves and rewrites as one transaction
+"""
+
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from codemod import CODEMOD_EXTENSIONS, atomic_write
+from content_pipeline import ScanItem, scan_files
+from import_graph import RESOLVE_EXTENSIONS, ModuleResolver, extract_imports, rewrite_imports
+from repo_walker import IgnoreMatcher, scan
+
+
+class MovePlanError(Exception):
+    """A planned move cannot be applied; nothing was changed"""
+
+
+class PlannedMove(NamedTuple):
+    source: str
+    destination: str
+
+
+class MovePlan(NamedTuple):
+    moves: List[PlannedMove]
+    # current path of each file to rewrite -> {old specifier: new specifier}
+    rewrites: Dict[str, Dict[str, str]]
+
+
+def _parse_imports(item: ScanItem, buffer):
+    return [spec for _, spec in extract_imports(bytes(buffer).decode("utf-8", errors="replace"))]
+
+
+class ImportIndex:
+    """Resolved import edges of every source file under a directory
+
+    forward[path] lists (specifier, resolved target or None) per import;
+    reverse[target] lists the files importing it. Built in one parallel read,
+    so planning a batch of moves costs O(files touched), not O(files x moves).
+    """
+
+    def __init__(self, resolver: ModuleResolver,
+                 forward: Dict[str, List[Tuple[str, Optional[str]]]],
+                 stats: Dict[str, Tuple[int, int]]):
+        self.resolver = resolver
+        self.forward = forward
+        self.stats = stats
+        self.reverse: Dict[str, List[str]] = defaultdict(list)
+        for path, imports in forward.items():
+            for _, target in imports:
+                if target and path not in self.reverse[target]:
+                    self.reverse[target].append(path)
+
+    @classmethod
+    def build(cls, top, matcher: Optional[IgnoreMatcher] = None,
+              workers: Optional[int] = None) -> "ImportIndex":
+        matcher = matcher or IgnoreMatcher.from_repo()
+        files, items = set(), []
+        for _, _, entries in scan(Path(top).resolve(), matcher):
+            for entry in entries:
+                if entry.name.endswith(RESOLVE_EXTENSIONS):
+                    files.add(entry.path)
+                if entry.name.endswith(CODEMOD_EXTENSIONS):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    items.append(ScanItem(entry.path, st.st_size, st.st_mtime_ns))
+        resolver = ModuleResolver(matcher.root, files)
+        forward, stats = {}, {}
+        for result in scan_files(items, _parse_imports, workers=workers):
+            if result.value is None:
+                continue
+            forward[result.path] = [(spec, resolver.resolve(result.path, spec)[0])
+                                    for spec in result.value]
+            stats[result.path] = (result.size, result.mtime_ns)
+        return cls(resolver, forward, stats)
+
+    def specifier(self, spec: str, importer: str, target: str) -> str:
+        """spec rewritten to reach target (new location) from importer (new location)
+
+        Keeps the original style: alias vs relative, explicit extension or
+        not, directory import of an index file or not.
+        """
+        stem = target[:-len(".d.ts")] if target.endswith(".d.ts") else os.path.splitext(target)[0]
+        spec_tail = spec.rsplit("/", 1)[-1]
+        spec_ext = os.path.splitext(spec_tail)[1]
+        if os.path.basename(stem) == "index" and os.path.splitext(spec_tail)[0] != "index":
+            form = os.path.dirname(stem)
+        elif spec_ext and spec_ext in RESOLVE_EXTENSIONS + (".mts", ".cts"):
+            form = stem + spec_ext
+        else:
+            form = stem
+        if not spec.startswith((".", "/")):
+            aliased = self.resolver.aliases.specifier_for(form, prefer=spec)
+            if aliased:
+                return aliased
+        elif spec.startswith("/"):
+            return "/" + os.path.relpath(form, self.resolver.root).replace(os.sep, "/")
+        rel = os.path.relpath(form, os.path.dirname(importer)).replace(os.sep, "/")
+        return rel if rel.startswith(".") else "./" + rel
+
+    def plan(self, moves: Iterable[Tuple[str, str]]) -> MovePlan:
+        """Every specifier change needed so the batch of moves breaks no import"""
+        planned = [PlannedMove(os.path.abspath(s), os.path.abspath(d)) for s, d in moves]
+        moved = {m.source: m.destination for m in planned}
+        touched = set(moved)
+        for source in moved:
+            touched.update(self.reverse.get(source, ()))
+        rewrites: Dict[str, Dict[str, str]] = {}
+        for path in sorted(touched):
+            importer = moved.get(path, path)
+            mapping = {}
+            for spec, target in self.forward.get(path, ()):
+                if target is None or (path not in moved and target not in moved):
+                    continue
+                new = self.specifier(spec, importer, moved.get(target, target))
+                if new != spec:
+                    mapping[spec] = new
+            if mapping:
+                rewrites[path] = mapping
+        return MovePlan(planned, rewrites)
+
+
+def apply_plan(plan: MovePlan, index: ImportIndex) -> List[str]:
+    """Apply moves and rewrites, all or nothing; returns the rewritten paths
+
+    Every new file body is computed and every move is checked before the
+    first change. If anything fails midway, written files get their old
+    bytes back, moved files return and created directories are removed.
+    """
+    moved = {m.source: m.destination for m in plan.moves}
+    bodies: Dict[str, Tuple[bytes, bytes]] = {}
+    for path, mapping in plan.rewrites.items():
+        with open(path, "rb") as f:
+            old = f.read()
+        new, _ = rewrite_imports(old.decode("utf-8"), mapping)
+        bodies[path] = (old, new.encode("utf-8"))
+    for move in plan.moves:
+        if not os.path.isfile(move.source):
+            raise MovePlanError(f"{move.source} does not exist")
+        if os.path.exists(move.destination):
+            raise MovePlanError(f"{move.destination} already exists")
+
+    created: List[str] = []
+    done: List[PlannedMove] = []
+    written: List[Tuple[str, bytes]] = []
+    try:
+        for move in plan.moves:
+            missing = []
+            parent = os.path.dirname(move.destination)
+            while not os.path.isdir(parent):
+                missing.append(parent)
+                parent = os.path.dirname(parent)
+            for directory in reversed(missing):
+                os.mkdir(directory)
+                created.append(directory)
+            os.rename(move.source, move.destination)
+            done.append(move)
+        for path, (old, new) in bodies.items():
+            target = moved.get(path, path)
+            atomic_write(target, new, index.stats.get(path))
+            written.append((target, old))
+    except BaseException:
+        for target, old in reversed(written):
+            atomic_write(target, old)
+        for move in reversed(done):
+            os.rename(move.destination, move.source)
+        for directory in reversed(created):
+            try:
+                os.rmdir(directory)
+            except OSError:
+                pass
+        raise
+    return [moved.get(path, path) for path in bodies]
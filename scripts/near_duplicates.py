@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate source detection
+Normalizes TS/TSX to a token stream without identifiers, literals or
+whitespace, summarizes its shingles as a MinHash signature, and finds similar
+files through LSH banding instead of comparing every pair
+"""
+
+import hashlib
+import re
+import sys
+from array import array
+from collections import defaultdict
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+SHINGLE_SIZE = 5
+NUM_PERM = 64
+LSH_BANDS = 16  # x 4 rows: pairs at 0.8 similarity collide with probability > 0.99
+MIN_TOKENS = 80  # smaller files look alike once identifiers are gone
+SIMILARITY_THRESHOLD = 0.8
+# One SHAKE-128 call per shingle yields NUM_PERM independent 32-bit hashes;
+# the salt is fixed because signatures are cached and compared across runs
+# and processes
+_HASH_SALT = b"arco-minhash\0"
+_HASH_BYTES = 4 * NUM_PERM
+
+KEYWORDS = frozenset("""
+    abstract as async await break case catch class const continue debugger declare default
+    delete do else enum export extends false finally for from function get if implements
+    import in instanceof interface keyof let new null of private protected public readonly
+    return satisfies set static super switch this throw true try type typeof undefined var
+    void while with yield
+""".split())
+
+_TOKEN_RE = re.compile(r"""
+    (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*"|`(?:[^`\\]|\\.)*`)
+  | (?P<number>\d[\w.]*)
+  | (?P<word>[A-Za-z_$][\w$]*)
+  | (?P<punct>===|!==|\.\.\.|=>|&&|\|\||\?\?|\?\.|[<>=!+\-*/%]=|[^\s\w])
+""", re.S | re.X)
+
+
+class SimilarityCluster(NamedTuple):
+    """Files whose normalized token streams are near-identical to `center`"""
+    center: str
+    members: List[Tuple[str, float]]  # (path, estimated similarity to center), best first
+
+    @property
+    def paths(self) -> List[str]:
+        return [self.center] + [path for path, _ in self.members]
+
+
+def normalized_tokens(source: str) -> List[str]:
+    """Keywords and punctuation as-is; identifiers, strings and numbers as I / S / N"""
+    tokens = []
+    for match in _TOKEN_RE.finditer(source):
+        kind = match.lastgroup
+        if kind == "comment":
+            continue
+        if kind == "string":
+            tokens.append("S")
+        elif kind == "number":
+            tokens.append("N")
+        elif kind == "word":
+            word = match.group()
+            tokens.append(word if word in KEYWORDS else "I")
+        else:
+            tokens.append(match.group())
+    return tokens
+
+
+def minhash_signature(source: str) -> Optional[List[int]]:
+    """NUM_PERM minimum shingle hashes, or None for files below MIN_TOKENS
+
+    Shingle k's hashes are values[k * NUM_PERM:(k + 1) * NUM_PERM], so hash
+    function i is the strided slice values[i::NUM_PERM] and each minimum is
+    one C-level min() instead of a Python loop per shingle and function.
+    """
+    tokens = normalized_tokens(source)
+    if len(tokens) < MIN_TOKENS:
+        return None
+    shingles = {" ".join(tokens[i:i + SHINGLE_SIZE]).encode()
+                for i in range(len(tokens) - SHINGLE_SIZE + 1)}
+    values = array("I", b"".join(hashlib.shake_128(_HASH_SALT + shingle).digest(_HASH_BYTES)
+                                 for shingle in shingles))
+    if sys.byteorder == "big":
+        values.byteswap()
+    return [min(values[i::NUM_PERM]) for i in range(NUM_PERM)]
+
+
+def similarity(left: Sequence[int], right: Sequence[int]) -> float:
+    """Estimated Jaccard similarity of the two files' shingle sets"""
+    return sum(1 for a, b in zip(left, right) if a == b) / len(left)
+
+
+def similar_pairs(signatures: Dict[str, Sequence[int]],
+                  threshold: float = SIMILARITY_THRESHOLD) -> List[Tuple[float, str, str]]:
+    """(similarity, a, b) for every pair at or above threshold, best first
+
+    Only files sharing at least one LSH band bucket are compared, so the
+    cost grows with the number of files plus candidate pairs, not n².
+    """
+    rows = NUM_PERM // LSH_BANDS
+    buckets: Dict[tuple, List[str]] = defaultdict(list)
+    for path in sorted(signatures):
+        signature = signatures[path]
+        for band in range(LSH_BANDS):
+            buckets[(band, *signature[band * rows:(band + 1) * rows])].append(path)
+    candidates = set()
+    for paths in buckets.values():
+        for i, left in enumerate(paths):
+            for right in paths[i + 1:]:
+                candidates.add((left, right))
+    pairs = []
+    for left, right in candidates:
+        score = similarity(signatures[left], signatures[right])
+        if score >= threshold:
+            pairs.append((score, left, right))
+    pairs.sort(key=lambda p: (-p[0], p[1], p[2]))
+    return pairs
+
+
+def cluster_similar(signatures: Dict[str, Sequence[int]],
+                    threshold: float = SIMILARITY_THRESHOLD) -> List[SimilarityCluster]:
+    """Greedy leader clustering over similar_pairs
+
+    Pairs are taken best first; a file joins an existing cluster only when it
+    is within threshold of that cluster's center, so clusters stay tight
+    instead of chaining through intermediate files.
+    """
+    center_of: Dict[str, str] = {}
+    members: Dict[str, List[Tuple[str, float]]] = {}
+    for score, left, right in similar_pairs(signatures, threshold):
+        if left not in center_of and right not in center_of:
+            center_of[left] = center_of[right] = left
+            members[left] = [(right, score)]
+            continue
+        if left in center_of and right in center_of:
+            continue
+        joined, newcomer = (left, right) if left in center_of else (right, left)
+        center = center_of[joined]
+        score = similarity(signatures[center], signatures[newcomer])
+        if score >= threshold:
+            center_of[newcomer] = center
+            members[center].append((newcomer, score))
+    clusters = [SimilarityCluster(center, sorted(found, key=lambda m: (-m[1], m[0])))
+                for center, found in members.items()]
+    clusters.sort(key=lambda c: (-len(c.members), -c.members[0][1], c.center))
+    return clusters
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Gitignore-aware repository walker
+Shared by the maintenance scripts so ignored trees are pruned before descent
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+# Always excluded, whatever the .gitignore says
+DEFAULT_EXCLUDES = [".git/", "node_modules/", ".next/", ".cache/"]
+
+
+def _translate(pattern: str) -> str:
+    """Translate one gitignore glob (already stripped of !, / markers) to regex"""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == "*":
+            if pattern[i:i + 3] == "**/":
+                out.append("(?:.*/)?")
+                i += 3
+                continue
+            if pattern[i:i + 2] == "**":
+                out.append(".*")
+                i += 2
+                continue
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = pattern.find("]", i + 1)
+            if j == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:j]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = j
+        elif c == "\\" and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def glob_regex(pattern: str) -> Tuple[str, bool]:
+    """(anchored regex source, directory-only) for one gitignore-style glob
+
+    A pattern holding a '/' is anchored at the root; otherwise it matches the
+    last segment at any depth. A trailing '/' limits it to directories.
+    """
+    dir_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    anchored = "/" in pattern
+    body = _translate(pattern.lstrip("/"))
+    return ("^" if anchored else "(?:^|.*/)") + body + "$", dir_only
+
+
+class IgnoreMatcher:
+    """Compiled gitignore rules with last-match-wins semantics
+
+    All rules are folded into a single alternation (newest rule first), so one
+    regex search decides whether a path is ignored. Directory-only rules live
+    in a separate regex that is consulted for directories only.
+    """
+
+    def __init__(self, root, rules: Iterable[str] = ()):
+        self.root = str(root)
+        self.rules: List[Tuple[str, bool, bool]] = []
+        for line in rules:
+            self.add(line)
+        self._compile()
+
+    @classmethod
+    def from_repo(cls, root=None, extra: Sequence[str] = DEFAULT_EXCLUDES) -> "IgnoreMatcher":
+        """Build a matcher from <root>/.gitignore plus extra rules"""
+        root = Path(root) if root else find_repo_root(Path.cwd())
+        lines: List[str] = []
+        gitignore = root / ".gitignore"
+        if gitignore.is_file():
+            lines.extend(gitignore.read_text(encoding="utf-8", errors="replace").splitlines())
+        lines.extend(extra)
+        return cls(root, lines)
+
+    def add(self, line: str) -> None:
+        line = line.rstrip("\n")
+        if not line.strip() or line.startswith("#"):
+            return
+        if not line.endswith("\\ "):
+            line = line.rstrip()
+        negate = line.startswith("!")
+        if negate:
+            line = line[1:]
+        elif line.startswith("\\!") or line.startswith("\\#"):
+            line = line[1:]
+        if not line.rstrip("/"):
+            return
+        regex, dir_only = glob_regex(line)
+        self.rules.append((regex, negate, dir_only))
+
+    def _compile(self) -> None:
+        def build(rules):
+            if not rules:
+                return None, []
+            ordered = list(reversed(rules))
+            alternation = "|".join(f"({regex})" for regex, _, _ in ordered)
+            # Inner groups from character classes are never capturing, so
+            # group k maps straight back to ordered[k - 1]
+            return re.compile(alternation), [negate for _, negate, _ in ordered]
+
+        self._file_re, self._file_neg = build([r for r in self.rules if not r[2]])
+        self._dir_re, self._dir_neg = build(self.rules)
+
+    def match(self, rel_path: str, is_dir: bool = False) -> bool:
+        """True if the root-relative posix path is ignored by the last matching rule
+
+        Only the path itself is tested; walk() takes care of ignored parents by
+        never descending into them.
+        """
+        regex, negations = (self._dir_re, self._dir_neg) if is_dir else (self._file_re, self._file_neg)
+        if regex is None:
+            return False
+        m = regex.match(rel_path)
+        if m is None:
+            return False
+        return not negations[m.lastindex - 1]
+
+
+def find_repo_root(start: Path) -> Path:
+    """Nearest ancestor holding a .git directory or .gitignore, else start"""
+    start = start.resolve()
+    for candidate in (start, *start.parents):
+        if (candidate / ".git").exists() or (candidate / ".gitignore").is_file():
+            return candidate
+    return start
+
+
+def _rel_prefix(path: str, matcher: IgnoreMatcher) -> str:
+    rel = os.path.relpath(os.path.abspath(path), os.path.abspath(matcher.root))
+    if rel == ".":
+        return ""
+    return rel.replace(os.sep, "/") + "/"
+
+
+def iter_dir(path, matcher: Optional[IgnoreMatcher] = None, prefix: Optional[str] = None,
+             ignored: Optional[Set[str]] = None) -> Iterator[os.DirEntry]:
+    """os.scandir(path) minus ignored entries
+
+    When ignored is given, path is added to it if any entry was dropped, so
+    callers can tell an empty directory from one holding only ignored files.
+    """
+    if matcher is None:
+        matcher = IgnoreMatcher.from_repo()
+    if prefix is None:
+        prefix = _rel_prefix(path, matcher)
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if not matcher.match(prefix + entry.name, is_dir):
+                    yield entry
+                elif ignored is not None:
+                    ignored.add(path)
+    except OSError:
+        return
+
+
+def scan(root, matcher: Optional[IgnoreMatcher] = None,
+         ignored: Optional[Set[str]] = None) -> Iterator[Tuple[str, List[os.DirEntry], List[os.DirEntry]]]:
+    """Top-down (dirpath, dir_entries, file_entries) over non-ignored entries
+
+    Ignored directories are dropped before they are ever opened, and like
+    os.walk(followlinks=False) symlinked directories are listed but not entered.
+    Directories that had ignored entries are collected in ignored (see iter_dir).
+    """
+    if matcher is None:
+        matcher = IgnoreMatcher.from_repo()
+    root = str(root)
+    stack = [(root, _rel_prefix(root, matcher))]
+    while stack:
+        current, prefix = stack.pop()
+        dirs: List[os.DirEntry] = []
+        files: List[os.DirEntry] = []
+        for entry in iter_dir(current, matcher, prefix, ignored):
+            (dirs if entry.is_dir() else files).append(entry)
+        yield current, dirs, files
+        for entry in reversed(dirs):
+            if not entry.is_symlink():
+                stack.append((entry.path, prefix + entry.name + "/"))
+
+
+def walk(root, matcher: Optional[IgnoreMatcher] = None,
+         ignored: Optional[Set[str]] = None) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """os.walk-compatible pruned walk"""
+    for current, dirs, files in scan(root, matcher, ignored):
+        yield current, [d.name for d in dirs], [f.name for f in files]
+
+
+def iter_files(root, suffixes: Optional[Tuple[str, ...]] = None,
+               matcher: Optional[IgnoreMatcher] = None) -> Iterator[Path]:
+    """Non-ignored files under root, optionally filtered by suffix (rglob replacement)"""
+    for _, _, files in scan(root, matcher):
+        for entry in files:
+            if suffixes is None or entry.name.endswith(suffixes):
+                yield Path(entry.path)
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Tailwind className index
+Tokenizes className attributes and cn()/clsx()/cva() string literals, keeps an
+inverted class -> files index that updates per file, and finds near-duplicate
+class bundles and design-token shades no class uses
+"""
+
+import bisect
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+
+CLASS_HELPERS = ("cn", "clsx", "cva", "twMerge", "classNames", "cx")
+SHADE_KEY_RE = re.compile(r"^(?:\d{2,3}|DEFAULT)$")
+# A bundle this size or larger, used this often across at least two files,
+# is worth turning into a component or variant
+BUNDLE_MIN_CLASSES = 4
+BUNDLE_MIN_OCCURRENCES = 3
+BUNDLE_MIN_FILES = 2
+NEAR_DUPLICATE_THRESHOLD = 0.8
+
+_STRING = r"""'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*"|`(?:[^`\\]|\\.)*`"""
+_STRING_RE = re.compile(_STRING, re.S)
+_CLASSNAME_RE = re.compile(r"""\bclass(?:Name)?\s*=\s*(?:\{\s*)?(?=['"`])""")
+_HELPER_RE = re.compile(r"\b(?:%s)\s*\(" % "|".join(CLASS_HELPERS))
+# Values under these cva keys are variant names, not classes
+_VARIANT_NAMES_RE = re.compile(r"\b(defaultVariants|compoundVariants)\s*:\s*([\[{])")
+_CLASS_KEY_RE = re.compile(r"\bclass(?:Name)?\s*:\s*$")
+_CLASS_TOKEN_RE = re.compile(r"^(?:[a-z0-9@!&*>_:/.%#,+-]|\[[^\]\s]+\]|\([^)\s]+\))+$")
+_COMMENT_RE = re.compile(r"(%s)|//[^\n]*|/\*.*?\*/" % _STRING, re.S)
+_TOKEN_TREE_RE = re.compile(
+    r"""\bconst\s+(\w+)\s*(?::[^=]+)?=\s*\{"""
+    r"""|(['"]?)([\w.-]+)\2\s*:\s*(?:(\{)|(?=(['"])(?:#|rgba?\(|hsla?\(|oklch\()))?"""
+    r"""|(\{)|(\})|%s""" % _STRING,
+    re.S,
+)
+
+
+class ClassBundle(NamedTuple):
+    """Classes of one className attribute, helper call or cva variant"""
+    line: int
+    classes: str  # space-separated, in source order
+
+
+class BundleCluster(NamedTuple):
+    """Bundles that are identical or near-identical class sets"""
+    shared: List[str]  # classes every member has
+    variants: int  # distinct class sets in the cluster
+    occurrences: List[Tuple[str, int]]  # (path, line)
+    files: int
+
+
+def _matching(source: str, start: int, open_char: str, close_char: str) -> int:
+    """Index just past the bracket closing the one at start, skipping strings"""
+    depth = 0
+    i = start
+    while i < len(source):
+        ch = source[i]
+        if ch in "'\"`":
+            match = _STRING_RE.match(source, i)
+            if match:
+                i = match.end()
+                continue
+        elif ch == open_char:
+            depth += 1
+        elif ch == close_char:
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return len(source)
+
+
+def _literal_text(literal: str) -> str:
+    body = literal[1:-1]
+    if literal[0] != "`":
+        return body
+    # Interpolations are dynamic; keep only the static class text
+    out, i = [], 0
+    while True:
+        at = body.find("${", i)
+        if at < 0:
+            out.append(body[i:])
+            return " ".join(out)
+        out.append(body[i:at])
+        i = _matching(body, at + 1, "{", "}")
+
+
+def split_classes(text: str) -> List[str]:
+    """Class tokens of a class string; prose and variant names are dropped"""
+    return [token for token in text.split()
+            if _CLASS_TOKEN_RE.match(token) and re.search(r"[a-z]", token)]
+
+
+def _call_bundles(source: str, start: int, end: int, line_of) -> List[ClassBundle]:
+    call = source[start:end]
+    # Blank out defaultVariants / compoundVariants except their class keys
+    masked = list(call)
+    for match in _VARIANT_NAMES_RE.finditer(call):
+        opener = match.group(2)
+        close = _matching(call, match.start(2), opener, "]" if opener == "[" else "}")
+        for literal in _STRING_RE.finditer(call, match.start(2), close):
+            if not _CLASS_KEY_RE.search(call, 0, literal.start()):
+                masked[literal.start():literal.end()] = " " * (literal.end() - literal.start())
+    masked = "".join(masked)
+    is_cva = source.startswith("cva", start)
+    bundles, merged, first = [], [], None
+    for literal in _STRING_RE.finditer(masked):
+        if masked[literal.start()] == " ":
+            continue
+        classes = split_classes(_literal_text(literal.group()))
+        if not classes:
+            continue
+        if is_cva:
+            bundles.append(ClassBundle(line_of(start + literal.start()), " ".join(classes)))
+        else:
+            first = first if first is not None else start + literal.start()
+            merged.extend(classes)
+    if merged:
+        bundles.append(ClassBundle(line_of(first), " ".join(merged)))
+    return bundles
+
+
+def extract_class_bundles(source: str) -> List[ClassBundle]:
+    """Class bundles of literal className attributes and class-helper calls
+
+    A helper call (cn, clsx, twMerge...) is one bundle holding the classes of
+    all its string literals; each string of a cva() call is its own bundle
+    (base classes and every variant). Template-literal interpolations and
+    values under cva defaultVariants/compoundVariants are left out.
+    """
+    line_starts = [0] + [m.end() for m in re.finditer(r"\n", source)]
+
+    def line_of(offset):
+        return bisect.bisect_right(line_starts, offset)
+
+    bundles: List[ClassBundle] = []
+    consumed_until = -1
+    for match in _HELPER_RE.finditer(source):
+        if match.start() < consumed_until:
+            continue
+        end = _matching(source, match.end() - 1, "(", ")")
+        consumed_until = end
+        bundles.extend(_call_bundles(source, match.start(), end, line_of))
+    for match in _CLASSNAME_RE.finditer(source):
+        literal = _STRING_RE.match(source, match.end())
+        classes = split_classes(_literal_text(literal.group())) if literal else []
+        if classes:
+            bundles.append(ClassBundle(line_of(match.start()), " ".join(classes)))
+    bundles.sort(key=lambda b: b.line)
+    return bundles
+
+
+def utility_of(token: str) -> str:
+    """`md:hover:!-mt-4/50` -> `mt-4`: the utility without variants or modifiers"""
+    depth, cut = 0, 0
+    for i, ch in enumerate(token):
+        if ch == "[":
+            depth += 1
+        elif ch == "]":
+            depth -= 1
+        elif ch == ":" and depth == 0:
+            cut = i + 1
+    utility = token[cut:].lstrip("!").lstrip("-")
+    slash = utility.rfind("/")
+    if slash > 0 and "[" not in utility[slash:]:
+        utility = utility[:slash]
+    return utility
+
+
+def _kebab(name: str) -> str:
+    return re.sub(r"(?<=[a-z0-9])([A-Z])", r"-\1", name).lower()
+
+
+def extract_palettes(source: str) -> Dict[str, List[str]]:
+    """Shade scales declared in a token module: {"ecommerce-primary": ["50", ...]}
+
+    A palette is an object literal whose keys are all shade keys (50..950,
+    DEFAULT) holding literal colors; its name is the kebab-cased key path below the exported const,
+    the part of a Tailwind color class after the utility prefix.
+    """
+    text = _COMMENT_RE.sub(lambda m: m.group(1) or " ", source)
+    palettes: Dict[str, List[str]] = {}
+    stack: List[Tuple[str, List[str], bool]] = []  # (key, leaf keys, has child objects)
+    for match in _TOKEN_TREE_RE.finditer(text):
+        const, _, key, key_opens, color, opens, closes = match.groups()
+        if const:
+            stack.append((const, [], False))
+        elif key is not None:
+            if key_opens:
+                if stack:
+                    stack[-1] = (stack[-1][0], stack[-1][1], True)
+                stack.append((key, [], False))
+            elif stack:
+                # A non-color leaf disqualifies the object as a palette
+                stack[-1][1].append(key if color else "")
+        elif opens:
+            stack.append(("", [], True))
+        elif closes and stack:
+            name, leaves, nested = stack.pop()
+            path = [entry[0] for entry in stack[1:]] + [name]
+            if (not nested and len(leaves) >= 3 and all(SHADE_KEY_RE.match(k) for k in leaves)
+                    and all(path)):
+                palettes["-".join(_kebab(p) for p in path)] = leaves
+    return palettes
+
+
+class ClassIndex:
+    """Inverted class -> files index plus per-file class counts
+
+    update() swaps one file's contribution in place, so watch mode and
+    partial rescans touch only the files that changed.
+    """
+
+    def __init__(self):
+        self.files: Dict[str, Counter] = {}
+        self.bundles: Dict[str, List[ClassBundle]] = {}
+        self.index: Dict[str, Set[str]] = defaultdict(set)
+
+    def __len__(self):
+        return len(self.index)
+
+    def remove(self, path: str) -> None:
+        counts = self.files.pop(path, None)
+        self.bundles.pop(path, None)
+        for token in counts or ():
+            holders = self.index[token]
+            holders.discard(path)
+            if not holders:
+                del self.index[token]
+
+    def update(self, path: str, bundles: Iterable[ClassBundle]) -> None:
+        self.remove(path)
+        bundles = list(bundles)
+        if not bundles:
+            return
+        counts = Counter(token for bundle in bundles for token in bundle.classes.split())
+        self.files[path] = counts
+        self.bundles[path] = bundles
+        for token in counts:
+            self.index[token].add(path)
+
+    def utilities(self) -> Set[str]:
+        return {utility_of(token) for token in self.index}
+
+    def unused_shades(self, palettes: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """Palette -> shades no class references (as `<utility>-<palette>-<shade>`)"""
+        suffixes = set()
+        for utility in self.utilities():
+            parts = utility.split("-")
+            for i in range(1, len(parts)):
+                suffixes.add("-".join(parts[i:]))
+        unused = {}
+        for name, shades in palettes.items():
+            missing = [shade for shade in shades
+                       if (name if shade == "DEFAULT" else f"{name}-{shade}") not in suffixes]
+            if missing:
+                unused[name] = missing
+        return unused
+
+    def near_duplicates(self, threshold: float = NEAR_DUPLICATE_THRESHOLD,
+                        min_classes: int = BUNDLE_MIN_CLASSES) -> List[BundleCluster]:
+        """Clusters of identical or similar (Jaccard >= threshold) class sets
+
+        Candidate pairs come from prefix filtering: with every set ordered
+        rarest class first, two sets that reach the threshold must share a
+        class within the first len - ceil(threshold * len) + 1 of either, so
+        only sets sharing an indexed prefix class are compared.
+
+        Similar pairs are then clustered greedily, best pair first, like
+        near_duplicates.cluster_similar: a set joins a cluster only when it is
+        within threshold of the cluster's leader, so chains (A~B, B~C, A≁C)
+        do not merge into one cluster with little or nothing in common.
+        """
+        occurrences: Dict[frozenset, List[Tuple[str, int]]] = defaultdict(list)
+        for path in sorted(self.bundles):
+            for bundle in self.bundles[path]:
+                classes = frozenset(bundle.classes.split())
+                if len(classes) >= min_classes:
+                    occurrences[classes].append((path, bundle.line))
+        sets = sorted(occurrences, key=lambda s: (len(s), sorted(s)))
+        frequency = Counter(token for s in sets for token in s)
+
+        def jaccard(a, b):
+            return len(a & b) / len(a | b)
+
+        pairs = []
+        prefixes: Dict[str, List[int]] = defaultdict(list)
+        for i, classes in enumerate(sets):
+            ordered = sorted(classes, key=lambda t: (frequency[t], t))
+            size = len(ordered)
+            candidates = set()
+            for token in ordered[:size - math.ceil(threshold * size) + 1]:
+                candidates.update(prefixes[token])
+                prefixes[token].append(i)
+            for j in candidates:
+                other = sets[j]
+                # sets are visited by size, so other is never the larger one
+                if len(other) < threshold * size:
+                    continue
+                score = jaccard(classes, other)
+                if score >= threshold:
+                    pairs.append((score, j, i))
+
+        leader_of: Dict[int, int] = {}
+        groups: Dict[int, List[int]] = {}
+        for _, left, right in sorted(pairs, key=lambda p: (-p[0], p[1], p[2])):
+            if left in leader_of and right in leader_of:
+                continue
+            if left not in leader_of and right not in leader_of:
+                leader_of[left] = leader_of[right] = left
+                groups[left] = [left, right]
+                continue
+            joined, newcomer = (left, right) if left in leader_of else (right, left)
+            leader = leader_of[joined]
+            if jaccard(sets[leader], sets[newcomer]) >= threshold:
+                leader_of[newcomer] = leader
+                groups[leader].append(newcomer)
+        for i in range(len(sets)):
+            if i not in leader_of:
+                groups[i] = [i]
+
+        clusters = []
+        for members in groups.values():
+            where = sorted(o for i in members for o in occurrences[sets[i]])
+            files = len({path for path, _ in where})
+            if len(where) < BUNDLE_MIN_OCCURRENCES or files < BUNDLE_MIN_FILES:
+                continue
+            shared = frozenset.intersection(*(sets[i] for i in members))
+            if not shared:
+                continue
+            clusters.append(BundleCluster(sorted(shared), len(members), where, files))
+        clusters.sort(key=lambda c: (-len(c.occurrences), c.occurrences[0]))
+        return clusters
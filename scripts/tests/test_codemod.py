@@ -0,0 +1,50 @@
+import os
+import stat
+
+import pytest
+
+import codemod
+from codemod import atomic_write
+
+
+def test_atomic_write_replaces_content_and_keeps_mode(tmp_path):
+    path = tmp_path / "a.ts"
+    path.write_bytes(b"old")
+    os.chmod(path, 0o640)
+    atomic_write(str(path), b"new")
+    assert path.read_bytes() == b"new"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+    assert os.listdir(tmp_path) == ["a.ts"]
+
+
+def test_atomic_write_refuses_a_file_changed_since_it_was_read(tmp_path):
+    path = tmp_path / "a.ts"
+    path.write_bytes(b"old")
+    st = os.stat(path)
+    path.write_bytes(b"edited")
+    with pytest.raises(OSError, match="changed"):
+        atomic_write(str(path), b"new", (st.st_size, st.st_mtime_ns))
+    assert path.read_bytes() == b"edited"
+    assert os.listdir(tmp_path) == ["a.ts"]
+
+
+def test_atomic_write_accepts_the_expected_stat(tmp_path):
+    path = tmp_path / "a.ts"
+    path.write_bytes(b"old")
+    st = os.stat(path)
+    atomic_write(str(path), b"new", (st.st_size, st.st_mtime_ns))
+    assert path.read_bytes() == b"new"
+
+
+def test_atomic_write_removes_the_temp_file_when_replace_fails(tmp_path, monkeypatch):
+    path = tmp_path / "a.ts"
+    path.write_bytes(b"old")
+
+    def fail(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(codemod.os, "replace", fail)
+    with pytest.raises(OSError, match="disk full"):
+        atomic_write(str(path), b"new")
+    assert path.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == ["a.ts"]
@@ -0,0 +1,157 @@
+import hashlib
+import shutil
+import struct
+import subprocess
+
+import pytest
+
+from git_index import (ENTRY_HEADER, EXTENDED_FLAG, INTENT_TO_ADD, SKIP_WORKTREE, GitIndexError,
+                       _varint, find_git_dir, read_index)
+
+SHA = bytes(range(20))
+
+
+def encode_varint(value):
+    """git's offset varint, the inverse of _varint"""
+    out = [value & 0x7F]
+    value >>= 7
+    while value:
+        value -= 1
+        out.append(0x80 | (value & 0x7F))
+        value >>= 7
+    return bytes(reversed(out))
+
+
+def entry(version, path, previous=b"", mode=0o100644, size=5, mtime=(1700000000, 42),
+          stage=0, extended=0):
+    flags = min(len(path), 0xFFF) | stage << 12 | (EXTENDED_FLAG if extended else 0)
+    data = ENTRY_HEADER.pack(0, 0, mtime[0], mtime[1], 0, 0, mode, 0, 0, size, SHA, flags)
+    if extended:
+        data += struct.pack(">H", extended)
+    if version == 4:
+        common = 0
+        while common < min(len(path), len(previous)) and path[common] == previous[common]:
+            common += 1
+        return data + encode_varint(len(previous) - common) + path[common:] + b"\0"
+    data += path
+    return data + b"\0" * (8 - len(data) % 8)
+
+
+def index_bytes(version, paths, extensions=b"", **fields):
+    body = b"DIRC" + struct.pack(">II", version, len(paths))
+    previous = b""
+    for path in paths:
+        body += entry(version, path, previous, **fields)
+        previous = path
+    body += extensions
+    return body + hashlib.sha1(body).digest()
+
+
+def write_index(tmp_path, data):
+    (tmp_path / "index").write_bytes(data)
+    return tmp_path
+
+
+@pytest.mark.parametrize("value", [0, 1, 127, 128, 300, 16511, 16512, 1 << 20])
+def test_varint_round_trip(value):
+    encoded = encode_varint(value)
+    assert _varint(encoded + b"rest", 0) == (value, len(encoded))
+
+
+@pytest.mark.parametrize("version", [2, 3, 4])
+def test_read_index_versions(tmp_path, version):
+    paths = [b"src/app/page.tsx", b"src/app/layout.tsx", b"src/lib/utils.ts", b"z.md"]
+    index = read_index(write_index(tmp_path, index_bytes(version, paths)))
+    assert index.version == version
+    assert [e.path for e in index.entries] == [p.decode() for p in paths]
+    first = index.entries[0]
+    assert (first.size, first.mtime_ns, first.sha) == (5, 1700000000 * 10**9 + 42, SHA.hex())
+    assert first.is_regular and first.stage == 0
+    assert not (first.intent_to_add or first.skip_worktree)
+
+
+def test_read_index_v3_extended_flags(tmp_path):
+    data = index_bytes(3, [b"a.ts", b"b.ts"], extended=INTENT_TO_ADD | SKIP_WORKTREE)
+    entries = read_index(write_index(tmp_path, data)).entries
+    assert [e.path for e in entries] == ["a.ts", "b.ts"]
+    assert all(e.intent_to_add and e.skip_worktree for e in entries)
+
+
+def test_read_index_v2_rejects_extended_flags(tmp_path):
+    data = index_bytes(2, [b"a.ts"], extended=INTENT_TO_ADD)
+    with pytest.raises(GitIndexError, match="extended"):
+        read_index(write_index(tmp_path, data))
+
+
+def test_read_index_keeps_stages_and_skips_known_extensions(tmp_path):
+    tree = b"TREE" + struct.pack(">I", 3) + b"abc"
+    data = index_bytes(2, [b"conflict.ts"], extensions=tree, stage=2)
+    entries = read_index(write_index(tmp_path, data)).entries
+    assert [(e.path, e.stage) for e in entries] == [("conflict.ts", 2)]
+
+
+@pytest.mark.parametrize("signature", [b"link", b"sdir"])
+def test_read_index_rejects_split_and_sparse(tmp_path, signature):
+    data = index_bytes(2, [b"a.ts"], extensions=signature + struct.pack(">I", 0))
+    with pytest.raises(GitIndexError, match="not supported"):
+        read_index(write_index(tmp_path, data))
+
+
+def test_read_index_rejects_sparse_directory_entries(tmp_path):
+    data = index_bytes(3, [b"src/"], mode=0o040000)
+    with pytest.raises(GitIndexError, match="sparse"):
+        read_index(write_index(tmp_path, data))
+
+
+def test_read_index_rejects_corrupt_files(tmp_path):
+    data = bytearray(index_bytes(2, [b"a.ts"]))
+    data[-1] ^= 0xFF
+    with pytest.raises(GitIndexError, match="checksum"):
+        read_index(write_index(tmp_path, bytes(data)))
+    body = b"DIRC" + struct.pack(">II", 5, 0)
+    with pytest.raises(GitIndexError, match="version 5"):
+        read_index(write_index(tmp_path, body + hashlib.sha1(body).digest()))
+    with pytest.raises(GitIndexError, match="not a git index"):
+        read_index(write_index(tmp_path, b"nope"))
+
+
+def test_read_index_rejects_sha256_repos(tmp_path):
+    (tmp_path / "config").write_text("[extensions]\n\tobjectformat = sha256\n")
+    with pytest.raises(GitIndexError, match="sha256"):
+        read_index(write_index(tmp_path, index_bytes(2, [b"a.ts"])))
+
+
+def test_find_git_dir_follows_gitdir_file(tmp_path):
+    (tmp_path / "repo.git").mkdir()
+    worktree = tmp_path / "wt"
+    worktree.mkdir()
+    (worktree / ".git").write_text("gitdir: ../repo.git\n")
+    assert find_git_dir(worktree) == (tmp_path / "repo.git").resolve()
+    assert find_git_dir(tmp_path) is None
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+@pytest.mark.parametrize("version", [2, 3, 4])
+def test_read_index_matches_git(tmp_path, version):
+    def git(*args):
+        return subprocess.run(["git", "-C", str(tmp_path), *args], check=True,
+                              capture_output=True, text=True).stdout
+
+    git("init", "-q")
+    for name in ("src/app/page.tsx", "src/app/layout.tsx", "src/components/Button.tsx", "a.md"):
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name)
+    git("add", ".")
+    if version == 3:
+        # git writes version 2 unless some entry needs the extended flags
+        (tmp_path / "new.ts").write_text("")
+        git("add", "--intent-to-add", "new.ts")
+    git("update-index", "--index-version", str(version))
+    expected = [(line.split()[1], line.split("\t")[1])
+                for line in git("ls-files", "--stage").splitlines()]
+    index = read_index(find_git_dir(tmp_path))
+    assert index.version == version
+    assert [(e.sha, e.path) for e in index.entries] == expected
+    assert {e.path for e in index.entries if e.intent_to_add} == (
+        {"new.ts"} if version == 3 else set())
@@ -0,0 +1,114 @@
+import json
+import os
+
+import pytest
+
+from import_graph import ModuleResolver, PathAliases, parse_jsonc
+
+ROOT = os.path.abspath(os.sep + "repo")
+
+
+def p(rel):
+    return os.path.join(ROOT, *rel.split("/"))
+
+
+FILES = {p(rel) for rel in (
+    "src/lib/utils.ts",
+    "src/lib/format.tsx",
+    "src/components/ui/button.tsx",
+    "src/components/ui/index.ts",
+    "src/design-system/tokens.ts",
+    "src/app/page.tsx",
+    "src/types/env.d.ts",
+    "vendor/shim.js",
+    "data/site.json",
+)}
+
+TSCONFIG = """{
+  // comments and trailing commas are allowed
+  "compilerOptions": {
+    "baseUrl": ".",
+    "paths": {
+      "@/*": ["./src/*"],
+      "@/ui/*": ["./src/components/ui/*"],
+      "@tokens": ["./src/design-system/tokens"],
+      "~/*": ["./missing/*", "./vendor/*"],
+    },
+  },
+}"""
+
+
+@pytest.fixture
+def resolver():
+    aliases = PathAliases.from_config(ROOT, parse_jsonc(TSCONFIG))
+    return ModuleResolver(ROOT, FILES, aliases=aliases, packages={"react", "@radix-ui/react-slot"})
+
+
+IMPORTER = p("src/app/page.tsx")
+
+
+@pytest.mark.parametrize("specifier, expected", [
+    # wildcard alias, extension probing
+    ("@/lib/utils", "src/lib/utils.ts"),
+    ("@/lib/format", "src/lib/format.tsx"),
+    # the longest matching prefix wins
+    ("@/ui/button", "src/components/ui/button.tsx"),
+    # directory import of an index file
+    ("@/components/ui", "src/components/ui/index.ts"),
+    # exact alias
+    ("@tokens", "src/design-system/tokens.ts"),
+    # later targets are tried when earlier ones do not exist
+    ("~/shim", "vendor/shim.js"),
+    # relative, root-absolute, declaration and explicit .js -> .ts
+    ("../lib/utils", "src/lib/utils.ts"),
+    ("../lib/utils.js", "src/lib/utils.ts"),
+    ("/data/site.json", "data/site.json"),
+    ("@/types/env", "src/types/env.d.ts"),
+    ("../lib/utils?raw", "src/lib/utils.ts"),
+])
+def test_resolves_local_modules(resolver, specifier, expected):
+    assert resolver.resolve(IMPORTER, specifier) == (p(expected), None)
+
+
+@pytest.mark.parametrize("specifier, expected", [
+    ("react", (None, None)),
+    ("@radix-ui/react-slot/dist", (None, None)),
+    ("node:fs", (None, None)),
+    ("path", (None, None)),
+    ("lodash", (None, "unlisted-package")),
+    # an alias that matches but reaches no file is a missing module, not a package
+    ("@/lib/missing", (None, "missing-module")),
+    ("~/nothing", (None, "missing-module")),
+    ("./missing", (None, "missing-module")),
+])
+def test_packages_and_failures(resolver, specifier, expected):
+    assert resolver.resolve(IMPORTER, specifier) == expected
+
+
+def test_relative_results_depend_on_the_importer(resolver):
+    assert resolver.resolve(p("src/lib/format.tsx"), "./utils") == (p("src/lib/utils.ts"), None)
+    assert resolver.resolve(IMPORTER, "./utils") == (None, "missing-module")
+
+
+def test_base_url_applies_to_alias_targets():
+    config = {"compilerOptions": {"baseUrl": "src", "paths": {"@/*": ["*"]}}}
+    resolver = ModuleResolver(ROOT, FILES, aliases=PathAliases.from_config(ROOT, config),
+                              packages=set())
+    assert resolver.resolve(IMPORTER, "@/lib/utils") == (p("src/lib/utils.ts"), None)
+
+
+def test_specifier_for_prefers_the_alias_in_use():
+    aliases = PathAliases.from_config(ROOT, parse_jsonc(TSCONFIG))
+    button = p("src/components/ui/button")
+    assert aliases.specifier_for(button, prefer="@/ui/card") == "@/ui/button"
+    assert aliases.specifier_for(button, prefer="@/lib/x") == "@/components/ui/button"
+
+
+def test_resolver_reads_tsconfig_and_package_json(tmp_path):
+    (tmp_path / "tsconfig.json").write_text(TSCONFIG)
+    (tmp_path / "package.json").write_text(json.dumps({"devDependencies": {"vitest": "1"}}))
+    utils = tmp_path / "src" / "lib" / "utils.ts"
+    resolver = ModuleResolver(tmp_path, {str(utils)})
+    importer = str(tmp_path / "src" / "app" / "page.tsx")
+    assert resolver.resolve(importer, "@/lib/utils") == (str(utils), None)
+    assert resolver.resolve(importer, "vitest") == (None, None)
@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from move_plan import ImportIndex, MovePlanError, apply_plan
+from repo_walker import DEFAULT_EXCLUDES, IgnoreMatcher
+
+FILES = {
+    "src/Button.tsx": "export const Button = () => null\n",
+    "src/pages/Home.tsx": "import { Button } from '../Button'\nexport default Button\n",
+    "src/pages/About.tsx": "import { Button } from '../Button'\nexport default Button\n",
+}
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for rel, text in FILES.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return tmp_path
+
+
+def build(tree):
+    return ImportIndex.build(tree / "src", IgnoreMatcher(tree, DEFAULT_EXCLUDES))
+
+
+def snapshot(tree):
+    return {path.relative_to(tree).as_posix(): path.read_text()
+            for path in tree.rglob("*") if path.is_file()}
+
+
+def test_apply_plan_moves_and_rewrites_importers(tree):
+    index = build(tree)
+    plan = index.plan([(tree / "src/Button.tsx", tree / "src/atoms/Button.tsx")])
+    assert {os.path.relpath(path, tree): mapping for path, mapping in plan.rewrites.items()} == {
+        "src/pages/About.tsx": {"../Button": "../atoms/Button"},
+        "src/pages/Home.tsx": {"../Button": "../atoms/Button"},
+    }
+    apply_plan(plan, index)
+    files = snapshot(tree)
+    assert "src/Button.tsx" not in files
+    assert files["src/atoms/Button.tsx"] == FILES["src/Button.tsx"]
+    assert files["src/pages/Home.tsx"].startswith("import { Button } from '../atoms/Button'")
+
+
+def test_apply_plan_rolls_back_everything_on_failure(tree):
+    index = build(tree)
+    plan = index.plan([(tree / "src/Button.tsx", tree / "src/atoms/Button.tsx")])
+    # Home is rewritten after About; changing it since the index was built
+    # makes its write fail once the move and the About rewrite are done
+    home = tree / "src/pages/Home.tsx"
+    home.write_text(FILES["src/pages/Home.tsx"] + "// edited\n")
+    before = snapshot(tree)
+    with pytest.raises(OSError, match="changed"):
+        apply_plan(plan, index)
+    assert snapshot(tree) == before
+    assert not (tree / "src/atoms").exists()
+
+
+def test_apply_plan_checks_moves_before_changing_anything(tree):
+    index = build(tree)
+    (tree / "src/atoms").mkdir()
+    (tree / "src/atoms/Button.tsx").write_text("taken\n")
+    plan = index.plan([(tree / "src/Button.tsx", tree / "src/atoms/Button.tsx")])
+    before = snapshot(tree)
+    with pytest.raises(MovePlanError, match="already exists"):
+        apply_plan(plan, index)
+    assert snapshot(tree) == before
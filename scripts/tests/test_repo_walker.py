@@ -0,0 +1,107 @@
+import os
+
+import pytest
+
+from repo_walker import IgnoreMatcher, glob_regex, scan
+
+GITIGNORE = """
+# comment
+*.log
+!keep.log
+/build
+dist/
+docs/*.txt
+**/cache
+logs/**/*.tmp
+\\!bang
+\\#hash
+trailing\x20\x20
+*.bak
+!important/
+"""
+
+
+@pytest.fixture
+def matcher(tmp_path):
+    return IgnoreMatcher(tmp_path, GITIGNORE.splitlines())
+
+
+# Expectations agree with `git check-ignore --no-index` for the same file
+@pytest.mark.parametrize("path, is_dir, ignored", [
+    ("a.log", False, True),
+    ("sub/a.log", False, True),
+    # last match wins: the negation re-includes at any depth
+    ("keep.log", False, False),
+    ("sub/keep.log", False, False),
+    # a leading '/' anchors at the root
+    ("build", True, True),
+    ("build", False, True),
+    ("src/build", True, False),
+    # a trailing '/' only matches directories
+    ("dist", True, True),
+    ("dist", False, False),
+    ("src/dist", True, True),
+    # a middle '/' anchors too, and '*' stays within one segment
+    ("docs/a.txt", False, True),
+    ("docs/sub/a.txt", False, False),
+    ("src/docs/a.txt", False, False),
+    ("cache", True, True),
+    ("a/b/cache", True, True),
+    ("logs/x.tmp", False, True),
+    ("logs/a/b/x.tmp", False, True),
+    ("other/x.tmp", False, False),
+    # escaped '!' and '#' are literal names; unescaped trailing spaces are dropped
+    ("!bang", False, True),
+    ("#hash", False, True),
+    ("trailing", False, True),
+    # a directory-only negation never applies to files
+    ("important", True, False),
+    ("important.bak", False, True),
+    ("readme.md", False, False),
+])
+def test_match_follows_gitignore(matcher, path, is_dir, ignored):
+    assert matcher.match(path, is_dir) is ignored
+
+
+def test_later_rule_overrides_earlier_negation(tmp_path):
+    matcher = IgnoreMatcher(tmp_path, ["*.log", "!keep.log", "keep.log"])
+    assert matcher.match("keep.log")
+
+
+def test_negated_file_rule_does_not_reinclude_directories(tmp_path):
+    matcher = IgnoreMatcher(tmp_path, ["out/", "!out"])
+    assert not matcher.match("out", is_dir=True)
+    matcher = IgnoreMatcher(tmp_path, ["out", "!out/"])
+    assert matcher.match("out", is_dir=False)
+    assert not matcher.match("out", is_dir=True)
+
+
+def test_no_rules_ignore_nothing(tmp_path):
+    matcher = IgnoreMatcher(tmp_path, ["", "# only a comment", "/"])
+    assert matcher.rules == []
+    assert not matcher.match("anything")
+
+
+@pytest.mark.parametrize("pattern, regex, dir_only", [
+    ("*.tsx", r"(?:^|.*/)[^/]*\.tsx$", False),
+    ("src/*.tsx", r"^src/[^/]*\.tsx$", False),
+    ("/tmp/", r"^tmp$", True),
+    ("a/**/b", r"^a/(?:.*/)?b$", False),
+])
+def test_glob_regex(pattern, regex, dir_only):
+    assert glob_regex(pattern) == (regex, dir_only)
+
+
+def test_scan_prunes_ignored_dirs_and_records_them(tmp_path):
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "index.js").write_text("")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.ts").write_text("")
+    (tmp_path / "src" / "debug.log").write_text("")
+    matcher = IgnoreMatcher(tmp_path, ["node_modules/", "*.log"])
+    ignored = set()
+    listed = {os.path.relpath(root, tmp_path): (sorted(d.name for d in dirs),
+                                                sorted(f.name for f in files))
+              for root, dirs, files in scan(tmp_path, matcher, ignored)}
+    assert listed == {".": (["src"], []), "src": ([], ["app.ts"])}
+    assert ignored == {str(tmp_path), str(tmp_path / "src")}